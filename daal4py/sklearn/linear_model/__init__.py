@@ -14,12 +14,23 @@
 # limitations under the License.
 # ==============================================================================
 
-from .coordinate_descent import ElasticNet, Lasso
+from .coordinate_descent import (
+    ElasticNet,
+    ElasticNetCV,
+    Lasso,
+    LassoCV,
+    enet_path,
+    lasso_path,
+)
 from .logistic_path import LogisticRegression, logistic_regression_path
 
 __all__ = [
     "LogisticRegression",
     "logistic_regression_path",
     "ElasticNet",
+    "ElasticNetCV",
     "Lasso",
+    "LassoCV",
+    "enet_path",
+    "lasso_path",
 ]
@@ -56,9 +56,13 @@ import numpy as np
 from scipy import sparse as sp
 from sklearn.exceptions import ConvergenceWarning
 from sklearn.linear_model._coordinate_descent import ElasticNet as ElasticNet_original
+from sklearn.linear_model._coordinate_descent import ElasticNetCV as ElasticNetCV_original
 from sklearn.linear_model._coordinate_descent import Lasso as Lasso_original
+from sklearn.linear_model._coordinate_descent import LassoCV as LassoCV_original
+from sklearn.linear_model._coordinate_descent import enet_path as enet_path_original
+from sklearn.linear_model._coordinate_descent import lasso_path as lasso_path_original
 from sklearn.preprocessing import normalize
-from sklearn.utils import check_array, check_X_y
+from sklearn.utils import check_array, check_random_state, check_X_y
 
 import daal4py
 from daal4py.sklearn._utils import (
@@ -66,7 +70,9 @@ from daal4py.sklearn._utils import (
     check_is_array_api,
     get_patch_message,
     getFPType,
+    is_sparse,
     make2d,
+    sklearn_check_version,
 )
 
 from .._n_jobs_support import control_n_jobs
@@ -416,7 +422,10 @@ def _fit(self, _X, _y, sample_weight=None, check_input=True):
     _patching_status = PatchingConditionsChain(_function_name)
     _dal_ready = _patching_status.and_conditions(
         [
-            (not sp.issparse(X), "X is sparse. Sparse input is not supported."),
+            (
+                not sp.issparse(X),
+                "X is sparse. Sparse input is supported through enet_path.",
+            ),
             (
                 self.fit_shape_good_for_daal_,
                 "The shape of X does not satisfy oneDAL requirements: "
@@ -427,7 +436,10 @@ def _fit(self, _X, _y, sample_weight=None, check_input=True):
                 f"'{X.dtype}' X data type is not supported. "
                 "Only np.float32 and np.float64 are supported.",
             ),
-            (sample_weight is None, "Sample weights are not supported."),
+            (
+                sample_weight is None,
+                "Sample weights are supported through enet_path.",
+            ),
             (
                 not check_is_array_api(X) and not check_is_array_api(y),
                 "Array API inputs are not supported.",
@@ -536,12 +548,334 @@ def _dual_gap(self):
     return self._gap
 
 
+# scikit-learn 1.9 deprecated 'n_alphas' in favor of an integer 'alphas'
+if sklearn_check_version("1.9"):
+    _n_alphas_default, _alphas_default = "deprecated", "warn"
+else:
+    _n_alphas_default, _alphas_default = 100, None
+
+
+# Sparse X is solved on its dense Gram matrix, which takes the square of the
+# features in memory and their cube in the eigendecomposition of _gram_factor.
+# It is only used when it holds no more values than X and has few features.
+_MAX_SPARSE_GRAM_FEATURES = 2048
+
+
+def _path_gram(X, y, precompute, Xy, X_sparse_scaling, sample_weight):
+    # Sparse X is centered implicitly by 'X_sparse_scaling' and weighted by
+    # 'sample_weight', like in the sparse solver of scikit-learn. Dense X is
+    # already centered and rescaled by the caller.
+    if sp.issparse(X):
+        if sample_weight is None:
+            sample_weight = np.ones(X.shape[0], dtype=X.dtype)
+        sample_weight = np.asarray(sample_weight)
+        Xw = X.multiply(sample_weight[:, np.newaxis]).tocsc()
+        gram = (X.T @ Xw).toarray().astype(np.float64)
+        Xy = np.asarray(Xw.T @ y, dtype=np.float64).ravel()
+        yty = float(sample_weight @ (y * y))
+        if X_sparse_scaling is not None:
+            Xw_sum = np.asarray(Xw.sum(axis=0), dtype=np.float64).ravel()
+            cross = np.outer(Xw_sum, X_sparse_scaling)
+            gram += np.sum(sample_weight) * np.outer(X_sparse_scaling, X_sparse_scaling)
+            gram -= cross + cross.T
+            Xy -= X_sparse_scaling * float(sample_weight @ y)
+        return gram, Xy, yty
+
+    if not isinstance(precompute, np.ndarray):
+        precompute = X.T @ X
+    if Xy is None:
+        Xy = X.T @ y
+    gram = np.asarray(precompute, dtype=np.float64)
+    return gram, np.asarray(Xy, dtype=np.float64).ravel(), float(y @ y)
+
+
+def _gram_factor(gram, Xy):
+    # R and z with R^T R = gram and R^T z = Xy, so that the least squares
+    # term of the path is ||z - Rw||^2 up to a constant, with as many rows
+    # as there are features
+    s, V = np.linalg.eigh(gram)
+    s_cutoff = max(s[-1], 0.0) * s.shape[0] * np.finfo(s.dtype).eps
+    keep = s > s_cutoff
+    root = np.sqrt(s[keep])
+    R = np.zeros_like(gram)
+    z = np.zeros((gram.shape[0], 1), dtype=gram.dtype)
+    R[: root.shape[0]] = root[:, np.newaxis] * V[:, keep].T
+    z[: root.shape[0], 0] = (V[:, keep].T @ Xy) / root
+    return R, z
+
+
+def _path_dual_gap(coef, gram, Xy, yty, l1_reg, l2_reg, positive):
+    # duality gap of the coordinate descent objective of scikit-learn,
+    # computed from the cross products instead of the residuals
+    gram_coef = gram @ coef
+    R_norm2 = yty - 2.0 * (coef @ Xy) + coef @ gram_coef
+    R_y = yty - coef @ Xy
+    XtA = Xy - gram_coef - l2_reg * coef
+    dual_norm_XtA = np.max(XtA) if positive else np.max(np.abs(XtA))
+    if dual_norm_XtA > l1_reg:
+        const = l1_reg / dual_norm_XtA
+        gap = 0.5 * R_norm2 * (1.0 + const**2)
+    else:
+        const = 1.0
+        gap = R_norm2
+    gap += l1_reg * np.sum(np.abs(coef)) - const * R_y
+    gap += 0.5 * l2_reg * (1.0 + const**2) * (coef @ coef)
+    return gap
+
+
+def _daal4py_enet_path(
+    function_name,
+    X,
+    y,
+    l1_ratio,
+    alphas,
+    precompute,
+    Xy,
+    coef_init,
+    positive,
+    check_input,
+    params,
+):
+    is_array_api = check_is_array_api(X) or check_is_array_api(y)
+    if check_input and not is_array_api:
+        X = check_array(X, accept_sparse="csc", dtype=[np.float64, np.float32])
+        y = check_array(
+            y, accept_sparse="csc", dtype=X.dtype.type, copy=False, ensure_2d=False
+        )
+    has_alphas = alphas is not None and not isinstance(alphas, (str, numbers.Integral))
+    is_single_output = not is_sparse(y) and np.ndim(y) == 1
+    shape_good_for_daal = not is_array_api and X.shape[0] >= X.shape[1] > 0
+    gram_good_for_sparse = not sp.issparse(X) or (
+        X.shape[1] <= _MAX_SPARSE_GRAM_FEATURES and X.shape[1] ** 2 <= X.nnz
+    )
+
+    _function_name = f"sklearn.linear_model.{function_name}"
+    _patching_status = PatchingConditionsChain(_function_name)
+    _dal_ready = _patching_status.and_conditions(
+        [
+            (not is_array_api, "Array API inputs are not supported."),
+            (has_alphas, "The grid of alphas is computed by scikit-learn."),
+            (is_single_output, "Multi-output paths are not supported."),
+            (
+                shape_good_for_daal,
+                "The shape of X does not satisfy oneDAL requirements: "
+                "number of features > number of samples.",
+            ),
+            (
+                gram_good_for_sparse,
+                "Sparse X has more than "
+                f"{_MAX_SPARSE_GRAM_FEATURES} features or fewer stored values "
+                "than its Gram matrix.",
+            ),
+        ]
+    )
+    _patching_status.write_log()
+    if not _dal_ready:
+        return None
+
+    tol = params.get("tol", 1e-4)
+    max_iter = params.get("max_iter", 1000)
+    selection = params.get("selection", "cyclic")
+    if selection not in ["random", "cyclic"]:
+        raise ValueError("selection should be either random or cyclic.")
+    seed = params.get("random_state")
+    seed = 0 if seed is None else seed
+    if not isinstance(seed, numbers.Integral):
+        seed = check_random_state(seed).randint(np.iinfo(np.int32).max)
+
+    X_sparse_scaling = None
+    if sp.issparse(X) and params.get("X_offset") is not None:
+        X_sparse_scaling = params["X_offset"] / params["X_scale"]
+
+    if len(alphas) > 1:
+        alphas = np.sort(alphas)[::-1]
+    n_samples, n_features = X.shape
+    gram, Xy, yty = _path_gram(
+        X, y, precompute, Xy, X_sparse_scaling, params.get("sample_weight")
+    )
+    # the Gram matrix is factored once and every alpha is solved on the
+    # factor, which has as many rows as there are features, so the penalties
+    # are rescaled to the number of rows of the factor
+    R, z = _gram_factor(gram, Xy)
+    penalty_scale = n_samples / n_features
+
+    mse_alg = daal4py.optimization_solver_mse(
+        numberOfTerms=n_features, fptype="double", method="defaultDense"
+    )
+    mse_alg.setup(R, z, None)
+
+    coefs = np.empty((n_features, len(alphas)), dtype=X.dtype)
+    dual_gaps = np.empty(len(alphas))
+    n_iters = []
+    # the coefficients of each alpha are the warm start of the next one
+    beta = np.zeros((1, n_features + 1), dtype=np.float64)
+    if coef_init is not None:
+        beta[0, 1:] = np.ravel(coef_init)
+    for i, alpha in enumerate(alphas):
+        cd_solver = daal4py.optimization_solver_coordinate_descent(
+            function=mse_alg,
+            fptype="double",
+            method="defaultDense",
+            selection=selection,
+            seed=seed,
+            nIterations=max_iter,
+            positive=positive,
+            accuracyThreshold=tol,
+        )
+        cd_solver.setup(beta)
+        elastic_net_alg = daal4py.elastic_net_training(
+            fptype="double",
+            method="defaultDense",
+            interceptFlag=False,
+            dataUseInComputation="doNotUse",
+            penaltyL1=np.full((1, 1), alpha * l1_ratio * penalty_scale),
+            penaltyL2=np.full((1, 1), alpha * (1.0 - l1_ratio) * penalty_scale),
+            optimizationSolver=cd_solver,
+        )
+        try:
+            elastic_net_res = elastic_net_alg.compute(data=R, dependentVariables=z)
+        except RuntimeError:
+            logging.info(_function_name + ": " + get_patch_message("sklearn_after_daal"))
+            return None
+        beta = np.array(elastic_net_res.model.Beta, dtype=np.float64).reshape(1, -1)
+        beta[0, 0] = 0.0
+        coef = beta[0, 1:]
+
+        n_iter = cd_solver.__get_result__().nIterations[0][0]
+        # only for compliance with Sklearn
+        if max_iter == n_iter + 1:
+            warnings.warn(
+                "Objective did not converge. You might want to "
+                "increase the number of iterations.",
+                ConvergenceWarning,
+            )
+
+        coefs[:, i] = coef
+        # the dual gap is scaled like the one of scikit-learn, whose
+        # objective is n_samples times the documented one
+        l1_reg = alpha * l1_ratio * n_samples
+        l2_reg = alpha * (1.0 - l1_ratio) * n_samples
+        dual_gaps[i] = (
+            _path_dual_gap(coef, gram, Xy, yty, l1_reg, l2_reg, positive) / n_samples
+        )
+        n_iters.append(n_iter)
+
+    return alphas, coefs, dual_gaps, n_iters
+
+
+def enet_path(
+    X,
+    y,
+    *,
+    l1_ratio=0.5,
+    eps=1e-3,
+    n_alphas=_n_alphas_default,
+    alphas=_alphas_default,
+    precompute="auto",
+    Xy=None,
+    copy_X=True,
+    coef_init=None,
+    verbose=False,
+    return_n_iter=False,
+    positive=False,
+    check_input=True,
+    **params,
+):
+    res = _daal4py_enet_path(
+        "enet_path",
+        X,
+        y,
+        l1_ratio,
+        alphas,
+        precompute,
+        Xy,
+        coef_init,
+        positive,
+        check_input,
+        params,
+    )
+    if res is None:
+        return enet_path_original(
+            X,
+            y,
+            l1_ratio=l1_ratio,
+            eps=eps,
+            n_alphas=n_alphas,
+            alphas=alphas,
+            precompute=precompute,
+            Xy=Xy,
+            copy_X=copy_X,
+            coef_init=coef_init,
+            verbose=verbose,
+            return_n_iter=return_n_iter,
+            positive=positive,
+            check_input=check_input,
+            **params,
+        )
+    return res if return_n_iter else res[:3]
+
+
+def lasso_path(
+    X,
+    y,
+    *,
+    eps=1e-3,
+    n_alphas=_n_alphas_default,
+    alphas=_alphas_default,
+    precompute="auto",
+    Xy=None,
+    copy_X=True,
+    coef_init=None,
+    verbose=False,
+    return_n_iter=False,
+    positive=False,
+    **params,
+):
+    res = _daal4py_enet_path(
+        "lasso_path",
+        X,
+        y,
+        1.0,
+        alphas,
+        precompute,
+        Xy,
+        coef_init,
+        positive,
+        params.get("check_input", True),
+        params,
+    )
+    if res is None:
+        return lasso_path_original(
+            X,
+            y,
+            eps=eps,
+            n_alphas=n_alphas,
+            alphas=alphas,
+            precompute=precompute,
+            Xy=Xy,
+            copy_X=copy_X,
+            coef_init=coef_init,
+            verbose=verbose,
+            return_n_iter=return_n_iter,
+            positive=positive,
+            **params,
+        )
+    return res if return_n_iter else res[:3]
+
+
+enet_path.__doc__ = enet_path_original.__doc__
+lasso_path.__doc__ = lasso_path_original.__doc__
+
+
 @control_n_jobs(decorated_methods=["fit", "predict"])
 class ElasticNet(ElasticNet_original):
     __doc__ = ElasticNet_original.__doc__
 
     _parameter_constraints: dict = {**ElasticNet_original._parameter_constraints}
 
+    # weighted and sparse fits of scikit-learn are solved by the path
+    path = staticmethod(enet_path)
+
     def __init__(
         self,
         alpha=1.0,
@@ -617,6 +951,9 @@ class Lasso(Lasso_original):
 
     _parameter_constraints: dict = {**Lasso_original._parameter_constraints}
 
+    # weighted and sparse fits of scikit-learn are solved by the path
+    path = staticmethod(enet_path)
+
     def __init__(
         self,
         alpha=1.0,
@@ -680,3 +1017,37 @@ class Lasso(Lasso_original):
 
     fit.__doc__ = Lasso_original.fit.__doc__
     predict.__doc__ = Lasso_original.predict.__doc__
+
+
+@control_n_jobs(decorated_methods=["fit"])
+class ElasticNetCV(ElasticNetCV_original):
+    __doc__ = ElasticNetCV_original.__doc__
+
+    _parameter_constraints: dict = {**ElasticNetCV_original._parameter_constraints}
+
+    path = staticmethod(enet_path)
+
+    def _get_estimator(self):
+        return ElasticNet()
+
+    def fit(self, X, y, sample_weight=None, **params):
+        return super().fit(X, y, sample_weight=sample_weight, **params)
+
+    fit.__doc__ = ElasticNetCV_original.fit.__doc__
+
+
+@control_n_jobs(decorated_methods=["fit"])
+class LassoCV(LassoCV_original):
+    __doc__ = LassoCV_original.__doc__
+
+    _parameter_constraints: dict = {**LassoCV_original._parameter_constraints}
+
+    path = staticmethod(lasso_path)
+
+    def _get_estimator(self):
+        return Lasso()
+
+    def fit(self, X, y, sample_weight=None, **params):
+        return super().fit(X, y, sample_weight=sample_weight, **params)
+
+    fit.__doc__ = LassoCV_original.fit.__doc__
@@ -120,18 +120,36 @@ def _daal4py_loss_and_grad(beta, objF_instance, X, y, n):
     return (v, gr)
 
 
-# used by Newton CG method
-def _daal4py_loss_(beta, objF_instance, X, y, n, l2_unused):
+# used by LBFGS solver, with objectives without penalty so that they serve every
+# C of a path, and with one objective per distinct weight on weighted samples as
+# the objectives of oneDAL have no sample weights
+def _daal4py_weighted_loss_and_grad(beta, weighted_objectives, l2):
+    value, gr = 0.0, np.zeros_like(beta, dtype=np.float64)
+    for weight, (objF_instance, X, y, n) in weighted_objectives:
+        v, g = _daal4py_loss_and_grad(beta, objF_instance, X, y, n)
+        value += weight * v
+        gr += weight * g
+    # the penalty is added once, and not to the intercepts in the first column
+    coef = beta.reshape((-1, X.shape[1] + 1))[:, 1:]
+    value += l2 * np.sum(coef * coef)
+    gr.reshape((-1, X.shape[1] + 1))[:, 1:] += (2 * l2) * coef
+    return (value, gr)
+
+
+# used by Newton CG method, with the penalty added to objectives without it
+def _daal4py_loss_(beta, objF_instance, X, y, n, l2):
     beta_ = make2d(beta)
     if beta_.shape[1] != 1 and beta_.shape[0] == 1:
         beta_ = beta_.T
     res = objF_instance.compute(X, y, beta_)
     v = res.valueIdx[0, 0]
     v *= n
+    coef = beta.reshape((-1, X.shape[1] + 1))[:, 1:]
+    v += l2 * np.sum(coef * coef)
     return v
 
 
-def _daal4py_grad_(beta, objF_instance, X, y, n, l2_unused):
+def _daal4py_grad_(beta, objF_instance, X, y, n, l2):
     beta_ = make2d(beta)
     if beta_.shape[1] != 1 and beta_.shape[0] == 1:
         beta_ = beta_.T
@@ -141,16 +159,16 @@ def _daal4py_grad_(beta, objF_instance, X, y, n, l2_unused):
     # overwrites gradient at the starting point
     gr = res.gradientIdx.ravel()
     gr = gr * n  # force copy
+    coef = beta.reshape((-1, X.shape[1] + 1))[:, 1:]
+    gr.reshape((-1, X.shape[1] + 1))[:, 1:] += (2 * l2) * coef
     return gr
 
 
 def _daal4py_grad_hess_(beta, objF_instance, X, y, n, l2):
+    gr = _daal4py_grad_(beta, objF_instance, X, y, n, l2)
     beta_ = make2d(beta)
     if beta_.shape[1] != 1 and beta_.shape[0] == 1:
         beta_ = beta_.T
-    res = objF_instance.compute(X, y, beta_)
-    gr = res.gradientIdx.ravel()
-    gr = gr * n
 
     if isinstance(objF_instance, daal4py.optimization_solver_logistic_loss):
         # dealing with binary logistic regression
@@ -52,6 +52,7 @@ import os
 import numpy as np
 import scipy.optimize as optimize
 import sklearn.linear_model._logistic as logistic_module
+from joblib import cpu_count
 from sklearn.linear_model._logistic import (
     _LOGISTIC_SOLVER_CONVERGENCE_MSG,
 )
@@ -61,16 +62,20 @@ from sklearn.linear_model._logistic import (
 from sklearn.linear_model._logistic import (
     LogisticRegressionCV as LogisticRegressionCV_original,
 )
-from sklearn.linear_model._logistic import (
-    _check_solver,
-)
+from sklearn.linear_model._logistic import _check_solver
 from sklearn.utils import check_array, check_consistent_length, check_random_state
+from sklearn.utils.class_weight import compute_class_weight
 from sklearn.utils.optimize import _check_optimize_result, _newton_cg
-from sklearn.utils.validation import check_is_fitted
+from sklearn.utils.validation import _check_sample_weight, check_is_fitted
 
 import daal4py as d4p
 
-from .._n_jobs_support import control_n_jobs
+from .._n_jobs_support import (
+    control_n_jobs,
+    get_n_threads,
+    get_suggested_n_threads,
+    set_n_threads,
+)
 from .._utils import (
     PatchingConditionsChain,
     check_is_array_api,
@@ -85,7 +90,7 @@ from .logistic_loss import (
     _daal4py_grad_hess_,
     _daal4py_logistic_loss_extra_args,
     _daal4py_loss_,
-    _daal4py_loss_and_grad,
+    _daal4py_weighted_loss_and_grad,
 )
 
 if sklearn_check_version("1.7.1"):
@@ -104,9 +109,29 @@ else:
         return {k: v}
 
 
+from sklearn.linear_model._logistic import (
+    _log_reg_scoring_path as log_reg_scoring_path_original,
+)
 from sklearn.linear_model._logistic import _logistic_regression_path as lr_path_original
 from sklearn.preprocessing import LabelBinarizer, LabelEncoder
 
+# Weighted samples are fitted with one objective per distinct weight value,
+# which suits class weights and weights from a few levels. The objectives
+# share one copy of X with its rows grouped by weight.
+_MAX_WEIGHT_VALUES = 16
+
+
+def _combined_sample_weight(X, y, classes, sample_weight, class_weight):
+    # class weights are multiplied into the sample weights as in scikit-learn
+    sample_weight = _check_sample_weight(sample_weight, X, dtype=np.float64, copy=True)
+    if class_weight is not None:
+        le = LabelEncoder().fit(classes)
+        class_weight_ = compute_class_weight(
+            class_weight, classes=classes, y=y, sample_weight=sample_weight
+        )
+        sample_weight *= class_weight_[le.transform(y)]
+    return sample_weight
+
 
 # This code is a patch for sklearn 1.8, which is related to https://github.com/scikit-learn/scikit-learn/pull/32073
 # where the multi_class keyword is deprecated and this aspect is removed.
@@ -216,9 +241,6 @@ def logistic_regression_path_d4p(
             Y_multi = le.fit_transform(y).astype(X.dtype, copy=False)
             w0 = np.zeros((classes.size, n_features + 1), order="C", dtype=w0_dtype)
 
-    # Adoption of https://github.com/scikit-learn/scikit-learn/pull/26721
-    sw_sum = len(X)
-
     if coef is not None:
         if sklearn_check_version("1.8"):
             if is_binary:
@@ -305,52 +327,83 @@ def logistic_regression_path_d4p(
         # Note: scikit-learn does a theoretically incorrect procedure when using
         # multi_class='multinomial' with two classes. This converts the problem
         # into an equivalent problem for binary logistic regression.
-        if solver == "lbfgs":
-            if classes.size == 2:
-                C_daal_multiplier = 2
-                w0 *= 2
-                daal_extra_args_func = _daal4py_logistic_loss_extra_args
-            else:
-                daal_extra_args_func = _daal4py_cross_entropy_loss_extra_args
-            func = _daal4py_loss_and_grad
-
-        elif solver == "newton-cg":
-            if classes.size == 2:
-                C_daal_multiplier = 2
-                w0 *= 2
-                daal_extra_args_func = _daal4py_logistic_loss_extra_args
-            else:
-                daal_extra_args_func = _daal4py_cross_entropy_loss_extra_args
-            func = _daal4py_loss_
-            grad = _daal4py_grad_
-            hess = _daal4py_grad_hess_
+        if classes.size == 2:
+            C_daal_multiplier = 2
+            w0 *= 2
+            daal_extra_args_func = _daal4py_logistic_loss_extra_args
+        else:
+            daal_extra_args_func = _daal4py_cross_entropy_loss_extra_args
     else:
         target = y_bin
-        if solver == "lbfgs":
-            func = _daal4py_loss_and_grad
-            daal_extra_args_func = _daal4py_logistic_loss_extra_args
-        elif solver == "newton-cg":
-            daal_extra_args_func = _daal4py_logistic_loss_extra_args
-            func = _daal4py_loss_
-            grad = _daal4py_grad_
-            hess = _daal4py_grad_hess_
+        daal_extra_args_func = _daal4py_logistic_loss_extra_args
+
+    if sample_weight is None:
+        weighted_data = [(1.0, X, target)]
+    else:
+        # rows of every distinct weight, whose unweighted objectives are summed
+        # with their weight; rows without weight don't contribute
+        weight_values, weight_index = np.unique(sample_weight, return_inverse=True)
+        if weight_values.shape[0] == 1:
+            weighted_data = [(weight_values[0], X, target)]
+        else:
+            # a single copy of the weighted rows grouped by weight, whose
+            # groups are views, so that X is copied once for all the weights
+            rows = np.flatnonzero(sample_weight > 0)
+            rows = rows[np.argsort(weight_index[rows], kind="stable")]
+            X_grouped, target_grouped = X[rows], target[rows]
+            counts = np.bincount(weight_index[rows], minlength=weight_values.shape[0])
+            bounds = np.concatenate([[0], np.cumsum(counts)])
+            weighted_data = [
+                (
+                    weight,
+                    X_grouped[bounds[k] : bounds[k + 1]],
+                    target_grouped[bounds[k] : bounds[k + 1]],
+                )
+                for k, weight in enumerate(weight_values)
+                if counts[k] > 0
+            ]
+
+    # The objectives of oneDAL are created once for the whole path, without
+    # penalty, which is added for every C by the loss functions. Every C then
+    # starts from the solution for the previous one.
+    def make_objective(X_k, target_k, value=False, gradient=False):
+        return daal_extra_args_func(
+            classes.size,
+            w0,
+            X_k,
+            target_k,
+            0.0,
+            0.0,
+            fit_intercept,
+            value=value,
+            gradient=gradient,
+            hessian=False,
+        )
+
+    if solver == "lbfgs":
+        weighted_objectives = [
+            (weight, make_objective(X_k, target_k, value=True, gradient=True))
+            for weight, X_k, target_k in weighted_data
+        ]
+    elif solver == "newton-cg":
+
+        def make_ncg_func(f, objective):
+            def _func_(x, l2):
+                return f(x, *objective, l2)
+
+            return _func_
+
+        value_objective = make_objective(X, target, value=True)
+        gradient_objective = make_objective(X, target, gradient=True)
+        loss_func = make_ncg_func(_daal4py_loss_, value_objective)
+        grad_func = make_ncg_func(_daal4py_grad_, gradient_objective)
+        grad_hess_func = make_ncg_func(_daal4py_grad_hess_, gradient_objective)
 
     coefs = list()
     n_iter = np.zeros(len(Cs), dtype=np.int32)
     for i, C in enumerate(Cs):
+        l2 = 1.0 / (2 * C * C_daal_multiplier)
         if solver == "lbfgs":
-            extra_args = daal_extra_args_func(
-                classes.size,
-                w0,
-                X,
-                target,
-                0.0,
-                1.0 / (2 * C * C_daal_multiplier * sw_sum),
-                fit_intercept,
-                value=True,
-                gradient=True,
-                hessian=False,
-            )
 
             iprint = [-1, 50, 1, 100, 101][
                 np.searchsorted(np.array([0, 1, 2, 3]), verbose)
@@ -361,11 +414,11 @@ def logistic_regression_path_d4p(
             # like the logistic regression being fitted here. For larger problems with sparse
             # data (currently not supported), it might benefit from increasing the number further.
             opt_res = optimize.minimize(
-                func,
+                _daal4py_weighted_loss_and_grad,
                 w0,
                 method="L-BFGS-B",
                 jac=True,
-                args=extra_args,
+                args=(weighted_objectives, l2),
                 options={
                     "maxiter": max_iter,
                     "maxcor": 50,
@@ -382,60 +435,34 @@ def logistic_regression_path_d4p(
                 extra_warning_msg=_LOGISTIC_SOLVER_CONVERGENCE_MSG,
             )
             w0, loss = opt_res.x, opt_res.fun
-            if C_daal_multiplier == 2:
-                w0 /= 2
-            if w0.dtype != X.dtype and sklearn_check_version("1.9"):
-                w0 = w0.astype(X.dtype)
         elif solver == "newton-cg":
-
-            def make_ncg_funcs(f, value=False, gradient=False, hessian=False):
-                daal_penaltyL2 = 1.0 / (2 * C * C_daal_multiplier * sw_sum)
-                _obj_, X_, y_, n_samples = daal_extra_args_func(
-                    classes.size,
-                    w0,
-                    X,
-                    target,
-                    0.0,
-                    daal_penaltyL2,
-                    fit_intercept,
-                    value=value,
-                    gradient=gradient,
-                    hessian=hessian,
-                )
-
-                def _func_(x, *args):
-                    return f(x, _obj_, *args)
-
-                return _func_, (X_, y_, n_samples, daal_penaltyL2)
-
-            loss_func, extra_args = make_ncg_funcs(func, value=True)
-            grad_func, _ = make_ncg_funcs(grad, gradient=True)
-            grad_hess_func, _ = make_ncg_funcs(hess, gradient=True)
             w0, n_iter_i = _newton_cg(
                 grad_hess_func,
                 loss_func,
                 grad_func,
                 w0,
-                args=extra_args,
+                args=(l2,),
                 maxiter=max_iter,
                 tol=tol,
             )
-            if C_daal_multiplier == 2:
-                w0 /= 2
 
         else:
             raise ValueError(
                 "solver must be one of {'lbfgs', 'newton-cg'}, got '%s' instead" % solver
             )
 
+        # the solution of the doubled binary problem is kept for the next C
+        w = w0 / C_daal_multiplier
+        if w.dtype != X.dtype and sklearn_check_version("1.9"):
+            w = w.astype(X.dtype)
         if multi_class == "multinomial":
             if classes.size == 2:
-                multi_w0 = w0[np.newaxis, :]
+                multi_w = w[np.newaxis, :]
             else:
-                multi_w0 = np.reshape(w0, (classes.size, -1))
-            coefs.append(multi_w0.copy())
+                multi_w = np.reshape(w, (classes.size, -1))
+            coefs.append(multi_w)
         else:
-            coefs.append(w0.copy())
+            coefs.append(w)
 
         n_iter[i] = n_iter_i
 
@@ -480,14 +507,40 @@ def daal4py_fit(self, X, y, sample_weight=None):
     return clf
 
 
+def log_reg_scoring_path_cv(*args, **kwargs):
+    # Folds fitted with 'n_jobs' run in worker processes of joblib, where the
+    # path of scikit-learn is not replaced by 'daal4py_fit_cv', so it is replaced
+    # here, with the number of threads of oneDAL limited to the share of the
+    # worker as for the other libraries.
+    # This is only effective in process-based workers (loky, multiprocessing).
+    # Sequential folds and the threading backend run in the process of
+    # 'daal4py_fit_cv', where the path is already replaced, so this returns
+    # early and leaves the threads of oneDAL as they are.
+    which, what = logistic_module, "_logistic_regression_path"
+    if getattr(which, what) is not lr_path_original:
+        return log_reg_scoring_path_original(*args, **kwargs)
+    old_n_threads = get_n_threads()
+    n_threads = get_suggested_n_threads(cpu_count())
+    try:
+        setattr(which, what, logistic_regression_path_cv)
+        if n_threads is not None:
+            set_n_threads(n_threads)
+        return log_reg_scoring_path_original(*args, **kwargs)
+    finally:
+        setattr(which, what, lr_path_original)
+        set_n_threads(old_n_threads)
+
+
 def daal4py_fit_cv(self, X, y, sample_weight=None, **params):
     which, what = logistic_module, "_logistic_regression_path"
     replacer = logistic_regression_path_cv
     try:
         setattr(which, what, replacer)
+        setattr(which, "_log_reg_scoring_path", log_reg_scoring_path_cv)
         clf = LogisticRegressionCV_original.fit(self, X, y, sample_weight, **params)
     finally:
         setattr(which, what, lr_path_original)
+        setattr(which, "_log_reg_scoring_path", log_reg_scoring_path_original)
     return clf
 
 
@@ -927,6 +980,22 @@ def logistic_regression_path_dispatcher(
 ):
 
     _patching_status = PatchingConditionsChain(patching_log_class_name)
+    is_weighted = sample_weight is not None or class_weight is not None
+    combined_weight = None
+    if (
+        is_weighted
+        and solver == "lbfgs"
+        and sklearn_check_version("1.8")
+        and not is_sparse(X)
+        and not check_is_array_api(X)
+    ):
+        combined_weight = _combined_sample_weight(
+            X, y, classes, sample_weight, class_weight
+        )
+        positive_weights = np.unique(combined_weight[combined_weight > 0])
+        weights_supported = np.all(combined_weight >= 0) and (
+            0 < positive_weights.shape[0] <= _MAX_WEIGHT_VALUES
+        )
     _dal_ready = _patching_status.and_conditions(
         [
             (
@@ -941,8 +1010,19 @@ def logistic_regression_path_dispatcher(
                 not check_is_array_api(X),
                 "Array API inputs not supported.",
             ),
-            (sample_weight is None, "Sample weights are not supported."),
-            (class_weight is None, "Class weights are not supported."),
+            (
+                not is_weighted or solver == "lbfgs",
+                "Sample and class weights are only supported with 'lbfgs' solver.",
+            ),
+            (
+                not is_weighted or sklearn_check_version("1.8"),
+                "Sample and class weights require scikit-learn >= 1.8.",
+            ),
+            (
+                combined_weight is None or weights_supported,
+                "Sample weights must be non-negative, with at most "
+                f"{_MAX_WEIGHT_VALUES} distinct positive values.",
+            ),
             (
                 penalty
                 in (["l2", "deprecated"] if sklearn_check_version("1.8") else ["l2"]),
@@ -1019,7 +1099,7 @@ def logistic_regression_path_dispatcher(
         verbose=verbose,
         solver=solver,
         coef=coef,
-        class_weight=class_weight,
+        class_weight=None,
         dual=dual,
         penalty=penalty,
         intercept_scaling=intercept_scaling,
@@ -1027,7 +1107,7 @@ def logistic_regression_path_dispatcher(
         random_state=random_state,
         check_input=check_input,
         max_squared_sum=max_squared_sum,
-        sample_weight=sample_weight,
+        sample_weight=combined_weight,
         l1_ratio=l1_ratio,
         n_threads=n_threads,
     )
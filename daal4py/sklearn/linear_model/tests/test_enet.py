@@ -17,12 +17,22 @@ import warnings
 
 import numpy as np
 import pytest
+import scipy.sparse as sp
 from sklearn.datasets import make_regression
 from sklearn.exceptions import ConvergenceWarning
 from sklearn.linear_model import ElasticNet as _sklElasticnet
+from sklearn.linear_model import ElasticNetCV as _sklElasticNetCV
 from sklearn.linear_model import Lasso as _sklLasso
+from sklearn.linear_model import LassoCV as _sklLassoCV
+from sklearn.linear_model import enet_path as _skl_enet_path
 
-from daal4py.sklearn.linear_model import ElasticNet, Lasso
+from daal4py.sklearn.linear_model import (
+    ElasticNet,
+    ElasticNetCV,
+    Lasso,
+    LassoCV,
+    enet_path,
+)
 
 
 def fn_lasso(model, X, y, lambda_):
@@ -155,3 +165,95 @@ def test_warm_start(n_targets):
     diff_from_scratch = np.linalg.norm(model_d4p.coef_ - model_from_scratch.coef_)
 
     assert diff_ref < diff_from_scratch
+
+
+def _make_path_data(sparse):
+    X, y = make_regression(n_samples=60, n_features=8, noise=5.0, random_state=123)
+    if sparse:
+        rng = np.random.default_rng(seed=123)
+        X = sp.csc_matrix(X * (rng.random(X.shape) < 0.4))
+    return X, y
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+@pytest.mark.parametrize("l1_ratio", [0.5, 1.0])
+@pytest.mark.parametrize("positive", [False, True])
+def test_enet_path_is_correct(sparse, l1_ratio, positive):
+    X, y = _make_path_data(sparse)
+    alphas = [10.0, 1.0, 0.1, 0.01]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ConvergenceWarning)
+        alphas_d4p, coefs_d4p, _ = enet_path(
+            X, y, l1_ratio=l1_ratio, alphas=alphas, positive=positive, tol=1e-10
+        )
+        alphas_skl, coefs_skl, _ = _skl_enet_path(
+            X, y, l1_ratio=l1_ratio, alphas=alphas, positive=positive, tol=1e-10
+        )
+
+    np.testing.assert_allclose(alphas_d4p, alphas_skl)
+    np.testing.assert_allclose(coefs_d4p, coefs_skl, atol=1e-5, rtol=1e-5)
+
+
+def test_enet_path_sparse_gram_fallback():
+    from daal4py.sklearn.linear_model._coordinate_descent import _daal4py_enet_path
+
+    X = sp.random(200, 50, density=0.02, format="csc", random_state=0)
+    y = np.random.default_rng(seed=0).standard_normal(200)
+    alphas = [0.1, 0.01]
+
+    # the dense Gram matrix would hold more values than X itself
+    assert X.nnz < X.shape[1] ** 2
+    assert (
+        _daal4py_enet_path(
+            "enet_path", X, y, 1.0, alphas, "auto", None, None, False, True, {}
+        )
+        is None
+    )
+    _, coefs_d4p, _ = enet_path(X, y, l1_ratio=1.0, alphas=alphas)
+    _, coefs_skl, _ = _skl_enet_path(X, y, l1_ratio=1.0, alphas=alphas)
+    np.testing.assert_allclose(coefs_d4p, coefs_skl)
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+@pytest.mark.parametrize("use_sample_weight", [False, True])
+@pytest.mark.parametrize("fit_intercept", [False, True])
+def test_enet_weighted_and_sparse_fit(sparse, use_sample_weight, fit_intercept):
+    X, y = _make_path_data(sparse)
+    sample_weight = None
+    if use_sample_weight:
+        sample_weight = np.random.default_rng(seed=0).random(X.shape[0])
+    params = {"alpha": 0.5, "fit_intercept": fit_intercept, "tol": 1e-10}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ConvergenceWarning)
+        model_d4p = ElasticNet(**params).fit(X, y, sample_weight=sample_weight)
+        model_skl = _sklElasticnet(**params).fit(X, y, sample_weight=sample_weight)
+
+    np.testing.assert_allclose(model_d4p.coef_, model_skl.coef_, atol=1e-5, rtol=1e-5)
+    np.testing.assert_allclose(
+        model_d4p.intercept_, model_skl.intercept_, atol=1e-5, rtol=1e-5
+    )
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+@pytest.mark.parametrize("use_sample_weight", [False, True])
+@pytest.mark.parametrize(
+    "estimator,skl_estimator,params",
+    [
+        (LassoCV, _sklLassoCV, {}),
+        (ElasticNetCV, _sklElasticNetCV, {"l1_ratio": [0.2, 0.8]}),
+    ],
+)
+def test_cv_is_correct(sparse, use_sample_weight, estimator, skl_estimator, params):
+    X, y = _make_path_data(sparse)
+    sample_weight = None
+    if use_sample_weight:
+        sample_weight = np.random.default_rng(seed=0).random(X.shape[0])
+    params = {"cv": 3, "tol": 1e-10, "max_iter": 5000, **params}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", ConvergenceWarning)
+        model_d4p = estimator(**params).fit(X, y, sample_weight=sample_weight)
+        model_skl = skl_estimator(**params).fit(X, y, sample_weight=sample_weight)
+
+    assert model_d4p.alpha_ == model_skl.alpha_
+    np.testing.assert_allclose(model_d4p.mse_path_, model_skl.mse_path_, rtol=1e-5)
+    np.testing.assert_allclose(model_d4p.coef_, model_skl.coef_, atol=1e-5, rtol=1e-5)
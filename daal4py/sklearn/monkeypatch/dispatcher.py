@@ -26,9 +26,13 @@ import sklearn.manifold as manifold_module
 import sklearn.neighbors as neighbors_module
 from sklearn import metrics, model_selection
 from sklearn.linear_model import ElasticNet as ElasticNet_sklearn
+from sklearn.linear_model import ElasticNetCV as ElasticNetCV_sklearn
 from sklearn.linear_model import Lasso as Lasso_sklearn
+from sklearn.linear_model import LassoCV as LassoCV_sklearn
 from sklearn.linear_model import LogisticRegression as LogisticRegression_sklearn
 from sklearn.linear_model import LogisticRegressionCV as LogisticRegressionCV_sklearn
+from sklearn.linear_model import enet_path as enet_path_sklearn
+from sklearn.linear_model import lasso_path as lasso_path_sklearn
 from sklearn.linear_model._logistic import (
     _logistic_regression_path as _logistic_regression_path_sklearn,
 )
@@ -45,7 +49,11 @@ from sklearn.utils.validation import _assert_all_finite as _assert_all_finite_sk
 from daal4py.sklearn._utils import set_idp_sklearn_verbose
 
 from ..linear_model.coordinate_descent import ElasticNet as ElasticNet_daal4py
+from ..linear_model.coordinate_descent import ElasticNetCV as ElasticNetCV_daal4py
 from ..linear_model.coordinate_descent import Lasso as Lasso_daal4py
+from ..linear_model.coordinate_descent import LassoCV as LassoCV_daal4py
+from ..linear_model.coordinate_descent import enet_path as enet_path_daal4py
+from ..linear_model.coordinate_descent import lasso_path as lasso_path_daal4py
 from ..linear_model.logistic_path import LogisticRegression as LogisticRegression_daal4py
 from ..linear_model.logistic_path import (
     LogisticRegressionCV as LogisticRegressionCV_daal4py,
@@ -96,6 +104,30 @@ def _get_map_of_algorithms() -> PatchMap:
             Lasso_daal4py,
             Lasso_sklearn,
         ),
+        "sklearn.linear_model.ElasticNetCV": (
+            linear_model_module,
+            "ElasticNetCV",
+            ElasticNetCV_daal4py,
+            ElasticNetCV_sklearn,
+        ),
+        "sklearn.linear_model.LassoCV": (
+            linear_model_module,
+            "LassoCV",
+            LassoCV_daal4py,
+            LassoCV_sklearn,
+        ),
+        "sklearn.linear_model.enet_path": (
+            linear_model_module,
+            "enet_path",
+            enet_path_daal4py,
+            enet_path_sklearn,
+        ),
+        "sklearn.linear_model.lasso_path": (
+            linear_model_module,
+            "lasso_path",
+            lasso_path_daal4py,
+            lasso_path_sklearn,
+        ),
         "sklearn.linear_model._logistic._logistic_regression_path": (
             logistic_module,
             "_logistic_regression_path",
@@ -0,0 +1,59 @@
+# ==============================================================================
+# Copyright contributors to the oneDAL project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+# Benchmark of the approximate nearest neighbors search against the exact
+# brute force search: recall@k and query time for increasing numbers of
+# probed inverted lists
+
+from timeit import default_timer as timer
+
+import numpy as np
+from sklearn.datasets import make_blobs
+
+from sklearnex.neighbors import ApproximateNearestNeighbors, NearestNeighbors
+
+n_neighbors = 10
+X, _ = make_blobs(
+    n_samples=50_000, n_features=128, centers=200, cluster_std=4.0, random_state=0
+)
+X = X.astype(np.float32)
+X_train, X_test = X[:-1000], X[-1000:]
+
+exact = NearestNeighbors(n_neighbors=n_neighbors, algorithm="brute").fit(X_train)
+start = timer()
+exact_ind = exact.kneighbors(X_test, return_distance=False)
+exact_time = timer() - start
+print(f"Exact brute force search: {exact_time:.3f} s")
+
+ann = ApproximateNearestNeighbors(n_neighbors=n_neighbors, random_state=0)
+start = timer()
+ann.fit(X_train)
+print(f"Inverted file index build: {timer() - start:.3f} s")
+
+n_lists = ann.cluster_centers_.shape[0]
+for n_probes in (1, 2, 4, 8, 16, 32):
+    ann.set_params(n_probes=n_probes)
+    start = timer()
+    ind = ann.kneighbors(X_test, return_distance=False)
+    ann_time = timer() - start
+
+    recall = np.mean(
+        [len(np.intersect1d(i, j)) / n_neighbors for i, j in zip(ind, exact_ind)]
+    )
+    print(
+        f"n_probes={n_probes:>2} of {n_lists}: recall@{n_neighbors}={recall:.3f}, "
+        f"{ann_time:.3f} s ({exact_time / ann_time:.1f}x)"
+    )
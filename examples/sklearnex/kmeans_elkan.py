@@ -0,0 +1,48 @@
+# ==============================================================================
+# Copyright contributors to the oneDAL project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+# Benchmark of the bounded 'elkan' KMeans iterations against plain 'lloyd'
+# iterations for increasing numbers of clusters, both started from the same
+# centroids so that they converge to the same clustering
+
+from timeit import default_timer as timer
+
+import numpy as np
+from sklearn.datasets import make_blobs
+
+from sklearnex.cluster import KMeans
+
+X, _ = make_blobs(
+    n_samples=100_000, n_features=32, centers=500, cluster_std=2.0, random_state=0
+)
+rng = np.random.default_rng(seed=0)
+
+for n_clusters in (8, 64, 256, 1024):
+    init = X[rng.choice(X.shape[0], n_clusters, replace=False)]
+    results = {}
+    for algorithm in ("lloyd", "elkan"):
+        kmeans = KMeans(n_clusters, init=init, n_init=1, algorithm=algorithm)
+        start = timer()
+        kmeans.fit(X)
+        results[algorithm] = (timer() - start, kmeans.n_iter_, kmeans.inertia_)
+
+    (lloyd_time, n_iter, inertia), (elkan_time, _, elkan_inertia) = results.values()
+    print(
+        f"n_clusters={n_clusters:>4} ({n_iter} iterations): "
+        f"lloyd {lloyd_time:.3f} s, elkan {elkan_time:.3f} s "
+        f"({lloyd_time / elkan_time:.1f}x), "
+        f"inertia relative difference {abs(elkan_inertia - inertia) / inertia:.1e}"
+    )
@@ -0,0 +1,73 @@
+# ==============================================================================
+# Copyright contributors to the oneDAL project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+# Peak memory of random forest training in the default mode of oneDAL
+# against its memory saving mode. The training data is loaded in memory
+# before training starts, so the reported growth is the memory taken by
+# the training itself
+
+import os
+import resource
+import tempfile
+from multiprocessing import get_context
+from timeit import default_timer as timer
+
+import numpy as np
+
+from sklearnex.ensemble import RandomForestRegressor
+
+n_samples, n_features = 2_000_000, 32
+
+
+def max_rss():
+    # kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**20
+
+
+def train(path, memory_saving_mode):
+    X = np.load(os.path.join(path, "X.npy"))
+    y = np.load(os.path.join(path, "y.npy"))
+    loaded = max_rss()
+    start = timer()
+    RandomForestRegressor(
+        n_estimators=20,
+        max_depth=12,
+        random_state=0,
+        memory_saving_mode=memory_saving_mode,
+    ).fit(X, y)
+    elapsed = timer() - start
+    return elapsed, max_rss() - loaded
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as path:
+        rng = np.random.default_rng(seed=0)
+        X = rng.standard_normal((n_samples, n_features))
+        y = X[:, :4].sum(axis=1) + rng.standard_normal(n_samples)
+        np.save(os.path.join(path, "X.npy"), X)
+        np.save(os.path.join(path, "y.npy"), y)
+        print(f"Training data: {X.nbytes / 2**30:.2f} GiB")
+        del X
+
+        # every mode is run in a fresh process to measure its own peak memory
+        ctx = get_context("spawn")
+        for memory_saving_mode in (False, True):
+            with ctx.Pool(1) as pool:
+                elapsed, growth = pool.apply(train, (path, memory_saving_mode))
+            print(
+                f"memory_saving_mode={memory_saving_mode!s:>5}: {elapsed:.2f} s, "
+                f"peak memory growth {growth:.2f} GiB"
+            )
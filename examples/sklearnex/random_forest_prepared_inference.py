@@ -0,0 +1,55 @@
+# ==============================================================================
+# Copyright contributors to the oneDAL project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+# Latency of random forest predictions of micro-batches of 1 to 1000 rows:
+# the predict method of the estimator against a prepared inference, which
+# binds the oneDAL parameters and model once and writes into a
+# preallocated output buffer
+
+from timeit import default_timer as timer
+
+import numpy as np
+from sklearn.datasets import make_classification
+
+from sklearnex.ensemble import RandomForestClassifier
+
+X, y = make_classification(n_samples=20000, n_features=32, random_state=0)
+rf = RandomForestClassifier(n_estimators=100, max_depth=10, random_state=0).fit(X, y)
+prepared = rf.prepare_inference(dtype=X.dtype)
+
+
+def latency(predict, batches):
+    start = timer()
+    for batch in batches:
+        predict(batch)
+    return (timer() - start) / len(batches) * 1e6
+
+
+print(f"{'rows':>6} {'predict, us':>14} {'prepared, us':>14} {'speedup':>8}")
+for batch_size in (1, 10, 100, 1000):
+    n_batches = max(10, 2000 // batch_size)
+    batches = [
+        np.ascontiguousarray(X[i * batch_size : (i + 1) * batch_size])
+        for i in range(n_batches)
+    ]
+    # warm up both paths before timing
+    rf.predict(batches[0])
+    prepared.predict(batches[0])
+
+    default = latency(rf.predict, batches)
+    fast = latency(prepared.predict, batches)
+    assert np.array_equal(prepared.predict(batches[-1]), rf.predict(batches[-1]))
+    print(f"{batch_size:>6} {default:>14.1f} {fast:>14.1f} {default / fast:>7.1f}x")
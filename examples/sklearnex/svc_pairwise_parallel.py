@@ -0,0 +1,57 @@
+# ==============================================================================
+# Copyright contributors to the oneDAL project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+# Training time of multi-class SVC for 2 to 50 classes: all one-vs-one
+# problems in a single oneDAL call against the class pairs trained
+# concurrently with pairwise_jobs=-1
+
+from timeit import default_timer as timer
+
+import numpy as np
+from sklearn.datasets import make_classification
+
+from sklearnex.svm import SVC
+
+
+def fit_time(model, X, y):
+    start = timer()
+    model.fit(X, y)
+    return timer() - start
+
+
+print(
+    f"{'classes':>8} {'pairs':>6} {'single call, s':>15} {'pairwise, s':>12} {'speedup':>8}"
+)
+for n_classes in (2, 5, 10, 20, 50):
+    X, y = make_classification(
+        n_samples=200 * n_classes,
+        n_features=20,
+        n_informative=15,
+        n_classes=n_classes,
+        random_state=0,
+    )
+    single = SVC()
+    pairwise = SVC(pairwise_jobs=-1)
+
+    single_time = fit_time(single, X, y)
+    pairwise_time = fit_time(pairwise, X, y)
+    agreement = np.mean(single.predict(X) == pairwise.predict(X))
+    assert agreement > 0.99
+    n_pairs = n_classes * (n_classes - 1) // 2
+    print(
+        f"{n_classes:>8} {n_pairs:>6} {single_time:>15.3f} {pairwise_time:>12.3f} "
+        f"{single_time / pairwise_time:>7.1f}x"
+    )
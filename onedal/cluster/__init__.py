@@ -17,8 +17,9 @@
 from .. import onedal_check_version
 from .dbscan import DBSCAN
 from .kmeans import KMeans
+from .minibatch_kmeans import MiniBatchKMeans
 
-__all__ = ["DBSCAN", "KMeans"]
+__all__ = ["DBSCAN", "KMeans", "MiniBatchKMeans"]
 
 if onedal_check_version(2023, 2, 0):
     from .kmeans_init import KMeansInit, kmeans_plusplus
@@ -15,10 +15,43 @@
 # ===============================================================================
 
 import numpy as np
+from scipy import sparse as sp
+from scipy.sparse.csgraph import connected_components
 
-from .._device_offload import supports_queue
+from .._device_offload import _transfer_to_host, supports_queue
 from ..common._backend import bind_default_backend
 from ..datatypes import from_table, to_table
+from ..utils.validation import _is_csr
+
+
+def _merge_components(components, rows, cols):
+    """Merge the components joined by the ``(rows, cols)`` pairs of points.
+
+    ``components`` holds the smallest point index of the component of
+    every point. Only the components touched by the pairs are relabeled,
+    so the update takes memory linear in the number of points.
+    """
+    u, v = components[rows], components[cols]
+    joined = u != v
+    if not np.any(joined):
+        return components
+    u, v = u[joined], v[joined]
+    ids, inverse = np.unique(np.concatenate([u, v]), return_inverse=True)
+    graph = sp.coo_matrix(
+        (
+            np.ones(u.shape[0], dtype=np.int8),
+            (inverse[: u.shape[0]], inverse[u.shape[0] :]),
+        ),
+        shape=(ids.shape[0], ids.shape[0]),
+    )
+    _, groups = connected_components(graph, directed=False)
+    # ids are sorted, the first id of every group is its smallest one
+    _, first = np.unique(groups, return_index=True)
+    roots = ids[first]
+
+    lookup = np.arange(components.shape[0])
+    lookup[ids] = roots[groups]
+    return lookup[components]
 
 
 class DBSCAN:
@@ -43,6 +76,9 @@ class DBSCAN:
         self.p = p
         self.n_jobs = n_jobs
 
+    # number of neighbors held in memory at a time by the region queries
+    _neighbors_budget = 1 << 22
+
     @bind_default_backend("dbscan.clustering")
     def compute(self, params, data_table, weights_table): ...
 
@@ -56,8 +92,150 @@ class DBSCAN:
             "result_options": "core_observation_indices|responses",
         }
 
+    def _region_query_space(self, X):
+        """Metric, ``p`` and radius of an equivalent oneDAL neighbors search."""
+        metric, eps = self.metric, float(self.eps)
+        p = 2 if self.p is None else self.p
+        if metric == "haversine":
+            # chords of the unit sphere are monotonic in great circle distances,
+            # which makes the search euclidean and suitable for the kd-tree
+            lat, lon = X[:, 0], X[:, 1]
+            X = np.column_stack(
+                [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+            ).astype(X.dtype)
+            return X, "euclidean", 2, 2.0 * np.sin(min(eps, np.pi) / 2.0)
+        if metric == "minkowski":
+            if p == 2:
+                metric = "euclidean"
+            elif p == 1:
+                metric = "manhattan"
+            elif np.isinf(p):
+                metric = "chebyshev"
+        return X, metric, p, eps
+
+    def _region_queries(self, search, X, eps, queue=None):
+        """Yield the eps-neighborhoods of all points batch after batch.
+
+        The batch size is adapted to keep about ``_neighbors_budget``
+        neighbors in memory at a time.
+        """
+        n_samples = X.shape[0]
+        start, batch_size = 0, min(1024, n_samples)
+        while start < n_samples:
+            stop = min(start + batch_size, n_samples)
+            _, indices, offsets = search.radius_neighbors(
+                X[start:stop], radius=eps, queue=queue
+            )
+            yield start, stop, indices, offsets
+            mean_size = max(indices.shape[0] // (stop - start), 1)
+            batch_size = int(np.clip(self._neighbors_budget // mean_size, 1, 1 << 16))
+            start = stop
+
+    def _fit_region_queries(self, X, sample_weight, queue=None):
+        """DBSCAN from radius queries of the oneDAL neighbors search.
+
+        Used for the metrics, sparse data and search algorithms which the
+        oneDAL DBSCAN does not support. Neighborhoods are never stored
+        for all points at once: a first pass counts their weighted sizes
+        to find the core points and a second one merges the components
+        of the core points in range of each other. Clusters are numbered
+        and border points assigned in the order of their first core point,
+        as in the scikit-learn DBSCAN.
+        """
+        # onedal.neighbors imports onedal.cluster
+        from ..neighbors import NearestNeighbors
+
+        _, (X, sample_weight) = _transfer_to_host(X, sample_weight)
+        X, metric, p, eps = self._region_query_space(X)
+        n_samples = X.shape[0]
+
+        is_gpu = queue is not None and getattr(queue.sycl_device, "is_gpu", False)
+        use_kd_tree = (
+            metric == "euclidean"
+            and self.algorithm != "brute"
+            and not _is_csr(X)
+            and not is_gpu
+        )
+        search = NearestNeighbors(
+            n_neighbors=min(max(int(self.min_samples), 1), n_samples),
+            algorithm="kd_tree" if use_kd_tree else "brute",
+            metric=metric,
+            p=p,
+        )
+        search.fit(X, queue=queue)
+
+        # neighborhoods are reused by the second pass while they fit the budget
+        cache, cache_size = [], 0
+        n_neighbors = np.empty(n_samples, dtype=np.float64)
+        for batch in self._region_queries(search, X, eps, queue=queue):
+            start, stop, indices, offsets = batch
+            if sample_weight is None:
+                n_neighbors[start:stop] = np.diff(offsets)
+            else:
+                rows = np.repeat(np.arange(stop - start), np.diff(offsets))
+                n_neighbors[start:stop] = np.bincount(
+                    rows, weights=sample_weight[indices], minlength=stop - start
+                )
+            cache_size += indices.shape[0]
+            if cache is not None and cache_size <= self._neighbors_budget:
+                cache.append(batch)
+            else:
+                cache = None
+        is_core = n_neighbors >= self.min_samples
+
+        components = np.arange(n_samples)
+        border_rows, border_cores = [], []
+        batches = (
+            cache
+            if cache is not None
+            else self._region_queries(search, X, eps, queue=queue)
+        )
+        for start, stop, indices, offsets in batches:
+            rows = np.repeat(np.arange(start, stop), np.diff(offsets))
+            in_range = is_core[indices]
+            rows, cols = rows[in_range], indices[in_range]
+            from_core = is_core[rows]
+            border_rows.append(rows[~from_core])
+            border_cores.append(cols[~from_core])
+            components = _merge_components(components, rows[from_core], cols[from_core])
+
+        labels = np.full(n_samples, -1, dtype=np.int32)
+        core_indices = np.flatnonzero(is_core)
+        # components are labeled with their smallest point index
+        _, labels[core_indices] = np.unique(components[core_indices], return_inverse=True)
+        border_rows = np.concatenate(border_rows)
+        if border_rows.shape[0]:
+            first = np.full(n_samples, n_samples, dtype=np.int64)
+            np.minimum.at(first, border_rows, labels[np.concatenate(border_cores)])
+            labels[first < n_samples] = first[first < n_samples]
+        return labels, core_indices.astype(np.int32)
+
+    def _use_region_queries(self, X):
+        is_euclidean = self.metric == "euclidean" or (
+            self.metric == "minkowski" and self.p in (None, 2)
+        )
+        return _is_csr(X) or not is_euclidean or self.algorithm not in ["auto", "brute"]
+
     @supports_queue
     def fit(self, X, y=None, sample_weight=None, queue=None):
+        if self._use_region_queries(X):
+            labels, core_indices = self._fit_region_queries(X, sample_weight, queue=queue)
+            if _is_csr(X):
+                # sparse data is on host, where the results are numpy arrays
+                self.labels_ = labels
+                self.core_sample_indices_ = (
+                    core_indices if core_indices.shape[0] else None
+                )
+                return self
+            # same array types as the results of the oneDAL DBSCAN
+            self.labels_ = from_table(to_table(labels[:, None]), like=X)[:, 0]
+            self.core_sample_indices_ = (
+                from_table(to_table(core_indices[:, None]), like=X)[:, 0]
+                if core_indices.shape[0]
+                else None
+            )
+            return self
+
         X_table, sample_weight_table = to_table(X, sample_weight, queue=queue)
 
         params = self._get_onedal_params(X_table.dtype)
@@ -18,9 +18,10 @@ import warnings
 from abc import ABC
 
 import numpy as np
+from scipy import sparse as sp
 
 from .. import onedal_check_version
-from .._device_offload import supports_queue
+from .._device_offload import _transfer_to_host, supports_queue
 from ..basic_statistics import BasicStatistics
 from ..common._backend import bind_default_backend
 from ..utils import _sycl_queue_manager as QM
@@ -34,9 +35,37 @@ from sklearn.utils import check_random_state
 
 from ..datatypes import from_table, return_type_constructor, to_table
 from ..utils.validation import _is_arraylike_not_scalar, _is_csr
+from .kmeans_init import _weighted_kmeans_plusplus
+
+
+def _cluster_sums(X, labels, sample_weight, n_clusters):
+    """Weighted sums and total weights of the points of each cluster."""
+    assignment = sp.csr_matrix(
+        (sample_weight, (labels, np.arange(X.shape[0]))),
+        shape=(n_clusters, X.shape[0]),
+    )
+    sums = assignment @ X
+    if sp.issparse(sums):
+        sums = sums.toarray()
+    return sums, np.bincount(labels, weights=sample_weight, minlength=n_clusters)
+
+
+class _Restart:
+    """State of one of the ``n_init`` restarts of a KMeans fit."""
+
+    def __init__(self, centroids):
+        self.centroids = centroids
+        self.labels = self.inertia = self.model = self.rate = None
+        self.n_iter = 0
+        self.converged = self.pruned = False
 
 
 class KMeans(ABC):
+    # Lloyd iterations run by a restart before the restarts are compared and
+    # pruned, see _fit_restarts. The pruning is approximate and only done if
+    # this is set: by default, every restart runs to convergence.
+    _restart_round_iter = None
+
     def __init__(
         self,
         n_clusters=8,
@@ -67,6 +96,37 @@ class KMeans(ABC):
     @bind_default_backend("kmeans.clustering")
     def infer(self, params, model, X_table): ...
 
+    # provides direct access to the backend model constructor
+    @bind_default_backend("kmeans.clustering")
+    def model(self): ...
+
+    def _create_model(self, centers):
+        m = self.model()
+        m.centroids = to_table(centers, queue=QM.get_global_queue())
+        return m
+
+    def _assign(self, X, X_table, centers):
+        """Closest centroids of host data and squared distances to them.
+
+        The assignment is computed by oneDAL inference, the distances to
+        the assigned centroids on host, where sample weights are applied.
+        """
+        params = self._get_onedal_params(_is_csr(X), X_table.dtype)
+        result = self.infer(params, self._create_model(centers), X_table)
+        labels = from_table(result.responses)[:, 0].astype(np.intp)
+
+        closest = centers[labels]
+        if _is_csr(X):
+            distances = (
+                np.asarray(X.multiply(X).sum(axis=1)).ravel()
+                - 2 * np.asarray(X.multiply(closest).sum(axis=1)).ravel()
+                + np.einsum("ij,ij->i", closest, closest)
+            )
+        else:
+            diff = X - closest
+            distances = np.einsum("ij,ij->i", diff, diff)
+        return labels, np.maximum(distances, 0)
+
     def _get_basic_statistics_backend(self, result_options):
         return BasicStatistics(result_options)
 
@@ -83,7 +143,9 @@ class KMeans(ABC):
         """Compute absolute tolerance from relative tolerance using data variance."""
         self._tol = self._tolerance(X_table, self.tol, is_csr, dtype)
 
-    def _get_onedal_params(self, is_csr=False, dtype=np.float32, result_options=None):
+    def _get_onedal_params(
+        self, is_csr=False, dtype=np.float32, result_options=None, max_iter=None
+    ):
         thr = self._tol if hasattr(self, "_tol") else self.tol
         return {
             # fptype chosen from input table dtype (pattern)
@@ -91,7 +153,7 @@ class KMeans(ABC):
             # map method names to backend dispatch (CSR vs dense)
             "method": "lloyd_csr" if is_csr else "by_default",
             "seed": -1,
-            "max_iteration_count": self.max_iter,
+            "max_iteration_count": self.max_iter if max_iter is None else max_iter,
             "cluster_count": self.n_clusters,
             "accuracy_threshold": thr,
             "result_options": "" if result_options is None else result_options,
@@ -171,8 +233,184 @@ class KMeans(ABC):
 
         return to_table(centers, queue=getattr(QM.get_global_queue(), "_queue", None))
 
-    def _fit_backend(self, X_table, centroids_table, dtype=np.float32, is_csr=False):
-        params = self._get_onedal_params(is_csr, dtype)
+    def _init_centroids_weighted(self, X, init, random_state, sample_weight):
+        if isinstance(init, str) and init == "k-means++":
+            centers, _ = _weighted_kmeans_plusplus(
+                X, self.n_clusters, sample_weight, random_state
+            )
+        elif isinstance(init, str) and init == "random":
+            seeds = random_state.choice(
+                X.shape[0],
+                size=self.n_clusters,
+                replace=False,
+                p=sample_weight / sample_weight.sum(),
+            )
+            centers = X[seeds]
+            if _is_csr(centers):
+                centers = centers.toarray()
+        else:
+            # explicit and callable initializations don't depend on the weights
+            return self._init_centroids_sklearn(X, init, random_state, dtype=X.dtype)
+        return to_table(centers, queue=QM.get_global_queue())
+
+    def _fit_weighted(self, X, X_table, centroids_table, sample_weight, max_iter):
+        """Lloyd iterations on weighted host data.
+
+        oneDAL training doesn't take sample weights: the points are assigned
+        with oneDAL inference and the centroids are the weighted means of
+        their points. Empty clusters are moved to the points farthest from
+        their centroids. Stops when the assignment doesn't change or the
+        squared shift of the centroids is below the tolerance.
+        """
+        centers = np.array(from_table(centroids_table), dtype=X_table.dtype)
+        labels, distances = self._assign(X, X_table, centers)
+        n_iter = 0
+        while n_iter < max_iter:
+            sums, weights = _cluster_sums(X, labels, sample_weight, self.n_clusters)
+
+            empty = np.flatnonzero(weights == 0)
+            if len(empty):
+                far_from_centers = np.argsort(distances)[::-1][: len(empty)]
+                for cluster, point in zip(empty, far_from_centers):
+                    x = X[[point]].toarray()[0] if _is_csr(X) else X[point]
+                    sums[labels[point]] -= sample_weight[point] * x
+                    weights[labels[point]] -= sample_weight[point]
+                    sums[cluster] = sample_weight[point] * x
+                    weights[cluster] = sample_weight[point]
+
+            centers_new = (sums / weights[:, None]).astype(centers.dtype)
+            center_shift = np.sum((centers_new - centers) ** 2)
+            centers = centers_new
+            n_iter += 1
+
+            labels_new, distances = self._assign(X, X_table, centers)
+            if np.array_equal(labels_new, labels) or center_shift <= self._tol:
+                labels = labels_new
+                break
+            labels = labels_new
+
+        return (
+            to_table(labels.astype(np.int32)[:, None]),
+            float(sample_weight @ distances),
+            self._create_model(centers),
+            n_iter,
+        )
+
+    def _fit_hamerly(self, X, centroids_table, sample_weight, max_iter):
+        """Lloyd iterations with Hamerly's bounds on dense host data.
+
+        Every point keeps an upper bound of the distance to its centroid
+        and a lower bound of the distance to the second closest one, which
+        are updated with the shifts of the centroids. Only the points whose
+        bounds overlap are searched again, for their two closest centroids
+        with the oneDAL brute force search, so that most distance
+        computations of the late iterations are skipped. The iterations
+        are the ones of ``_fit_weighted``.
+        """
+        # imported here, as onedal.neighbors depends on onedal.cluster
+        from ..neighbors import NearestNeighbors
+
+        queue = QM.get_global_queue()
+
+        def closest_two(rows, centers):
+            search = NearestNeighbors(algorithm="brute", metric="euclidean")
+            search.fit(centers, queue=queue)
+            dist, ind = search.kneighbors(rows, n_neighbors=2, queue=queue)
+            _, (dist, ind) = _transfer_to_host(dist, ind)
+            return np.asarray(dist), np.asarray(ind).astype(np.intp)
+
+        if sample_weight is None:
+            sample_weight = np.ones(X.shape[0], dtype=X.dtype)
+        centers = np.array(from_table(centroids_table), dtype=X.dtype)
+        dist, ind = closest_two(X, centers)
+        labels, upper, lower = ind[:, 0], dist[:, 0], dist[:, 1]
+
+        n_iter = 0
+        while n_iter < max_iter:
+            sums, weights = _cluster_sums(X, labels, sample_weight, self.n_clusters)
+
+            empty = np.flatnonzero(weights == 0)
+            for cluster, point in zip(empty, np.argsort(upper)[::-1][: len(empty)]):
+                sums[labels[point]] -= sample_weight[point] * X[point]
+                weights[labels[point]] -= sample_weight[point]
+                sums[cluster] = sample_weight[point] * X[point]
+                weights[cluster] = sample_weight[point]
+
+            centers_new = (sums / weights[:, None]).astype(centers.dtype)
+            shift = np.sqrt(
+                np.einsum("ij,ij->i", centers_new - centers, centers_new - centers)
+            )
+            centers = centers_new
+            n_iter += 1
+
+            # the distance to any other centroid decreases at most by the
+            # largest shift of the other centroids
+            upper += shift[labels]
+            largest = np.argsort(shift)[-2:]
+            lower -= np.where(
+                labels == largest[-1], shift[largest[0]], shift[largest[-1]]
+            )
+            if len(empty):
+                lower[:] = -np.inf
+
+            # a point keeps its centroid if it is closer to it than to half
+            # the distance to the closest other centroid
+            half_separation = closest_two(centers, centers)[0][:, 1] / 2
+            bound = np.maximum(half_separation[labels], lower)
+            candidates = np.flatnonzero(upper > bound)
+            diff = X[candidates] - centers[labels[candidates]]
+            upper[candidates] = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+            candidates = candidates[upper[candidates] > bound[candidates]]
+
+            n_changed = 0
+            if len(candidates):
+                dist, ind = closest_two(X[candidates], centers)
+                n_changed = np.count_nonzero(ind[:, 0] != labels[candidates])
+                labels[candidates] = ind[:, 0]
+                upper[candidates], lower[candidates] = dist[:, 0], dist[:, 1]
+
+            if n_changed == 0 or np.sum(shift**2) <= self._tol:
+                break
+
+        diff = X - centers[labels]
+        return (
+            to_table(labels.astype(np.int32)[:, None]),
+            float(sample_weight @ np.einsum("ij,ij->i", diff, diff)),
+            self._create_model(centers),
+            n_iter,
+        )
+
+    def _fit_backend(
+        self,
+        X_table,
+        centroids_table,
+        dtype=np.float32,
+        is_csr=False,
+        max_iter=None,
+        X=None,
+        sample_weight=None,
+    ):
+        if (
+            X is not None
+            and self.algorithm == "elkan"
+            and self.n_clusters > 1
+            and not is_csr
+        ):
+            return self._fit_hamerly(
+                X,
+                centroids_table,
+                sample_weight,
+                self.max_iter if max_iter is None else max_iter,
+            )
+        if sample_weight is not None:
+            return self._fit_weighted(
+                X,
+                X_table,
+                centroids_table,
+                sample_weight,
+                self.max_iter if max_iter is None else max_iter,
+            )
+        params = self._get_onedal_params(is_csr, dtype, max_iter=max_iter)
         result = self.train(params, X_table, centroids_table)
         return (
             result.responses,
@@ -187,13 +425,33 @@ class KMeans(ABC):
         )
         return self.infer(params, self.model_, X_table)
 
+    def _check_sample_weight(self, sample_weight, dtype):
+        """Host weights, or None with their common value for uniform weights.
+
+        Uniform weights only scale the inertia, so they are fitted with
+        the oneDAL training, which doesn't take weights.
+        """
+        if sample_weight is None:
+            return None, 1.0
+        _, (sample_weight,) = _transfer_to_host(sample_weight)
+        sample_weight = np.asarray(sample_weight, dtype=dtype).ravel()
+        if np.all(sample_weight == sample_weight[0]):
+            return None, float(sample_weight[0])
+        return sample_weight, 1.0
+
     @supports_queue
-    def fit(self, X, y=None, queue=None):
+    def fit(self, X, y=None, sample_weight=None, queue=None):
         is_csr = _is_csr(X)
         X_table = to_table(X, queue=queue)
         dtype = X_table.dtype
         self._input_type = return_type_constructor(X)  # lightweight callable
 
+        sample_weight, weight_scale = self._check_sample_weight(sample_weight, dtype)
+        X_host = None
+        if sample_weight is not None or (self.algorithm == "elkan" and not is_csr):
+            # weighted and bounded Lloyd iterations update the centroids on host
+            _, (X_host,) = _transfer_to_host(X)
+
         self._compute_tolerance(X_table, is_csr, dtype)
         self.n_features_in_ = X_table.column_count
 
@@ -240,8 +498,13 @@ class KMeans(ABC):
             )
             n_init = 1
 
+        restarts = []
         for init_idx in range(n_init):
-            if use_onedal_init:
+            if sample_weight is not None:
+                centroids_table = self._init_centroids_weighted(
+                    X_host, init, random_state, sample_weight
+                )
+            elif use_onedal_init:
                 seed = random_state.randint(np.iinfo("i").max)
                 centroids_table = self._init_centroids_onedal(
                     X_table, init, seed, is_csr, dtype=dtype
@@ -250,28 +513,84 @@ class KMeans(ABC):
                 centroids_table = self._init_centroids_sklearn(
                     X, init, random_state, dtype=dtype
                 )
+            restarts.append(_Restart(centroids_table))
 
-            if self.verbose:
-                print("Initialization complete")
+        if self.verbose:
+            print("Initialization complete")
 
-            labels, inertia, model, n_iter = self._fit_backend(
-                X_table, centroids_table, dtype, is_csr
-            )
+        self._fit_restarts(X_table, restarts, dtype, is_csr, X_host, sample_weight)
+
+        for restart in restarts:
+            if restart.pruned:
+                continue
 
             if self.verbose:
-                print("Iteration {}, inertia {}.".format(n_iter, inertia))
+                print("Iteration {}, inertia {}.".format(restart.n_iter, restart.inertia))
 
-            if is_better_iteration(inertia, labels):
-                best_model, best_n_iter = model, n_iter
-                best_inertia, best_labels = inertia, labels
+            if is_better_iteration(restart.inertia, restart.labels):
+                best_model, best_n_iter = restart.model, restart.n_iter
+                best_inertia, best_labels = restart.inertia, restart.labels
 
         # assign learned attributes (pattern)
         self.model_ = best_model
         self.n_iter_ = best_n_iter
-        self.inertia_ = best_inertia
+        self.inertia_ = best_inertia * weight_scale
         self.labels_ = from_table(best_labels, like=X)[:, 0]
         return self
 
+    def _fit_restarts(self, X_table, restarts, dtype, is_csr, X=None, sample_weight=None):
+        """Run the Lloyd iterations of all restarts, optionally pruning them.
+
+        oneDAL already parallelizes every Lloyd iteration over the whole
+        data, so restarts are run one after another rather than in threads,
+        which would only compete for the same cores. With
+        ``_restart_round_iter`` set, they are raced instead: they advance in
+        rounds of at most that many iterations, each round resuming from the
+        centroids of the previous one, and a restart is dropped once its
+        inertia minus the decrease extrapolated at the average rate of its
+        last round over its remaining iterations exceeds the inertia of a
+        converged restart. The extrapolation is not a bound, as Lloyd
+        iterations can speed up again, so a dropped restart may have ended
+        with the lowest inertia.
+        """
+        round_iter = self._restart_round_iter or self.max_iter
+        if len(restarts) == 1:
+            round_iter = self.max_iter
+        active = restarts
+        while active:
+            for restart in active:
+                budget = min(round_iter, self.max_iter - restart.n_iter)
+                labels, inertia, model, n_iter = self._fit_backend(
+                    X_table,
+                    restart.centroids,
+                    dtype,
+                    is_csr,
+                    max_iter=budget,
+                    X=X,
+                    sample_weight=sample_weight,
+                )
+                if restart.inertia is not None and n_iter > 0:
+                    restart.rate = (restart.inertia - inertia) / n_iter
+                restart.labels, restart.inertia, restart.model = labels, inertia, model
+                restart.centroids = model.centroids
+                restart.n_iter += n_iter
+                restart.converged = n_iter < budget or restart.n_iter >= self.max_iter
+
+            best_inertia = min(
+                (r.inertia for r in restarts if r.converged and not r.pruned),
+                default=None,
+            )
+            for restart in active:
+                if (
+                    best_inertia is not None
+                    and not restart.converged
+                    and restart.rate is not None
+                    and restart.inertia - restart.rate * (self.max_iter - restart.n_iter)
+                    > best_inertia
+                ):
+                    restart.pruned = True
+            active = [r for r in active if not (r.converged or r.pruned)]
+
     @property
     def cluster_centers_(self):
         if not hasattr(self, "_cluster_centers_") or self._cluster_centers_ is None:
@@ -305,9 +624,18 @@ class KMeans(ABC):
         return from_table(result.responses, like=X)[:, 0]
 
     @supports_queue
-    def score(self, X, queue=None):
+    def score(self, X, sample_weight=None, queue=None):
         X_table = to_table(X, queue=queue)
+        sample_weight, weight_scale = self._check_sample_weight(
+            sample_weight, X_table.dtype
+        )
+        if sample_weight is not None:
+            _, (X,) = _transfer_to_host(X)
+            _, (centers,) = _transfer_to_host(self.cluster_centers_)
+            centers = np.asarray(centers, dtype=X_table.dtype)
+            _, distances = self._assign(X, X_table, centers)
+            return -float(sample_weight @ distances)
         result = self._predict_backend(
             X, X_table, result_options="compute_exact_objective_function"
         )
-        return -1 * result.objective_function_value
+        return -1 * result.objective_function_value * weight_scale
@@ -15,7 +15,9 @@
 # ==============================================================================
 
 import numpy as np
+from sklearn.metrics.pairwise import euclidean_distances
 from sklearn.utils import check_random_state
+from sklearn.utils.extmath import row_norms
 
 from .. import _default_backend, onedal_check_version
 from .._device_offload import supports_queue
@@ -23,6 +25,65 @@ from ..common._backend import bind_default_backend
 from ..datatypes import from_table, to_table
 from ..utils import _sycl_queue_manager as QM
 
+
+def _weighted_kmeans_plusplus(
+    X, n_clusters, sample_weight, random_state, n_local_trials=None
+):
+    """Greedy k-means++ seeding of weighted data on host.
+
+    Candidate centers are sampled with probabilities proportional to the
+    weight of a point times its squared distance to the closest chosen
+    center, and the candidate which most reduces the weighted potential is
+    kept. The oneDAL seeding doesn't take sample weights.
+
+    Returns
+    -------
+    centers : ndarray of shape (n_clusters, n_features)
+        Initial centers.
+    indices : ndarray of shape (n_clusters,)
+        Indices of the chosen centers in X.
+    """
+    n_samples, n_features = X.shape
+    if n_local_trials is None:
+        n_local_trials = 2 + int(np.log(n_clusters))
+
+    x_squared_norms = row_norms(X, squared=True)
+    centers = np.empty((n_clusters, n_features), dtype=X.dtype)
+    indices = np.full(n_clusters, -1, dtype=int)
+
+    center_id = random_state.choice(n_samples, p=sample_weight / sample_weight.sum())
+    centers[0] = X[[center_id]].toarray() if hasattr(X, "toarray") else X[center_id]
+    indices[0] = center_id
+
+    closest_dist_sq = euclidean_distances(
+        centers[0, None], X, Y_norm_squared=x_squared_norms, squared=True
+    )
+    current_pot = closest_dist_sq @ sample_weight
+
+    for c in range(1, n_clusters):
+        rand_vals = random_state.uniform(size=n_local_trials) * current_pot
+        candidate_ids = np.searchsorted(
+            np.cumsum(sample_weight * closest_dist_sq, dtype=np.float64), rand_vals
+        )
+        np.clip(candidate_ids, None, n_samples - 1, out=candidate_ids)
+
+        distance_to_candidates = euclidean_distances(
+            X[candidate_ids], X, Y_norm_squared=x_squared_norms, squared=True
+        )
+        np.minimum(closest_dist_sq, distance_to_candidates, out=distance_to_candidates)
+        candidates_pot = distance_to_candidates @ sample_weight
+
+        best_candidate = np.argmin(candidates_pot)
+        current_pot = candidates_pot[best_candidate]
+        closest_dist_sq = distance_to_candidates[best_candidate, None]
+        center_id = candidate_ids[best_candidate]
+
+        centers[c] = X[[center_id]].toarray() if hasattr(X, "toarray") else X[center_id]
+        indices[c] = center_id
+
+    return centers, indices
+
+
 if onedal_check_version(2023, 2, 0):
 
     class KMeansInit:
@@ -92,10 +153,19 @@ if onedal_check_version(2023, 2, 0):
         n_clusters,
         *,
         x_squared_norms=None,
+        sample_weight=None,
         random_state=None,
         n_local_trials=None,
         queue=None,
     ):
+        if sample_weight is not None:
+            return _weighted_kmeans_plusplus(
+                X,
+                n_clusters,
+                np.asarray(sample_weight, dtype=X.dtype),
+                check_random_state(random_state),
+                n_local_trials=n_local_trials,
+            )
         random_seed = check_random_state(random_state).tomaxint()
         return (
             KMeansInit(
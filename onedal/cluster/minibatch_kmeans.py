@@ -0,0 +1,410 @@
+# ==============================================================================
+# Copyright contributors to the oneDAL project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import numpy as np
+from scipy import sparse as sp
+from sklearn.utils import check_random_state
+
+from .._device_offload import _transfer_to_host, supports_queue
+from ..datatypes import from_table, return_type_constructor, to_table
+from ..utils import _sycl_queue_manager as QM
+from ..utils.validation import _is_arraylike_not_scalar, _is_csr
+from .kmeans import KMeans, _cluster_sums
+
+
+class MiniBatchKMeans(KMeans):
+    """Mini-batch KMeans oneDAL implementation.
+
+    Every batch is assigned to the closest centroids with oneDAL KMeans
+    inference, which dominates the cost of a step. The centroids are then
+    moved towards the weighted means of their assigned points, with
+    per-centroid learning rates decreasing with the total weight assigned
+    so far, as in scikit-learn. Centroids with a very low assigned weight
+    are periodically moved to random points of the batch.
+
+    The state between ``partial_fit`` calls is the centroids and the
+    weights assigned to them. ``finalize_fit`` builds the oneDAL model
+    used by ``predict`` and ``score`` from it.
+    """
+
+    def __init__(
+        self,
+        n_clusters=8,
+        *,
+        init="k-means++",
+        max_iter=100,
+        batch_size=1024,
+        verbose=0,
+        compute_labels=True,
+        random_state=None,
+        tol=0.0,
+        max_no_improvement=10,
+        init_size=None,
+        n_init="auto",
+        reassignment_ratio=0.01,
+    ):
+        super().__init__(
+            n_clusters=n_clusters,
+            init=init,
+            n_init=n_init,
+            max_iter=max_iter,
+            tol=tol,
+            verbose=verbose,
+            random_state=random_state,
+        )
+        self.batch_size = batch_size
+        self.compute_labels = compute_labels
+        self.max_no_improvement = max_no_improvement
+        self.init_size = init_size
+        self.reassignment_ratio = reassignment_ratio
+        self._reset()
+
+    def _reset(self):
+        self._need_to_finalize = False
+        self._queue = None
+        self._centers = None
+        self._counts = None
+        self._random_state = None
+        self._n_since_last_reassign = 0
+        self.n_steps_ = 0
+
+    def __getstate__(self):
+        # Since finalize_fit can't be dispatched without directly provided queue
+        # and the dispatching policy can't be serialized, the computation is finalized
+        # here and the policy is not saved in serialized data.
+        self.finalize_fit()
+        data = self.__dict__.copy()
+        data.pop("_queue", None)
+
+        return data
+
+    def _allreduce(self, values):
+        """Sum of ``values`` over the processes of a distributed fit."""
+        return values
+
+    def _labels_inertia(self, X, X_table, centers, sample_weight):
+        """Closest centroids and local weighted inertia of a batch."""
+        labels, distances = self._assign(X, X_table, centers)
+        return labels, float(sample_weight @ distances)
+
+    def _mini_batch_step(self, X, sample_weight, random_reassign):
+        """Update the centroids with a batch and return its inertia."""
+        n_samples = X.shape[0]
+        n_clusters, n_features = self._centers.shape
+        X_table = to_table(X, queue=QM.get_global_queue())
+        labels, inertia = self._labels_inertia(X, X_table, self._centers, sample_weight)
+
+        sums, weights = _cluster_sums(X, labels, sample_weight, n_clusters)
+        reduced = self._allreduce(
+            np.concatenate([sums.ravel(), weights, [inertia, n_samples]])
+        )
+        sums = reduced[: n_clusters * n_features].reshape(n_clusters, n_features)
+        weights = reduced[n_clusters * n_features : -2]
+        inertia, batch_size = reduced[-2], reduced[-1]
+
+        assigned = weights > 0
+        counts = self._counts[assigned] + weights[assigned]
+        self._centers[assigned] = (
+            self._centers[assigned] * self._counts[assigned, None] + sums[assigned]
+        ) / counts[:, None]
+        self._counts[assigned] = counts
+
+        if random_reassign and self.reassignment_ratio > 0:
+            self._reassign(X, batch_size)
+
+        return inertia
+
+    def _reassign(self, X, batch_size):
+        to_reassign = self._counts < self.reassignment_ratio * self._counts.max()
+
+        # pick at most .5 * batch_size samples as new centers
+        if to_reassign.sum() > 0.5 * batch_size:
+            to_reassign[np.argsort(self._counts)[int(0.5 * batch_size) :]] = False
+        n_reassigns = to_reassign.sum()
+
+        if n_reassigns:
+            new_centers = self._random_state.choice(
+                X.shape[0], replace=n_reassigns > X.shape[0], size=n_reassigns
+            )
+            candidates = X[new_centers]
+            if sp.issparse(candidates):
+                candidates = candidates.toarray()
+            if self.verbose:
+                print(f"[MiniBatchKMeans] Reassigning {n_reassigns} cluster centers.")
+            # the processes of a distributed fit draw their own candidates,
+            # which are averaged so that all processes keep the same centroids
+            reduced = self._allreduce(np.append(candidates.ravel(), 1.0))
+            self._centers[to_reassign] = (
+                reduced[:-1].reshape(candidates.shape) / reduced[-1]
+            )
+
+        # reset counts of reassigned centers, but don't reset them too small
+        # to avoid instant reassignment
+        self._counts[to_reassign] = np.min(self._counts[~to_reassign])
+
+    def _random_reassign(self, batch_size):
+        self._n_since_last_reassign += batch_size
+        if (self._counts == 0).any() or self._n_since_last_reassign >= (
+            10 * self.n_clusters
+        ):
+            self._n_since_last_reassign = 0
+            return True
+        return False
+
+    def _init_centers(self, X, init, seed, random_state):
+        is_csr = _is_csr(X)
+        X_table = to_table(X, queue=QM.get_global_queue())
+        if callable(init):
+            centers_table = self._init_centroids_sklearn(
+                X, init, random_state, dtype=X_table.dtype
+            )
+        else:
+            centers_table = self._init_centroids_onedal(
+                X_table, init, seed, is_csr, dtype=X_table.dtype
+            )
+        return np.array(from_table(centers_table), dtype=X_table.dtype, order="C")
+
+    def _as_host(self, X, sample_weight):
+        _, (X, sample_weight) = _transfer_to_host(X, sample_weight)
+        if sample_weight is None:
+            sample_weight = np.ones(X.shape[0], dtype=X.dtype)
+        return X, np.asarray(sample_weight, dtype=X.dtype)
+
+    @supports_queue
+    def partial_fit(self, X, sample_weight=None, queue=None):
+        """Update the centroids with a single batch.
+
+        Parameters
+        ----------
+        X : array-like or CSR matrix of shape (n_samples, n_features)
+            Training data batch.
+
+        sample_weight : array-like of shape (n_samples,), default=None
+            Individual weights for each sample.
+
+        queue : SyclQueue or None, default=None
+            SYCL Queue object for device code execution. Default
+            value None causes computation on host.
+
+        Returns
+        -------
+        self : object
+            Returns the instance itself.
+        """
+        self._queue = queue
+        self._input_type = return_type_constructor(X)
+        X, sample_weight = self._as_host(X, sample_weight)
+
+        if self._centers is None:
+            self._random_state = check_random_state(self.random_state)
+            seed = self._random_state.randint(np.iinfo("i").max)
+            init = self.init
+            if _is_arraylike_not_scalar(init):
+                init = np.array(init, dtype=X.dtype, order="C")
+            X_init = X
+            if self.init_size is not None and self.init_size < X.shape[0]:
+                X_init = X[self._random_state.randint(0, X.shape[0], self.init_size)]
+            self._centers = self._init_centers(X_init, init, seed, self._random_state)
+            self._counts = np.zeros(self.n_clusters, dtype=X.dtype)
+            self._n_since_last_reassign = 0
+            self.n_features_in_ = X.shape[1]
+
+        batch_size = self._allreduce(np.array([X.shape[0]], dtype=np.float64))[0]
+        self._mini_batch_step(X, sample_weight, self._random_reassign(batch_size))
+
+        if self.compute_labels:
+            X_table = to_table(X, queue=queue)
+            self.labels_, inertia = self._labels_inertia(
+                X, X_table, self._centers, sample_weight
+            )
+            self.inertia_ = float(self._allreduce(np.array([inertia]))[0])
+
+        self.n_steps_ += 1
+        self._need_to_finalize = True
+        return self
+
+    def finalize_fit(self):
+        """Build the oneDAL model from the current centroids.
+
+        Returns
+        -------
+        self : object
+            Returns the instance itself.
+        """
+        if self._need_to_finalize:
+            with QM.manage_global_queue(self._queue):
+                self.model_ = self._create_model(self._centers)
+            self._cluster_centers_ = None
+            self._need_to_finalize = False
+        return self
+
+    def _mini_batch_convergence(
+        self, step, n_steps, n_samples, batch_size, centers_squared_diff, batch_inertia
+    ):
+        """Early stopping of scikit-learn's MiniBatchKMeans."""
+        batch_inertia /= batch_size
+        step += 1
+
+        # the first inertia is the one of the initialization
+        if step == 1:
+            if self.verbose:
+                print(
+                    f"Minibatch step {step}/{n_steps}: mean batch "
+                    f"inertia: {batch_inertia}"
+                )
+            return False
+
+        if self._ewa_inertia is None:
+            self._ewa_inertia = batch_inertia
+        else:
+            alpha = min(batch_size * 2.0 / (n_samples + 1), 1)
+            self._ewa_inertia = self._ewa_inertia * (1 - alpha) + batch_inertia * alpha
+
+        if self.verbose:
+            print(
+                f"Minibatch step {step}/{n_steps}: mean batch inertia: "
+                f"{batch_inertia}, ewa inertia: {self._ewa_inertia}"
+            )
+
+        if self._tol > 0.0 and centers_squared_diff <= self._tol:
+            if self.verbose:
+                print(f"Converged (small centers change) at step {step}/{n_steps}")
+            return True
+
+        if self._ewa_inertia_min is None or self._ewa_inertia < self._ewa_inertia_min:
+            self._no_improvement = 0
+            self._ewa_inertia_min = self._ewa_inertia
+        else:
+            self._no_improvement += 1
+
+        if (
+            self.max_no_improvement is not None
+            and self._no_improvement >= self.max_no_improvement
+        ):
+            if self.verbose:
+                print(
+                    "Converged (lack of improvement in inertia) at step "
+                    f"{step}/{n_steps}"
+                )
+            return True
+
+        return False
+
+    @supports_queue
+    def fit(self, X, y=None, sample_weight=None, queue=None):
+        """Compute the centroids on randomly sampled batches of X."""
+        self._reset()
+        self._queue = queue
+        self._input_type = return_type_constructor(X)
+        X, sample_weight = self._as_host(X, sample_weight)
+        n_samples = X.shape[0]
+        X_table = to_table(X, queue=queue)
+        self._tol = self._tolerance(X_table, self.tol, _is_csr(X), X_table.dtype)
+        self.n_features_in_ = X.shape[1]
+
+        init = self.init
+        n_init = self.n_init
+        if isinstance(n_init, str) and n_init == "auto":
+            n_init = 1 if isinstance(init, str) and init == "k-means++" else 3
+        if _is_arraylike_not_scalar(init):
+            init = np.array(init, dtype=X.dtype, order="C")
+            n_init = 1
+
+        # the seeds are drawn first so that they are the same on all processes
+        # of a distributed fit, whatever the size of their data
+        random_state = check_random_state(self.random_state)
+        seeds = random_state.randint(np.iinfo("i").max, size=n_init)
+        self._random_state = random_state
+
+        batch_size = min(self.batch_size, n_samples)
+        init_size = self.init_size
+        if init_size is None:
+            init_size = max(3 * batch_size, 3 * self.n_clusters)
+        elif init_size < self.n_clusters:
+            init_size = 3 * self.n_clusters
+        init_size = min(init_size, n_samples)
+
+        # initializations are compared by their inertia on a validation set
+        validation_indices = random_state.randint(0, n_samples, init_size)
+        X_valid = X[validation_indices]
+        X_valid_table = to_table(X_valid, queue=queue)
+        sample_weight_valid = sample_weight[validation_indices]
+
+        best_inertia = None
+        for init_idx in range(n_init):
+            if self.verbose:
+                print(f"Init {init_idx + 1}/{n_init} with method {init}")
+            init_indices = random_state.randint(0, n_samples, init_size)
+            centers = self._init_centers(
+                X[init_indices], init, seeds[init_idx], random_state
+            )
+            _, inertia = self._labels_inertia(
+                X_valid, X_valid_table, centers, sample_weight_valid
+            )
+            inertia = self._allreduce(np.array([inertia]))[0]
+            if self.verbose:
+                print(f"Inertia for init {init_idx + 1}/{n_init}: {inertia}")
+            if best_inertia is None or inertia < best_inertia:
+                self._centers, best_inertia = centers, inertia
+
+        self._counts = np.zeros(self.n_clusters, dtype=X.dtype)
+        self._ewa_inertia = self._ewa_inertia_min = None
+        self._no_improvement = 0
+
+        # the number of steps and the early stopping only depend on totals
+        # over all processes of a distributed fit
+        n_total, batch_total, weight_total = self._allreduce(
+            np.array([n_samples, batch_size, sample_weight.sum()], dtype=np.float64)
+        )
+        n_steps = int(self.max_iter * n_total // batch_total)
+        normalized_sample_weight = sample_weight / sample_weight.sum()
+        unit_sample_weight = np.ones(batch_size, dtype=X.dtype)
+
+        for i in range(n_steps):
+            # the sampling is weighted, so the batch gets unit weights
+            minibatch_indices = random_state.choice(
+                n_samples, batch_size, p=normalized_sample_weight, replace=True
+            )
+            centers_old = self._centers.copy()
+            batch_inertia = self._mini_batch_step(
+                X[minibatch_indices],
+                unit_sample_weight,
+                self._random_reassign(batch_total),
+            )
+            centers_squared_diff = (
+                np.sum((self._centers - centers_old) ** 2) if self._tol > 0.0 else 0
+            )
+            if self._mini_batch_convergence(
+                i, n_steps, n_total, batch_total, centers_squared_diff, batch_inertia
+            ):
+                break
+
+        self.n_steps_ = i + 1
+        self.n_iter_ = int(np.ceil(((i + 1) * batch_total) / n_total))
+        self._need_to_finalize = True
+        self.finalize_fit()
+
+        if self.compute_labels:
+            self.labels_, inertia = self._labels_inertia(
+                X, X_table, self._centers, sample_weight
+            )
+            self.inertia_ = float(self._allreduce(np.array([inertia]))[0])
+        else:
+            # the average batch inertia is per unit of weight, so the estimate
+            # of the weighted inertia of the data is scaled by its total weight,
+            # as in scikit-learn
+            self.inertia_ = self._ewa_inertia * weight_total
+        return self
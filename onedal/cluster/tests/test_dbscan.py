@@ -16,8 +16,11 @@
 
 import numpy as np
 import pytest
+import scipy.sparse as sp
+from numpy.testing import assert_array_equal
 from sklearn.cluster import DBSCAN as DBSCAN_SKLEARN
 from sklearn.cluster.tests.common import generate_clustered_data
+from sklearn.datasets import make_blobs
 
 from onedal.cluster import DBSCAN as ONEDAL_DBSCAN
 from onedal.tests.utils._device_selection import get_queues
@@ -123,3 +126,48 @@ def _test_across_grid_parameter_numpy_gen(queue, metric, use_weights: bool):
 @pytest.mark.parametrize("queue", get_queues())
 def test_across_grid_parameter_numpy_gen(queue, metric, use_weights: bool):
     _test_across_grid_parameter_numpy_gen(queue, metric=metric, use_weights=use_weights)
+
+
+@pytest.mark.parametrize(
+    "metric,p,eps",
+    [
+        ("euclidean", None, 0.5),
+        ("minkowski", 3, 0.5),
+        ("manhattan", None, 0.8),
+        ("chebyshev", None, 0.4),
+        ("cosine", None, 0.02),
+    ],
+)
+@pytest.mark.parametrize("algorithm", ["brute", "kd_tree"])
+@pytest.mark.parametrize("use_weights", [True, False])
+@pytest.mark.parametrize("queue", get_queues())
+def test_dbscan_region_queries(queue, metric, p, eps, algorithm, use_weights):
+    X, _ = make_blobs(1000, n_features=4, centers=8, cluster_std=0.4, random_state=0)
+    weights = np.random.RandomState(0).uniform(0.2, 2.0, X.shape[0])
+    if use_weights is False:
+        weights = None
+
+    params = {"eps": eps, "min_samples": 6, "metric": metric, "p": p}
+    result = ONEDAL_DBSCAN(algorithm=algorithm, **params).fit(
+        X, sample_weight=weights, queue=queue
+    )
+    expected = DBSCAN_SKLEARN(**params).fit(X, sample_weight=weights)
+    # clusters are numbered and border points assigned as in scikit-learn
+    assert_array_equal(result.labels_, expected.labels_)
+    assert_array_equal(result.core_sample_indices_, expected.core_sample_indices_)
+
+
+@pytest.mark.parametrize("queue", get_queues("cpu"))
+def test_dbscan_sparse_and_haversine(queue):
+    X, _ = make_blobs(1000, n_features=2, centers=8, cluster_std=0.4, random_state=0)
+    X_geo = np.column_stack([np.tanh(X[:, 0] / 10), X[:, 1] / 5])
+    X_sparse = X.copy()
+    X_sparse[np.abs(X_sparse) < 1.0] = 0.0
+    X_sparse = sp.csr_matrix(X_sparse)
+
+    for data, metric, eps in [(X_geo, "haversine", 0.05), (X_sparse, "euclidean", 0.5)]:
+        result = ONEDAL_DBSCAN(eps=eps, min_samples=6, metric=metric).fit(
+            data, queue=queue
+        )
+        expected = DBSCAN_SKLEARN(eps=eps, min_samples=6, metric=metric).fit(data)
+        assert_array_equal(result.labels_, expected.labels_)
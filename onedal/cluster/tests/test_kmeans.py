@@ -16,7 +16,7 @@
 
 import numpy as np
 import pytest
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_allclose, assert_array_equal
 
 from daal4py.sklearn._utils import daal_check_version
 
@@ -86,3 +86,38 @@ if daal_check_version((2023, "P", 200)):
 
         # TODO: investigate accuracy with kmeans++ init and remove - 1
         assert desired_accuracy - 1 <= exp_accuracy
+
+    @pytest.mark.parametrize("queue", get_queues())
+    def test_restarts_race(queue):
+        _, _, X = generate_dataset(8, 16, seed=777, dtype=np.float64)
+
+        def fit(round_iter):
+            m = KMeans(16, init="random", n_init=10, random_state=0)
+            m._restart_round_iter = round_iter
+            return m.fit(X, queue=queue)
+
+        # by default, restarts run to convergence in a single round and are
+        # never pruned; the approximate pruning keeps a close inertia here
+        sequential = fit(None)
+        raced = fit(2)
+        assert_allclose(raced.inertia_, sequential.inertia_, rtol=1e-3)
+
+    @pytest.mark.parametrize("queue", get_queues())
+    @pytest.mark.parametrize("n_cluster", [4, 32, 128])
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_elkan_matches_lloyd(queue, n_cluster, weighted):
+        _, _, X = generate_dataset(8, n_cluster, n_points=20, dtype=np.float64)
+        init_data, _ = init_external(X, n_cluster, random_state=0)
+        sample_weight = None
+        if weighted:
+            sample_weight = np.random.default_rng(0).uniform(0.5, 2.0, X.shape[0])
+
+        def fit(algorithm):
+            m = KMeans(n_cluster, init=init_data, algorithm=algorithm, tol=0.0)
+            return m.fit(X, sample_weight=sample_weight, queue=queue)
+
+        # the bounds only skip searches, the iterations are those of lloyd
+        lloyd, elkan = fit("lloyd"), fit("elkan")
+        assert_allclose(elkan.cluster_centers_, lloyd.cluster_centers_, rtol=1e-6)
+        assert_allclose(elkan.inertia_, lloyd.inertia_, rtol=1e-6)
+        assert_array_equal(elkan.labels_, lloyd.labels_)
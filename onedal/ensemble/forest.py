@@ -17,16 +17,60 @@
 import math
 import numbers
 from abc import ABC, abstractmethod
+from functools import partial
+
+import numpy as np
+from scipy import sparse as sp
 
 from .. import onedal_check_version
-from .._device_offload import supports_queue
+from .._device_offload import _transfer_to_host, supports_queue
 from ..common._backend import bind_default_backend
 from ..common.hyperparameters import get_hyperparameters
 from ..datatypes import from_table, to_table
+from ..primitives import get_forest_state_cls, get_forest_state_reg
 from ..utils import _sycl_queue_manager as QM
 
 
+def _as_host_float32(X):
+    _, (X,) = _transfer_to_host(X)
+    if sp.issparse(X):
+        X = sp.csr_matrix(X, dtype=np.float32)
+        X.sort_indices()
+        return X
+    return np.asarray(X, dtype=np.float32)
+
+
+def _value_getter(X):
+    """Function of rows and columns returning the values of X there.
+
+    Values of CSR data are found by a binary search of the flat positions of
+    its stored values, so that it is never densified.
+    """
+    if not sp.issparse(X):
+        return lambda rows, columns: X[rows, columns]
+
+    n_features = np.int64(X.shape[1])
+    # a sentinel key larger than all queries ends the sorted keys
+    keys = np.append(
+        np.repeat(np.arange(X.shape[0], dtype=np.int64), np.diff(X.indptr)) * n_features
+        + X.indices,
+        np.iinfo(np.int64).max,
+    )
+    data = np.append(X.data, 0)
+
+    def get(rows, columns):
+        queries = rows * n_features + columns
+        positions = np.searchsorted(keys, queries)
+        found = keys[positions] == queries
+        return np.where(found, data[positions], 0)
+
+    return get
+
+
 class BaseForest(ABC):
+    # number of sample and tree pairs descended at once in apply
+    _traverse_budget = 1 << 20
+
     @abstractmethod
     def __init__(
         self,
@@ -50,6 +94,7 @@ class BaseForest(ABC):
         error_metric_mode,
         variable_importance_mode,
         algorithm,
+        memory_saving_mode,
     ):
         self.n_estimators = n_estimators
         self.max_depth = max_depth
@@ -71,6 +116,7 @@ class BaseForest(ABC):
         self.error_metric_mode = error_metric_mode
         self.variable_importance_mode = variable_importance_mode
         self.algorithm = algorithm
+        self.memory_saving_mode = memory_saving_mode
 
     @abstractmethod
     def train(self, *args, **kwargs): ...
@@ -128,7 +174,7 @@ class BaseForest(ABC):
             "max_bins": self.max_bins,
             "min_bin_size": self.min_bin_size,
             "seed": self.random_state,
-            "memory_saving_mode": False,
+            "memory_saving_mode": bool(self.memory_saving_mode),
             "bootstrap": bool(self.bootstrap),
             "error_metric_mode": self.error_metric_mode,
             "variable_importance_mode": self.variable_importance_mode,
@@ -153,6 +199,9 @@ class BaseForest(ABC):
         train_result = self.train(params, *data)
 
         self._onedal_model = train_result.model
+        # forests grown by warm start are made of the models of every fit
+        self._onedal_models = [(self._onedal_model, int(self.n_estimators))]
+        self._trees = None
 
         # set attributes related to the various oob metric modes
         # naming scheme of mode matches the attribute of the result
@@ -168,23 +217,227 @@ class BaseForest(ABC):
 
         return self
 
+    def merge(self, other):
+        """Add the trees of another forest fitted on data of the same shape.
+
+        The models are kept as they are, and predictions average the results
+        of all of them weighted by their numbers of trees, which is what a
+        single forest of all the trees computes.
+
+        Parameters
+        ----------
+        other : BaseForest
+            Fitted forest of the same type and number of classes.
+
+        Returns
+        -------
+        self : BaseForest
+            The forest with the trees of both forests.
+        """
+        if self.class_count_ != other.class_count_:
+            raise ValueError(
+                f"Forests with {self.class_count_} and {other.class_count_} "
+                "classes can't be merged."
+            )
+        n_trees = self.n_estimators + other.n_estimators
+        if self.variable_importance_mode != "none":
+            self.var_importance_ = (
+                self.var_importance_ * self.n_estimators
+                + other.var_importance_ * other.n_estimators
+            ) / n_trees
+        self._onedal_models = self._onedal_models + other._onedal_models
+        self.n_estimators = n_trees
+        self._trees = None
+        return self
+
+    def _tree_models(self):
+        """Model and index in that model of every tree of the forest."""
+        return [
+            (model, i) for model, n_trees in self._onedal_models for i in range(n_trees)
+        ]
+
+    def export_trees(self):
+        """Nodes of all trees of the forest in flat arrays.
+
+        The trees are exported from the oneDAL models once, with a single
+        traversal per model, and cached.
+
+        Returns
+        -------
+        trees : dict
+            ``"nodes"`` is a structured array with the fields of the nodes of
+            scikit-learn trees, whose child ids are local to their tree, and
+            ``"values"`` the array of shape (n_nodes, 1, n_classes) of their
+            values. The nodes of tree ``i`` are those from
+            ``"tree_offsets"[i]`` to ``"tree_offsets"[i + 1]``, and its depth
+            is ``"max_depths"[i]``.
+        """
+        if getattr(self, "_trees", None) is None:
+            n_classes = max(1, self.class_count_)
+            states = [
+                self._get_forest_state(model, n_classes)
+                for model, _ in self._onedal_models
+            ]
+            offsets = [np.zeros(1, dtype=np.intp)]
+            for state in states:
+                offsets.append(offsets[-1][-1] + np.asarray(state.tree_offsets[1:]))
+            self._trees = {
+                "nodes": np.concatenate([state.node_ar for state in states]),
+                "values": np.concatenate([state.value_ar for state in states]),
+                "tree_offsets": np.concatenate(offsets).astype(np.intp),
+                "max_depths": np.concatenate(
+                    [state.max_depths for state in states]
+                ).astype(np.intp),
+            }
+        return self._trees
+
+    def _traverse(self, X, return_path=False):
+        # all trees are descended in lockstep, one level per iteration
+        trees = self.export_trees()
+        nodes = trees["nodes"]
+        feature, threshold = nodes["feature"], nodes["threshold"]
+        left, right = nodes["left_child"], nodes["right_child"]
+        missing_left = nodes["missing_go_to_left"].astype(bool)
+        roots = trees["tree_offsets"][:-1]
+        n_samples, n_trees = X.shape[0], roots.shape[0]
+
+        leaves = np.empty((n_samples, n_trees), dtype=np.intp)
+        path_rows, path_nodes = [], []
+        batch_size = max(1, self._traverse_budget // n_trees)
+        for start in range(0, n_samples, batch_size):
+            X_batch = X[start : start + batch_size]
+            get_values = _value_getter(X_batch)
+            rows = np.arange(X_batch.shape[0])[:, None]
+            node = np.repeat(roots[None, :], X_batch.shape[0], axis=0)
+            split = feature[node] >= 0
+            if return_path:
+                path_rows.append(np.repeat(rows[:, 0] + start, n_trees))
+                path_nodes.append(node.ravel())
+            while split.any():
+                # values equal to the threshold go left and missing values
+                # the way of the node, as in scikit-learn
+                value = get_values(rows, np.where(split, feature[node], 0))
+                go_left = (value <= threshold[node]) | (
+                    np.isnan(value) & missing_left[node]
+                )
+                child = roots + np.where(go_left, left[node], right[node])
+                node = np.where(split, child, node)
+                if return_path:
+                    path_rows.append(np.nonzero(split)[0] + start)
+                    path_nodes.append(node[split])
+                split &= feature[node] >= 0
+            leaves[start : start + X_batch.shape[0]] = node - roots
+
+        if not return_path:
+            return leaves
+        path_rows, path_nodes = np.concatenate(path_rows), np.concatenate(path_nodes)
+        indicator = sp.csr_matrix(
+            (np.ones(path_rows.shape[0], dtype=np.intp), (path_rows, path_nodes)),
+            shape=(n_samples, nodes.shape[0]),
+        )
+        indicator.sort_indices()
+        return indicator, trees["tree_offsets"].copy()
+
+    def apply(self, X):
+        """Index of the leaf that every sample ends in for every tree.
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix} of shape (n_samples, n_features)
+            Samples, compared to the thresholds as float32 values.
+
+        Returns
+        -------
+        X_leaves : ndarray of shape (n_samples, n_estimators)
+            Node ids of the leaves, local to their trees.
+        """
+        return self._traverse(_as_host_float32(X))
+
+    def decision_path(self, X):
+        """Nodes of all trees that every sample goes through.
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix} of shape (n_samples, n_features)
+            Samples, compared to the thresholds as float32 values.
+
+        Returns
+        -------
+        indicator : sparse matrix of shape (n_samples, n_nodes)
+            CSR indicator of the nodes in the paths of the samples.
+
+        n_nodes_ptr : ndarray of shape (n_estimators + 1,)
+            The nodes of tree ``i`` are the columns from ``n_nodes_ptr[i]``
+            to ``n_nodes_ptr[i + 1]``.
+        """
+        return self._traverse(_as_host_float32(X), return_path=True)
+
+    def _predict_trees(self, X, values=None):
+        # mean of the values of the leaves of all trees, computed from the
+        # exported trees for data that oneDAL inference doesn't accept
+        trees = self.export_trees()
+        if values is None:
+            values = trees["values"][:, 0, :]
+        nodes = self._traverse(_as_host_float32(X)) + trees["tree_offsets"][:-1]
+        total = np.zeros((nodes.shape[0], values.shape[1]))
+        for tree_nodes in nodes.T:
+            total += values[tree_nodes]
+        return total / nodes.shape[1]
+
+    def prepare_inference(self, n_features, dtype=np.float64, queue=None):
+        """Inference of the fitted forest with its parameters bound once.
+
+        Parameters
+        ----------
+        n_features : int
+            Number of features of the data.
+
+        dtype : {np.float64, np.float32}, default=np.float64
+            Data type of the data.
+
+        queue : SyclQueue or None, default=None
+            Queue on which the inference runs.
+
+        Returns
+        -------
+        inference : ForestInference
+            Inference of C-contiguous dense data of this type and width.
+        """
+        return ForestInference(self, n_features, dtype=dtype, queue=queue)
+
+    def _infer(self, params, model, X_table):
+        hparams = get_hyperparameters("decision_forest", "infer")
+        if hparams is not None and not hparams.is_default:
+            return self.infer(params, hparams.backend, model, X_table)
+        return self.infer(params, model, X_table)
+
+    def _infer_merged(self, params, X_table, result_name):
+        # host average of the results of all models weighted by their trees
+        total = 0.0
+        for model, n_trees in self._onedal_models:
+            result = from_table(getattr(self._infer(params, model, X_table), result_name))
+            total = total + result * (n_trees / self.n_estimators)
+        return total
+
     @supports_queue
     def predict(self, X, queue=None):
-        hparams = get_hyperparameters("decision_forest", "infer")
+        if sp.issparse(X):
+            return self._predict_trees(X)[:, 0]
 
         queue = QM.get_global_queue()
         X_table = to_table(X, queue=queue)
         params = self._get_onedal_params(X_table)
-        if hparams is not None and not hparams.is_default:
-            result = self.infer(params, hparams.backend, self._onedal_model, X_table)
-        else:
-            result = self.infer(params, self._onedal_model, X_table)
+        if len(self._onedal_models) > 1:
+            y = self._infer_merged(params, X_table, "responses")
+            return from_table(to_table(y, queue=queue), like=X)[:, 0]
 
+        result = self._infer(params, self._onedal_model, X_table)
         y = from_table(result.responses, like=X)[:, 0]
         return y
 
 
 class ForestClassifier(BaseForest):
+    _get_forest_state = staticmethod(get_forest_state_cls)
 
     @bind_default_backend("decision_forest.classification")
     def train(self, *args, **kwargs): ...
@@ -192,22 +445,80 @@ class ForestClassifier(BaseForest):
     @bind_default_backend("decision_forest.classification")
     def infer(self, *args, **kwargs): ...
 
+    def _leaf_distributions(self):
+        """Class distributions of the nodes of the exported trees, or None.
+
+        The exported leaves only hold the class of their majority, which is
+        the class distribution of pure leaves. With two classes, the
+        probability p of the majority of a leaf also follows from its gini
+        impurity 2 p (1 - p). The distributions of other leaves are unknown.
+        """
+        trees = self.export_trees()
+        if "distributions" not in trees:
+            nodes, values = trees["nodes"], trees["values"][:, 0, :]
+            leaf = nodes["feature"] < 0
+            impurity = np.where(leaf, nodes["impurity"], 0.0)
+            if np.all(impurity == 0):
+                distributions = values
+            elif values.shape[1] == 2:
+                majority = (1 + np.sqrt(np.clip(1 - 2 * impurity, 0, 1))) / 2
+                distributions = np.where(
+                    leaf[:, None],
+                    np.where(values > 0.5, majority[:, None], 1 - majority[:, None]),
+                    values,
+                )
+            else:
+                distributions = None
+            trees["distributions"] = distributions
+        return trees["distributions"]
+
+    def _predict_proba_sparse(self, X):
+        # oneDAL votes with the class distributions of the leaves, so the
+        # trees are traversed on the CSR rows with the same distributions
+        distributions = self._leaf_distributions()
+        if distributions is None:
+            raise ValueError(
+                "Sparse data is only supported by forests of two classes or "
+                "of trees with pure leaves."
+            )
+        return self._predict_trees(X, distributions)
+
+    @supports_queue
+    def predict(self, X, queue=None):
+        if sp.issparse(X):
+            proba = self._predict_proba_sparse(X)
+            return proba.argmax(axis=1).astype(np.float64)
+        if len(self._onedal_models) == 1:
+            return super().predict(X, queue=queue)
+
+        # merged forests vote with the averaged class probabilities
+        X_table = to_table(X, queue=queue)
+        params = self._get_onedal_params(X_table)
+        params["infer_mode"] = "class_probabilities"
+        proba = self._infer_merged(params, X_table, "probabilities")
+        y = proba.argmax(axis=1).astype(proba.dtype)[:, None]
+        return from_table(to_table(y, queue=queue), like=X)[:, 0]
+
     @supports_queue
     def predict_proba(self, X, queue=None):
-        hparams = get_hyperparameters("decision_forest", "infer")
+        if sp.issparse(X):
+            return self._predict_proba_sparse(X)
+
         X_table = to_table(X, queue=queue)
         params = self._get_onedal_params(X_table)
         params["infer_mode"] = "class_probabilities"
 
-        if hparams is not None and not hparams.is_default:
-            result = self.infer(params, hparams.backend, self._onedal_model, X_table)
-        else:
-            result = self.infer(params, self._onedal_model, X_table)
+        if len(self._onedal_models) > 1:
+            proba = self._infer_merged(params, X_table, "probabilities")
+            return from_table(to_table(proba, queue=queue), like=X)
 
+        result = self._infer(params, self._onedal_model, X_table)
         return from_table(result.probabilities, like=X)
 
 
 class ForestRegressor(BaseForest):
+    _get_forest_state = staticmethod(get_forest_state_reg)
+
     @bind_default_backend("decision_forest.regression")
     def train(self, *args, **kwargs): ...
 
@@ -215,6 +526,64 @@ class ForestRegressor(BaseForest):
     def infer(self, *args, **kwargs): ...
 
 
+class ForestInference:
+    """Inference of a fitted forest with its parameters bound once.
+
+    The oneDAL parameters, the hyperparameters and the models of the forest
+    are looked up when the object is created, so that a call only converts
+    the data to a table and runs the inference. The forest must not be
+    refitted or changed while the object is in use.
+    """
+
+    def __init__(self, forest, n_features, dtype=np.float64, queue=None):
+        self._queue = queue
+        self._models = [
+            (model, n_trees / forest.n_estimators)
+            for model, n_trees in forest._onedal_models
+        ]
+        with QM.manage_global_queue(queue):
+            sample = to_table(np.zeros((1, n_features), dtype=dtype), queue=queue)
+            params = forest._get_onedal_params(sample)
+
+        hparams = get_hyperparameters("decision_forest", "infer")
+        if hparams is not None and not hparams.is_default:
+            bind = lambda params: partial(forest.infer, params, hparams.backend)
+        else:
+            bind = lambda params: partial(forest.infer, params)
+
+        self._is_classifier = forest.class_count_ > 0
+        if self._is_classifier:
+            self._infer_proba = bind({**params, "infer_mode": "class_probabilities"})
+            params = {**params, "infer_mode": "class_responses"}
+        self._infer_responses = bind(params)
+
+    def _run(self, infer, result_name, X):
+        # host average of the results of all models weighted by their trees
+        with QM.manage_global_queue(self._queue):
+            X_table = to_table(X, queue=self._queue)
+            if len(self._models) == 1:
+                return from_table(
+                    getattr(infer(self._models[0][0], X_table), result_name)
+                )
+            total = 0.0
+            for model, weight in self._models:
+                total = total + weight * from_table(
+                    getattr(infer(model, X_table), result_name)
+                )
+            return total
+
+    def predict(self, X):
+        """Responses, or indices of the classes, of shape (n_samples,)."""
+        if self._is_classifier and len(self._models) > 1:
+            # merged forests vote with the averaged class probabilities
+            return self.predict_proba(X).argmax(axis=1)
+        return self._run(self._infer_responses, "responses", X)[:, 0]
+
+    def predict_proba(self, X):
+        """Class probabilities of shape (n_samples, n_classes)."""
+        return self._run(self._infer_proba, "probabilities", X)
+
+
 class RandomForestClassifier(ForestClassifier):
     def __init__(
         self,
@@ -238,6 +607,7 @@ class RandomForestClassifier(ForestClassifier):
         error_metric_mode="none",
         variable_importance_mode="none",
         algorithm="hist",
+        memory_saving_mode=False,
     ):
         super().__init__(
             n_estimators=n_estimators,
@@ -260,6 +630,7 @@ class RandomForestClassifier(ForestClassifier):
             error_metric_mode=error_metric_mode,
             variable_importance_mode=variable_importance_mode,
             algorithm=algorithm,
+            memory_saving_mode=memory_saving_mode,
         )
 
     @bind_default_backend("decision_forest.classification")
@@ -292,6 +663,7 @@ class RandomForestRegressor(ForestRegressor):
         error_metric_mode="none",
         variable_importance_mode="none",
         algorithm="hist",
+        memory_saving_mode=False,
     ):
         super().__init__(
             n_estimators=n_estimators,
@@ -314,6 +686,7 @@ class RandomForestRegressor(ForestRegressor):
             error_metric_mode=error_metric_mode,
             variable_importance_mode=variable_importance_mode,
             algorithm=algorithm,
+            memory_saving_mode=memory_saving_mode,
         )
 
 
@@ -340,6 +713,7 @@ class ExtraTreesClassifier(ForestClassifier):
         error_metric_mode="none",
         variable_importance_mode="none",
         algorithm="hist",
+        memory_saving_mode=False,
     ):
         super().__init__(
             n_estimators=n_estimators,
@@ -362,6 +736,7 @@ class ExtraTreesClassifier(ForestClassifier):
             error_metric_mode=error_metric_mode,
             variable_importance_mode=variable_importance_mode,
             algorithm=algorithm,
+            memory_saving_mode=memory_saving_mode,
         )
 
 
@@ -388,6 +763,7 @@ class ExtraTreesRegressor(ForestRegressor):
         error_metric_mode="none",
         variable_importance_mode="none",
         algorithm="hist",
+        memory_saving_mode=False,
     ):
         super().__init__(
             n_estimators=n_estimators,
@@ -410,4 +786,5 @@ class ExtraTreesRegressor(ForestRegressor):
             error_metric_mode=error_metric_mode,
             variable_importance_mode=variable_importance_mode,
             algorithm=algorithm,
+            memory_saving_mode=memory_saving_mode,
         )
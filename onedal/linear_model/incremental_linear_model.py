@@ -104,6 +104,26 @@ class BaseIncrementalLinear(BaseLinearRegression):
         self._need_to_finalize = True
         return self
 
+    def _get_cross_products(self):
+        """X^T X and X^T y of the data seen by `partial_fit`.
+
+        Only defined for models without intercept, where they are not
+        extended by a column of ones.
+
+        Returns
+        -------
+        xtx : array of shape (n_features, n_features)
+            Cross-product matrix of the training data.
+
+        xty : array of shape (n_features, n_targets)
+            Cross-products of the training data and the targets.
+        """
+        assert not self.fit_intercept
+        xtx = from_table(self._partial_result.partial_xtx, like=self._outtype)
+        # oneDAL stores the cross-products of each target in a row
+        xty = from_table(self._partial_result.partial_xty, like=self._outtype)
+        return xtx, xty.T
+
     def finalize_fit(self, queue=None):
         """Finalize linear regression from the current `_partial_result`.
 
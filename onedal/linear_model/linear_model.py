@@ -14,9 +14,11 @@
 # limitations under the License.
 # ==============================================================================
 
+import numbers
 from abc import ABCMeta, abstractmethod
 
 import numpy as np
+from sklearn.utils._array_api import get_namespace
 
 from .. import onedal_check_version
 from .._device_offload import supports_queue
@@ -24,7 +26,7 @@ from ..common._backend import bind_default_backend
 from ..common._estimator_checks import _check_is_fitted
 from ..common.hyperparameters import get_hyperparameters
 from ..datatypes import from_table, to_table
-from ..utils.validation import _check_n_features, _num_features
+from ..utils.validation import _check_n_features, _is_csr, _num_features
 
 
 class BaseLinearRegression(metaclass=ABCMeta):
@@ -56,7 +58,9 @@ class BaseLinearRegression(metaclass=ABCMeta):
             "result_option": (intercept + "coefficients"),
         }
         if onedal_check_version(2024, 6, 0):
-            params["alpha"] = self.alpha
+            # a per-target alpha is applied outside of oneDAL, see `fit`
+            alpha = self.alpha if isinstance(self.alpha, numbers.Real) else 0.0
+            params["alpha"] = alpha
 
         return params
 
@@ -90,8 +94,102 @@ class BaseLinearRegression(metaclass=ABCMeta):
         self.intercept_ = intercept_
         self._onedal_model = model
 
+    def _per_target_alpha(self, n_targets):
+        if isinstance(self.alpha, numbers.Real):
+            return None
+        alpha = np.asarray(self.alpha, dtype=np.float64).reshape(-1)
+        if alpha.shape[0] == 1:
+            alpha = np.repeat(alpha, n_targets)
+        elif alpha.shape[0] != n_targets:
+            raise ValueError(
+                f"Number of targets and number of penalties do not correspond: "
+                f"{n_targets} != {alpha.shape[0]}"
+            )
+        return alpha
+
+    @staticmethod
+    def _center_and_rescale(X, y, sample_weight, fit_intercept, xp):
+        # Weighted least squares is the unweighted problem on the rows scaled
+        # by the square root of their weights. Centering with the weighted
+        # means beforehand takes the intercept out of the problem.
+        # The data is copied once, the scaling is done in place on the
+        # centered copy.
+        X_offset = y_offset = None
+        if fit_intercept:
+            if sample_weight is None:
+                X_offset, y_offset = xp.mean(X, axis=0), xp.mean(y, axis=0)
+            else:
+                sw_sum = xp.sum(sample_weight)
+                X_offset = (sample_weight @ X) / sw_sum
+                y_offset = (sample_weight @ y) / sw_sum
+            X, y = X - X_offset, y - y_offset
+
+        if sample_weight is not None:
+            sw_sqrt = xp.reshape(xp.sqrt(sample_weight), (-1, 1))
+            if fit_intercept:
+                X *= sw_sqrt
+                y *= sw_sqrt
+            else:
+                X, y = X * sw_sqrt, y * sw_sqrt
+        return X, y, X_offset, y_offset
+
+    @staticmethod
+    def _csr_cross_products(X, y, sample_weight, fit_intercept):
+        # X^T X and X^T y are computed from the stored entries of X only, the
+        # centering is applied to the products to keep X sparse
+        Xw = X if sample_weight is None else X.multiply(sample_weight[:, None]).tocsr()
+        xtx = (Xw.T @ X).toarray()
+        xty = np.asarray(Xw.T @ y)
+
+        X_offset = y_offset = None
+        if fit_intercept:
+            if sample_weight is None:
+                sw_sum = X.shape[0]
+                y_offset = np.mean(y, axis=0)
+            else:
+                sw_sum = np.sum(sample_weight)
+                y_offset = (sample_weight @ y) / sw_sum
+            X_offset = np.asarray(Xw.sum(axis=0)).reshape(-1) / sw_sum
+            xtx -= sw_sum * np.outer(X_offset, X_offset)
+            xty -= sw_sum * np.outer(X_offset, y_offset)
+        return xtx, xty, X_offset, y_offset
+
+    @staticmethod
+    def _solve_normal_equations(xtx, xty, alpha, xp):
+        # With the eigendecomposition of X^T X, the solutions for every target
+        # and its own alpha are obtained without another factorization.
+        eigvals, eigvecs = xp.linalg.eigh(xtx)
+
+        # eigenvalues within the rounding errors of the decomposition are
+        # zero; without penalty, their directions are dropped as by the
+        # pseudo-inverse, so that alpha=0 gives the minimum norm solution
+        eps = xp.finfo(xtx.dtype).eps
+        cutoff = xtx.shape[0] * eps * xp.max(xp.abs(eigvals))
+        kept = xp.reshape(eigvals > cutoff, (-1, 1)) | xp.reshape(alpha > 0, (1, -1))
+        eigvals = xp.where(eigvals > 0, eigvals, xp.zeros_like(eigvals))
+
+        denom = xp.reshape(eigvals, (-1, 1)) + xp.reshape(alpha, (1, -1))
+        inv = xp.where(
+            kept,
+            1 / xp.where(kept, denom, xp.ones_like(denom)),
+            xp.zeros_like(denom),
+        )
+        return (eigvecs @ (inv * (eigvecs.T @ xty))).T
+
+    def _train(self, X, y, fit_intercept, queue):
+        X_table, y_table = to_table(X, y, queue=queue)
+        params = self._get_onedal_params(X_table.dtype)
+        if not fit_intercept:
+            params["intercept"] = False
+            params["result_option"] = "coefficients"
+
+        hparams = get_hyperparameters("linear_regression", "train")
+        if hparams is not None and not hparams.is_default:
+            return self.train(params, hparams.backend, X_table, y_table)
+        return self.train(params, X_table, y_table)
+
     @supports_queue
-    def fit(self, X, y, queue=None):
+    def fit(self, X, y, sample_weight=None, queue=None):
         """Fit linear model.
 
         Parameters
@@ -102,6 +200,9 @@ class BaseLinearRegression(metaclass=ABCMeta):
         y : array-like of shape (n_samples,) or (n_samples, n_targets)
             Target values. Will be cast to X's dtype if necessary.
 
+        sample_weight : array-like of shape (n_samples,), default=None
+            Non-negative individual weights for each sample.
+
         queue : SyclQueue or None, default=None
             SYCL Queue object for device code execution. Default
             value None causes computation on host.
@@ -114,22 +215,65 @@ class BaseLinearRegression(metaclass=ABCMeta):
 
         self.n_features_in_ = _num_features(X, fallback_1d=True)
 
-        X_table, y_table = to_table(X, y, queue=queue)
-        params = self._get_onedal_params(X_table.dtype)
-
-        hparams = get_hyperparameters("linear_regression", "train")
-        if hparams is not None and not hparams.is_default:
-            result = self.train(params, hparams.backend, X_table, y_table)
+        n_targets = 1 if y.ndim == 1 else y.shape[1]
+        per_target_alpha = self._per_target_alpha(n_targets)
+        # multi-target training has bugs in some uncommon cases in older oneDAL
+        # versions, which sklearnex gates for its multi-output problems
+        onedal_multi_target = n_targets == 1 or onedal_check_version(2025, 0, 1)
+
+        # oneDAL trains on dense data only
+        is_csr = _is_csr(X)
+        if (
+            sample_weight is None
+            and per_target_alpha is None
+            and onedal_multi_target
+            and not is_csr
+        ):
+            result = self._train(X, y, self.fit_intercept, queue)
+            self._onedal_model = result.model
+
+            packed_coefficients = from_table(result.model.packed_coefficients, like=X)
+            self.coef_, self.intercept_ = (
+                packed_coefficients[:, 1:],
+                packed_coefficients[:, 0],
+            )
+            return self
+
+        if is_csr:
+            xp, _ = get_namespace(y, sample_weight)
         else:
-            result = self.train(params, X_table, y_table)
-
-        self._onedal_model = result.model
+            xp, _ = get_namespace(X, y, sample_weight)
+        y_2d = xp.astype(xp.reshape(y, (-1, 1)) if y.ndim == 1 else y, X.dtype)
+        if sample_weight is not None:
+            sample_weight = xp.astype(sample_weight, X.dtype)
+        alpha = per_target_alpha
+        if alpha is None:
+            alpha = np.full(n_targets, self.alpha)
+        alpha = xp.asarray(alpha, dtype=X.dtype, device=getattr(X, "device", None))
+
+        if is_csr:
+            xtx, xty, X_offset, y_offset = self._csr_cross_products(
+                X, y_2d, sample_weight, self.fit_intercept
+            )
+            coef = self._solve_normal_equations(xtx, xty, alpha, xp)
+        else:
+            X, y_2d, X_offset, y_offset = self._center_and_rescale(
+                X, y_2d, sample_weight, self.fit_intercept, xp
+            )
+            if per_target_alpha is None and onedal_multi_target:
+                result = self._train(X, y_2d, False, queue)
+                coef = from_table(result.model.packed_coefficients, like=X)[:, 1:]
+            else:
+                # X^T X and X^T y of all targets come from one pass over X
+                xtx, xty = X.T @ X, X.T @ y_2d
+                coef = self._solve_normal_equations(xtx, xty, alpha, xp)
 
-        packed_coefficients = from_table(result.model.packed_coefficients, like=X)
-        self.coef_, self.intercept_ = (
-            packed_coefficients[:, 1:],
-            packed_coefficients[:, 0],
-        )
+        if self.fit_intercept:
+            intercept = y_offset - X_offset @ coef.T
+        else:
+            intercept = xp.zeros_like(coef[:, 0])
+        self._create_model(coef, intercept, xp)
+        self.intercept_ = intercept
 
         return self
 
@@ -156,6 +300,13 @@ class BaseLinearRegression(metaclass=ABCMeta):
 
         _check_n_features(self, X, False)
 
+        if _is_csr(X):
+            # oneDAL infers on dense data only, a sparse product keeps X sparse
+            y = np.asarray(X @ self.coef_.T)
+            if self.fit_intercept:
+                y = y + np.reshape(self.intercept_, (1, -1))
+            return y.astype(X.dtype, copy=False)
+
         X_table = to_table(X, queue=queue)
         params = self._get_onedal_params(X_table.dtype)
         result = self.infer(params, self._onedal_model, X_table)
@@ -14,18 +14,53 @@
 # limitations under the License.
 # ==============================================================================
 
+import warnings
 from abc import ABCMeta, abstractmethod
+from math import sqrt
 
 import numpy as np
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.utils._array_api import get_namespace
 
 from .. import onedal_check_version
-from .._device_offload import supports_queue
+from .._device_offload import _transfer_to_host, supports_queue
 from ..common._backend import bind_default_backend
 from ..common._estimator_checks import _check_is_fitted
 from ..datatypes import from_table, to_table
 from ..utils.validation import _check_n_features, _is_csr, _num_features
 
 
+def _conjugate_gradient(hessp, grad, xp, max_iter=200):
+    # Newton step -H^-1 grad, only solved as accurately as the gradient is
+    # small, as in the Newton-CG method of scikit-learn. Scalars stay in the
+    # namespace of the data, only the two stopping criteria are read on host
+    # once per iteration.
+    grad_norm = float(xp.sum(xp.abs(grad)))
+    tol = min(0.5, sqrt(grad_norm)) * grad_norm
+    step = xp.zeros_like(grad)
+    residual = -grad
+    direction = residual
+    rr = xp.sum(residual * residual)
+    for n_iter in range(1, max_iter + 1):
+        hess_direction = hessp(direction)
+        curvature = xp.sum(direction * hess_direction)
+        alpha = rr / curvature
+        next_residual = residual - alpha * hess_direction
+        _, (criteria,) = _transfer_to_host(
+            xp.stack([curvature, xp.sum(xp.abs(next_residual))])
+        )
+        if criteria[0] <= 0:
+            break
+        step = step + alpha * direction
+        residual = next_residual
+        if criteria[1] <= tol:
+            break
+        rr_next = xp.sum(residual * residual)
+        direction = residual + (rr_next / rr) * direction
+        rr = rr_next
+    return step, n_iter
+
+
 class LogisticRegression(metaclass=ABCMeta):
 
     def __init__(
@@ -62,16 +97,18 @@ class LogisticRegression(metaclass=ABCMeta):
             "tol": self.tol,
             "max_iter": self.max_iter,
             "C": self.C,
-            "optimizer": self.solver,
+            # Newton-CG is the only optimizer of oneDAL. The objective is
+            # strictly convex, so it finds the solution of the other solvers.
+            "optimizer": "newton-cg",
             "result_option": (
-                intercept
-                + "coefficients|iterations_count"
-                + ("|inner_iterations_count" if self.solver == "newton-cg" else "")
+                intercept + "coefficients|iterations_count|inner_iterations_count"
             ),
         }
 
     @supports_queue
-    def fit(self, X, y, queue=None):
+    def fit(self, X, y, sample_weight=None, queue=None):
+        if sample_weight is not None:
+            return self._fit_weighted(X, y, sample_weight)
 
         is_csr = _is_csr(X)
 
@@ -87,7 +124,7 @@ class LogisticRegression(metaclass=ABCMeta):
         self.n_iter_ = np.array([result.iterations_count])
 
         # _n_inner_iter is the total number of cg-solver iterations
-        if onedal_check_version(2024, 3, 0) and self.solver == "newton-cg":
+        if onedal_check_version(2024, 3, 0):
             self._n_inner_iter = result.inner_iterations_count
 
         coeff = from_table(result.model.packed_coefficients, like=X)
@@ -95,6 +132,88 @@ class LogisticRegression(metaclass=ABCMeta):
 
         return self
 
+    def _fit_weighted(self, X, y, sample_weight):
+        # The objective of oneDAL has no sample weights, so weighted problems
+        # are solved with the same Newton-CG method here, with operations of
+        # the array namespace of the data, which keep them on its device. The
+        # objective is scaled as in scikit-learn, for 'tol' to match.
+        xp, _ = get_namespace(X, y, sample_weight)
+        self.n_features_in_ = n_features = _num_features(X, fallback_1d=True)
+        device = getattr(X, "device", None)
+
+        y = xp.reshape(xp.asarray(y, dtype=X.dtype, device=device), (-1,))
+        sample_weight = xp.reshape(
+            xp.asarray(sample_weight, dtype=X.dtype, device=device), (-1,)
+        )
+        sw_sum = float(xp.sum(sample_weight))
+        sample_weight = sample_weight / sw_sum
+        l2 = 1.0 / (self.C * sw_sum)
+        n_params = n_features + int(self.fit_intercept)
+
+        def linear(w):
+            z = X @ w[:n_features]
+            return z + w[n_features] if self.fit_intercept else z
+
+        def evaluate(w):
+            z = linear(w)
+            # log(1 + exp(z)) and 1 / (1 + exp(-z)) without overflow
+            e = xp.exp(-xp.abs(z))
+            loss = xp.sum(sample_weight * (xp.where(z > 0, z, 0.0) + xp.log1p(e) - y * z))
+            p = xp.where(z > 0, 1.0 / (1.0 + e), e / (1.0 + e))
+            r = sample_weight * (p - y)
+            grad = xp.zeros((n_params,), dtype=X.dtype, device=device)
+            grad[:n_features] = X.T @ r + l2 * w[:n_features]
+            if self.fit_intercept:
+                grad[n_features] = xp.sum(r)
+            loss = float(loss) + 0.5 * l2 * float(xp.sum(w[:n_features] ** 2))
+            return loss, grad, sample_weight * p * (1.0 - p)
+
+        w = xp.zeros((n_params,), dtype=X.dtype, device=device)
+        loss, grad, curvature = evaluate(w)
+        n_inner_iter = 0
+        for n_iter in range(self.max_iter + 1):
+            if float(xp.max(xp.abs(grad))) <= self.tol:
+                break
+            if n_iter == self.max_iter:
+                warnings.warn(
+                    "newton-cg failed to converge. Increase the number of iterations.",
+                    ConvergenceWarning,
+                )
+                break
+
+            def hessp(v):
+                u = curvature * linear(v)
+                out = xp.zeros((n_params,), dtype=X.dtype, device=device)
+                out[:n_features] = X.T @ u + l2 * v[:n_features]
+                if self.fit_intercept:
+                    out[n_features] = xp.sum(u)
+                return out
+
+            step, n_cg = _conjugate_gradient(hessp, grad, xp)
+            n_inner_iter += n_cg
+            # backtracking line search with the Armijo condition
+            slope = float(xp.sum(grad * step))
+            t = 1.0
+            while True:
+                new_loss, new_grad, new_curvature = evaluate(w + t * step)
+                if new_loss <= loss + 1e-4 * t * slope or t < 1e-10:
+                    break
+                t *= 0.5
+            w = w + t * step
+            loss, grad, curvature = new_loss, new_grad, new_curvature
+
+        self.n_iter_ = np.array([n_iter])
+        self._n_inner_iter = n_inner_iter
+        coef = xp.reshape(w[:n_features], (1, -1))
+        intercept = (
+            w[n_features:]
+            if self.fit_intercept
+            else xp.zeros((1,), dtype=X.dtype, device=device)
+        )
+        self._create_model(coef, intercept, xp)
+        self.intercept_ = intercept
+        return self
+
     def _create_model(self, coef_, intercept_, xp):
         model = self.model()
         # Packed coefficients have shape (1, n_features_ + 1), the first element is a placeholder for bias.
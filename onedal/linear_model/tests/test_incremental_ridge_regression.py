@@ -169,3 +169,19 @@ if daal_check_version((2024, "P", 600)):
 
         assert_allclose(model.coef_, model_loaded.coef_, atol=1e-6)
         assert_allclose(model.intercept_, model_loaded.intercept_, atol=1e-6)
+
+    @pytest.mark.parametrize("queue", get_queues())
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_cross_products(queue, dtype):
+        gen = np.random.default_rng(seed=42)
+        X = gen.random(size=(30, 4), dtype=dtype)
+        y = gen.random(size=(30, 2), dtype=dtype)
+
+        model = IncrementalRidge(fit_intercept=False, alpha=0.0)
+        for X_batch, y_batch in zip(np.array_split(X, 3), np.array_split(y, 3)):
+            model.partial_fit(X_batch, y_batch, queue=queue)
+        xtx, xty = model._get_cross_products()
+
+        tol = 1e-5 if dtype == np.float32 else 1e-12
+        assert_allclose(xtx, X.T @ X, rtol=tol)
+        assert_allclose(xty, X.T @ y, rtol=tol)
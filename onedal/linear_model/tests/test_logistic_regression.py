@@ -66,6 +66,28 @@ if daal_check_version((2024, "P", 1)):
 
         assert_array_equal(expected, result)
 
+    @pytest.mark.parametrize("queue", get_queues("gpu"))
+    @pytest.mark.parametrize("fit_intercept", [True, False])
+    @pytest.mark.parametrize("solver", ["newton-cg", "lbfgs"])
+    def test_sample_weight(queue, fit_intercept, solver):
+        from sklearn.linear_model import LogisticRegression as _sklearn_LogisticRegression
+
+        X, y = make_classification(n_samples=500, n_features=10, random_state=0)
+        sample_weight = np.random.default_rng(0).uniform(0.0, 3.0, size=y.shape[0])
+        model = LogisticRegression(fit_intercept=fit_intercept, solver=solver, tol=1e-8)
+        model.fit(X, y.astype(np.float64), sample_weight, queue=queue)
+        expected = _sklearn_LogisticRegression(
+            fit_intercept=fit_intercept, tol=1e-10, max_iter=10_000
+        ).fit(X, y, sample_weight=sample_weight)
+
+        assert_allclose(model.coef_, expected.coef_, atol=1e-5)
+        assert_allclose(model.intercept_, expected.intercept_, atol=1e-5)
+        assert_allclose(
+            model.predict_proba(X, queue=queue).ravel(),
+            expected.predict_proba(X)[:, 1],
+            atol=1e-5,
+        )
+
 
 if daal_check_version((2024, "P", 700)):
 
@@ -93,3 +93,36 @@ if daal_check_version((2024, "P", 600)):
 
         tol = 2e-4 if res.dtype == np.float32 else 1e-7
         assert_allclose(gtr, res, rtol=tol)
+
+    @pytest.mark.parametrize("queue", get_queues())
+    @pytest.mark.parametrize("fit_intercept", [True, False])
+    def test_sample_weight(queue, fit_intercept):
+        gen = np.random.default_rng(seed=42)
+        X = gen.random(size=(100, 6))
+        y = gen.random(size=(100, 2))
+        sample_weight = gen.integers(0, 3, size=100).astype(np.float64)
+
+        model = Ridge(fit_intercept=fit_intercept, alpha=0.5)
+        model.fit(X, y, sample_weight, queue=queue)
+
+        # weights of integer values are equivalent to repeated samples
+        expected = Ridge(fit_intercept=fit_intercept, alpha=0.5)
+        repeats = sample_weight.astype(int)
+        expected.fit(np.repeat(X, repeats, axis=0), np.repeat(y, repeats, axis=0))
+
+        assert_allclose(model.coef_, expected.coef_, rtol=1e-6, atol=1e-10)
+        assert_allclose(model.intercept_, expected.intercept_, rtol=1e-6, atol=1e-10)
+
+    @pytest.mark.parametrize("queue", get_queues())
+    def test_per_target_alpha(queue):
+        gen = np.random.default_rng(seed=42)
+        X = gen.random(size=(100, 6))
+        y = gen.random(size=(100, 3))
+        alpha = np.array([0.1, 1.0, 10.0])
+
+        model = Ridge(fit_intercept=True, alpha=alpha).fit(X, y, queue=queue)
+        for i in range(y.shape[1]):
+            expected = Ridge(fit_intercept=True, alpha=alpha[i])
+            expected.fit(X, y[:, i], queue=queue)
+            assert_allclose(model.coef_[i], expected.coef_[0], rtol=1e-6)
+            assert_allclose(model.intercept_[i], expected.intercept_[0], rtol=1e-6)
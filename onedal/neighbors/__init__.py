@@ -14,6 +14,14 @@
 # limitations under the License.
 # ===============================================================================
 
+from .approximate_neighbors import ApproximateNearestNeighbors
+from .index import NeighborsIndex
 from .neighbors import KNeighborsClassifier, KNeighborsRegressor, NearestNeighbors
 
-__all__ = ["KNeighborsClassifier", "KNeighborsRegressor", "NearestNeighbors"]
+__all__ = [
+    "ApproximateNearestNeighbors",
+    "KNeighborsClassifier",
+    "KNeighborsRegressor",
+    "NearestNeighbors",
+    "NeighborsIndex",
+]
@@ -0,0 +1,181 @@
+# ==============================================================================
+# Copyright contributors to the oneDAL project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import numpy as np
+
+from .._device_offload import _transfer_to_host, supports_queue
+from ..cluster import KMeans
+from .neighbors import NearestNeighbors
+
+
+def _normalize_rows(X):
+    norms = np.sqrt(np.einsum("ij,ij->i", X, X))
+    norms[norms == 0.0] = 1.0
+    return X / norms[:, None]
+
+
+class ApproximateNearestNeighbors:
+    """Inverted file (IVF-flat) approximate nearest neighbors search.
+
+    The training data is partitioned into ``n_lists`` inverted lists by
+    oneDAL KMeans. A query is compared exactly, with the oneDAL brute
+    force search, only against the points of the ``n_probes`` lists whose
+    centroids are the closest to it.
+    """
+
+    def __init__(
+        self,
+        n_neighbors=5,
+        *,
+        n_lists=None,
+        n_probes=8,
+        metric="euclidean",
+        max_iter=20,
+        random_state=None,
+    ):
+        self.n_neighbors = n_neighbors
+        self.n_lists = n_lists
+        self.n_probes = n_probes
+        self.metric = metric
+        self.max_iter = max_iter
+        self.random_state = random_state
+
+    def _preprocess(self, X):
+        _, (X,) = _transfer_to_host(X)
+        # cosine distances are monotonic in euclidean distances of unit vectors
+        return _normalize_rows(X) if self.metric == "cosine" else X
+
+    @supports_queue
+    def fit(self, X, queue=None):
+        X = self._preprocess(X)
+        n_samples = X.shape[0]
+        n_lists = self.n_lists
+        if n_lists is None:
+            n_lists = int(np.sqrt(n_samples))
+        n_lists = max(1, min(n_lists, n_samples))
+
+        kmeans = KMeans(
+            n_clusters=n_lists,
+            n_init=1,
+            max_iter=self.max_iter,
+            random_state=self.random_state,
+        ).fit(X, queue=queue)
+        _, (centroids,) = _transfer_to_host(kmeans.cluster_centers_)
+        centroids = np.ascontiguousarray(centroids, dtype=X.dtype)
+        self._coarse = NearestNeighbors(algorithm="brute", metric="euclidean")
+        self._coarse.fit(centroids, queue=queue)
+
+        # assign points to the list probed first for them, so that a point
+        # is always found when querying with it
+        labels = self._coarse.kneighbors(
+            X, n_neighbors=1, return_distance=False, queue=queue
+        )
+        _, (labels,) = _transfer_to_host(labels)
+        labels = labels.ravel().astype(np.intp)
+
+        order = np.argsort(labels, kind="stable")
+        self.list_offsets_ = np.zeros(n_lists + 1, dtype=np.intp)
+        np.cumsum(np.bincount(labels, minlength=n_lists), out=self.list_offsets_[1:])
+        self.list_indices_ = order
+        self.cluster_centers_ = centroids
+        self.n_samples_fit_ = n_samples
+        self.n_features_in_ = X.shape[1]
+
+        # every list searches a contiguous slice of the reordered data
+        self._fit_X = np.ascontiguousarray(X[order])
+        self._lists = []
+        for start, stop in zip(self.list_offsets_[:-1], self.list_offsets_[1:]):
+            index = None
+            if stop > start:
+                index = NearestNeighbors(algorithm="brute", metric="euclidean")
+                index.fit(self._fit_X[start:stop], queue=queue)
+            self._lists.append(index)
+        return self
+
+    def _search(self, X, n_neighbors, n_probes, queue=None):
+        n_queries = X.shape[0]
+        probes = self._coarse.kneighbors(
+            X, n_neighbors=n_probes, return_distance=False, queue=queue
+        )
+        _, (probes,) = _transfer_to_host(probes)
+        probes = probes.astype(np.intp)
+
+        # candidates of probe j of a query are stored in its j-th slot
+        cand_dist = np.full((n_queries, n_probes * n_neighbors), np.inf, dtype=X.dtype)
+        cand_ind = np.full((n_queries, n_probes * n_neighbors), -1, dtype=np.intp)
+
+        flat_probes = probes.ravel()
+        flat_order = np.argsort(flat_probes, kind="stable")
+        bounds = np.searchsorted(flat_probes[flat_order], np.arange(len(self._lists) + 1))
+        for list_id, index in enumerate(self._lists):
+            pairs = flat_order[bounds[list_id] : bounds[list_id + 1]]
+            if index is None or len(pairs) == 0:
+                continue
+            rows, slots = np.divmod(pairs, n_probes)
+            start = self.list_offsets_[list_id]
+            k = min(n_neighbors, self.list_offsets_[list_id + 1] - start)
+
+            dist, ind = index.kneighbors(X[rows], n_neighbors=k, queue=queue)
+            _, (dist, ind) = _transfer_to_host(dist, ind)
+            columns = slots[:, None] * n_neighbors + np.arange(k)
+            cand_dist[rows[:, None], columns] = dist
+            cand_ind[rows[:, None], columns] = self.list_indices_[start + ind]
+
+        if cand_dist.shape[1] > n_neighbors:
+            top = np.argpartition(cand_dist, n_neighbors - 1, axis=1)[:, :n_neighbors]
+            cand_dist = np.take_along_axis(cand_dist, top, axis=1)
+            cand_ind = np.take_along_axis(cand_ind, top, axis=1)
+        order = np.argsort(cand_dist, axis=1, kind="stable")
+        return (
+            np.take_along_axis(cand_dist, order, axis=1),
+            np.take_along_axis(cand_ind, order, axis=1),
+        )
+
+    @supports_queue
+    def kneighbors(self, X=None, n_neighbors=None, n_probes=None, queue=None):
+        """Approximate nearest neighbors of the queries.
+
+        Queries whose probed lists hold fewer than ``n_neighbors`` points
+        are searched again with twice as many probes, up to all lists, so
+        that every query gets ``n_neighbors`` results.
+
+        Returns
+        -------
+        distances, indices : ndarray of shape (n_queries, n_neighbors)
+            Host arrays of distances and indices in the training data.
+        """
+        n_neighbors = self.n_neighbors if n_neighbors is None else n_neighbors
+        n_probes = self.n_probes if n_probes is None else n_probes
+        n_lists = len(self._lists)
+        X = (
+            self._fit_X[np.argsort(self.list_indices_)]
+            if X is None
+            else self._preprocess(X)
+        )
+
+        n_probes = min(n_probes, n_lists)
+        distances, indices = self._search(X, n_neighbors, n_probes, queue=queue)
+        pending = np.flatnonzero(indices[:, -1] < 0)
+        while len(pending) and n_probes < n_lists:
+            n_probes = min(2 * n_probes, n_lists)
+            dist, ind = self._search(X[pending], n_neighbors, n_probes, queue=queue)
+            distances[pending], indices[pending] = dist, ind
+            pending = pending[ind[:, -1] < 0]
+
+        if self.metric == "cosine":
+            # euclidean distances of unit vectors to cosine distances
+            distances = np.square(distances) / 2
+        return distances, indices
@@ -0,0 +1,185 @@
+# ==============================================================================
+# Copyright contributors to the oneDAL project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import json
+import os
+
+import numpy as np
+from scipy import sparse as sp
+
+from .._device_offload import _transfer_to_host
+from ..utils.validation import _is_csr
+
+
+class NeighborsIndex:
+    """Search index of a fitted onedal nearest neighbors estimator.
+
+    Holds the training data, the oneDAL kNN model (kd-tree or brute
+    force) and the precomputed squared row norms used by the sparse
+    brute force search. It can be saved to a directory and loaded back
+    with the training data and norms memory-mapped from ``.npy`` files,
+    so that several processes can share them. The oneDAL model is not
+    saved: it embeds its training data, so it is trained again on the
+    mapped data when the index is set on an estimator.
+
+    Parameters
+    ----------
+    fit_X : ndarray or CSR matrix of shape (n_samples, n_features)
+        Training data on host.
+    fit_method : {'brute', 'kd_tree'}
+        Search method of the index.
+    metric : str
+        Effective metric of the search.
+    p : float
+        Power parameter of the Minkowski metric.
+    model : oneDAL kNN model, default=None
+        Trained oneDAL model, None when searching in CSR data or when
+        the index was loaded.
+    fit_norms : ndarray of shape (n_samples,), default=None
+        Squared row norms of ``fit_X``, if computed.
+    """
+
+    _version = 2
+
+    def __init__(self, fit_X, fit_method, metric, p, model=None, fit_norms=None):
+        self.fit_X = fit_X
+        self.fit_method = fit_method
+        self.metric = metric
+        self.p = p
+        self.model = model
+        self.fit_norms = fit_norms
+
+    @classmethod
+    def from_estimator(cls, estimator):
+        """Create the index of a fitted onedal neighbors estimator."""
+        _, (fit_X, fit_norms) = _transfer_to_host(
+            estimator._fit_X, getattr(estimator, "_fit_norms", None)
+        )
+        return cls(
+            fit_X,
+            estimator._fit_method,
+            estimator.effective_metric_,
+            (estimator.effective_metric_params_ or {}).get("p", estimator.p),
+            model=estimator._onedal_model,
+            fit_norms=fit_norms,
+        )
+
+    def to_estimator(self, estimator):
+        """Set the index as the fitted state of a onedal neighbors estimator.
+
+        A missing oneDAL model of dense data is trained on ``fit_X`` with
+        the encoded targets ``_y`` of the estimator, if any.
+        """
+        estimator._fit_X = self.fit_X
+        estimator._fit_norms = self.fit_norms
+        estimator._fit_method = self.fit_method
+        if self.model is None and not _is_csr(self.fit_X):
+            y = getattr(estimator, "_y", None)
+            if y is not None:
+                _, (y,) = _transfer_to_host(y)
+                y = np.reshape(y, (-1, 1))
+            self.model = estimator._onedal_fit(self.fit_X, y)
+        estimator._onedal_model = self.model
+        estimator._tree = None
+        estimator.effective_metric_ = self.metric
+        estimator.effective_metric_params_ = {"p": self.p}
+        estimator.n_samples_fit_ = self.fit_X.shape[0]
+        estimator.n_features_in_ = self.fit_X.shape[1]
+        return estimator
+
+    def save(self, path):
+        """Save the index to a directory, created if it does not exist.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Directory where the index files are written.
+        """
+        os.makedirs(path, exist_ok=True)
+        meta = {
+            "version": self._version,
+            "fit_method": self.fit_method,
+            "metric": self.metric,
+            "p": self.p,
+            "shape": list(self.fit_X.shape),
+            "sparse_format": None,
+        }
+
+        if _is_csr(self.fit_X):
+            meta["sparse_format"] = type(self.fit_X).__name__
+            for name in ("data", "indices", "indptr"):
+                np.save(
+                    os.path.join(path, f"fit_X_{name}.npy"), getattr(self.fit_X, name)
+                )
+        else:
+            np.save(os.path.join(path, "fit_X.npy"), np.asarray(self.fit_X))
+
+        if self.fit_norms is not None:
+            np.save(os.path.join(path, "fit_norms.npy"), self.fit_norms)
+
+        with open(os.path.join(path, "index.json"), "w") as f:
+            json.dump(meta, f)
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """Load an index saved with :meth:`save`.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Directory where the index was saved.
+        mmap_mode : {None, 'r', 'c'}, default='r'
+            Memory-mapping mode of the training data and norms, see
+            :func:`numpy.load`.
+
+        Returns
+        -------
+        index : NeighborsIndex
+            Loaded index.
+        """
+        with open(os.path.join(path, "index.json")) as f:
+            meta = json.load(f)
+        if meta["version"] != cls._version:
+            raise ValueError(
+                f"Unsupported neighbors index version {meta['version']}, "
+                f"expected {cls._version}."
+            )
+
+        def load_array(name):
+            return np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+
+        if meta["sparse_format"] is not None:
+            fit_X = getattr(sp, meta["sparse_format"])(
+                tuple(
+                    load_array(f"fit_X_{name}") for name in ("data", "indices", "indptr")
+                ),
+                shape=tuple(meta["shape"]),
+                copy=False,
+            )
+        else:
+            fit_X = load_array("fit_X")
+
+        fit_norms = None
+        if os.path.exists(os.path.join(path, "fit_norms.npy")):
+            fit_norms = load_array("fit_norms")
+
+        return cls(
+            fit_X,
+            meta["fit_method"],
+            meta["metric"],
+            meta["p"],
+            fit_norms=fit_norms,
+        )
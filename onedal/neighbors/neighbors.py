@@ -16,11 +16,21 @@
 
 from abc import ABCMeta, abstractmethod
 
-from .._device_offload import supports_queue
+import numpy as np
+from sklearn.utils._chunking import get_chunk_n_rows
+
+from .._device_offload import _transfer_to_host, supports_queue
 from ..common._backend import bind_default_backend
 from ..common._estimator_checks import _check_is_fitted
 from ..datatypes import from_table, to_table
 from ..utils import _sycl_queue_manager as QM
+from ..utils.validation import _is_csr
+
+
+def _row_norms_squared(X):
+    if _is_csr(X):
+        return np.asarray(X.multiply(X).sum(axis=1)).ravel()
+    return np.einsum("ij,ij->i", X, X)
 
 
 class NeighborsBase(metaclass=ABCMeta):
@@ -113,7 +123,15 @@ class NeighborsBase(metaclass=ABCMeta):
             self.algorithm, self.n_samples_fit_, self.n_features_in_
         )
 
-        result = self._onedal_fit(X, y)
+        self._fit_norms = None
+        if _is_csr(X):
+            # oneDAL kNN has no CSR method, the brute force search is done
+            # in _kneighbors_sparse directly from the training data
+            self._fit_method = "brute"
+            self._fit_norms = _row_norms_squared(X)
+            result = None
+        else:
+            result = self._onedal_fit(X, y)
 
         self._onedal_model = result
         result = self
@@ -137,15 +155,150 @@ class NeighborsBase(metaclass=ABCMeta):
         if X is None:
             X = self._fit_X
 
-        params = self._get_onedal_params(X, n_neighbors=n_neighbors)
-        prediction_results = self._onedal_predict(self._onedal_model, X, params)
-        distances = from_table(prediction_results.distances, like=X)
-        indices = from_table(prediction_results.indices, like=X)
+        if _is_csr(X) or _is_csr(self._fit_X):
+            distances, indices = self._kneighbors_sparse(X, n_neighbors)
+        else:
+            params = self._get_onedal_params(X, n_neighbors=n_neighbors)
+            prediction_results = self._onedal_predict(self._onedal_model, X, params)
+            distances = from_table(prediction_results.distances, like=X)
+            indices = from_table(prediction_results.indices, like=X)
 
         if return_distance:
             return distances, indices
         return indices
 
+    def _kneighbors_sparse(self, X, n_neighbors):
+        """Brute force kNN search for CSR training and/or query data.
+
+        Euclidean and cosine distances are derived from blocks of sparse
+        dot products, sparse-dense or sparse-sparse, so neither side is
+        densified. Only a block of ``(batch_size, n_samples_fit)`` dense
+        distances is held in memory at a time.
+        """
+        _, (fit_X,) = _transfer_to_host(self._fit_X)
+        n_queries = X.shape[0]
+        n_samples_fit = fit_X.shape[0]
+        dtype = np.result_type(X.dtype, fit_X.dtype)
+
+        euclidean = self.effective_metric_ == "euclidean" or (
+            self.effective_metric_ == "minkowski" and self.p == 2
+        )
+        if not euclidean and self.effective_metric_ != "cosine":
+            raise ValueError(
+                f"Metric '{self.effective_metric_}' is not supported for sparse input."
+            )
+
+        if getattr(self, "_fit_norms", None) is None:
+            self._fit_norms = _row_norms_squared(fit_X)
+        fit_norms = self._fit_norms
+        if not euclidean:
+            fit_norms = np.sqrt(fit_norms)
+            fit_norms[fit_norms == 0.0] = 1.0
+
+        distances = np.empty((n_queries, n_neighbors), dtype=dtype)
+        indices = np.empty((n_queries, n_neighbors), dtype=np.intp)
+
+        batch_size = max(1, (1 << 23) // n_samples_fit)
+        for start in range(0, n_queries, batch_size):
+            X_batch = X[start : start + batch_size]
+            dist = X_batch @ fit_X.T
+            dist = dist.toarray() if hasattr(dist, "toarray") else np.asarray(dist)
+
+            norms = _row_norms_squared(X_batch)
+            if euclidean:
+                dist *= -2.0
+                dist += norms[:, None]
+                dist += fit_norms[None, :]
+                np.maximum(dist, 0.0, out=dist)
+            else:
+                norms = np.sqrt(norms)
+                norms[norms == 0.0] = 1.0
+                dist /= norms[:, None]
+                dist /= fit_norms[None, :]
+                np.subtract(1.0, dist, out=dist)
+
+            neigh_ind = np.argpartition(dist, n_neighbors - 1, axis=1)[:, :n_neighbors]
+            neigh_dist = np.take_along_axis(dist, neigh_ind, axis=1)
+            order = np.argsort(neigh_dist, axis=1)
+
+            stop = start + X_batch.shape[0]
+            indices[start:stop] = np.take_along_axis(neigh_ind, order, axis=1)
+            distances[start:stop] = np.take_along_axis(neigh_dist, order, axis=1)
+
+        if euclidean:
+            np.sqrt(distances, out=distances)
+
+        return distances, indices
+
+    def _radius_neighbors(self, X=None, radius=None):
+        """Raw radius search on top of the oneDAL kNN search backend.
+
+        oneDAL has no native radius query, so the k-nearest search is
+        repeated with a doubling number of neighbors, but only for the
+        query rows whose k results all fall inside of the radius. Rows
+        are resolved as soon as one of their results is outside of it,
+        as any neighbor that was not returned is at least as far as the
+        farthest one which was. The pending rows are queried in blocks
+        bounded by the ``working_memory`` option of scikit-learn, so that
+        a large radius doesn't lead to a block of results for all pairs
+        of query and training samples.
+
+        Query-is-train self-exclusion and sorting of the kd_tree results
+        are handled in the sklearnex layer.
+
+        Returns host numpy arrays in CSR layout: ``distances`` and
+        ``indices`` of all neighbors concatenated row after row, and
+        ``offsets`` of shape (n_queries + 1,) delimiting the rows.
+        """
+        _check_is_fitted(self)
+
+        if radius is None:
+            radius = self.radius
+
+        if X is None:
+            X = self._fit_X
+
+        n_queries = X.shape[0]
+        n_samples_fit = self.n_samples_fit_
+        n_neighbors = min(max(self.n_neighbors or 1, 1), n_samples_fit)
+
+        pending = np.arange(n_queries)
+        rows, distances_list, indices_list = [], [], []
+        while pending.shape[0] > 0:
+            # raw distances and indices, and the mask of every row of a block
+            batch_size = get_chunk_n_rows(
+                3 * 8 * n_neighbors, max_n_rows=pending.shape[0]
+            )
+            still_pending = []
+            for start in range(0, pending.shape[0], batch_size):
+                batch = pending[start : start + batch_size]
+                X_batch = X if batch.shape[0] == n_queries else X[batch]
+                distances, indices = self._kneighbors(X_batch, n_neighbors)
+
+                within = distances <= radius
+                if n_neighbors < n_samples_fit:
+                    done = ~np.all(within, axis=1)
+                else:
+                    done = np.ones(batch.shape[0], dtype=bool)
+                row_idx, col_idx = np.nonzero(within & done[:, None])
+
+                rows.append(batch[row_idx])
+                distances_list.append(distances[row_idx, col_idx])
+                indices_list.append(indices[row_idx, col_idx])
+                still_pending.append(batch[~done])
+
+            pending = np.concatenate(still_pending)
+            n_neighbors = min(2 * n_neighbors, n_samples_fit)
+
+        rows = np.concatenate(rows)
+        order = np.argsort(rows, kind="stable")
+        offsets = np.zeros(n_queries + 1, dtype=np.intp)
+        np.cumsum(np.bincount(rows, minlength=n_queries), out=offsets[1:])
+
+        distances = np.concatenate(distances_list)[order]
+        indices = np.concatenate(indices_list)[order]
+        return distances, indices, offsets
+
 
 class KNeighborsClassifier(NeighborsBase):
     def __init__(
@@ -295,6 +448,7 @@ class NearestNeighbors(NeighborsBase):
         self,
         n_neighbors=5,
         *,
+        radius=1.0,
         algorithm="auto",
         p=2,
         metric="minkowski",
@@ -302,6 +456,7 @@ class NearestNeighbors(NeighborsBase):
     ):
         super().__init__(
             n_neighbors=n_neighbors,
+            radius=radius,
             algorithm=algorithm,
             metric=metric,
             p=p,
@@ -334,3 +489,7 @@ class NearestNeighbors(NeighborsBase):
     @supports_queue
     def kneighbors(self, X=None, n_neighbors=None, return_distance=True, queue=None):
         return self._kneighbors(X, n_neighbors, return_distance)
+
+    @supports_queue
+    def radius_neighbors(self, X=None, radius=None, queue=None):
+        return self._radius_neighbors(X, radius)
@@ -14,10 +14,17 @@
 # limitations under the License.
 # ==============================================================================
 
-from .get_tree import get_tree_state_cls, get_tree_state_reg
+from .get_tree import (
+    get_forest_state_cls,
+    get_forest_state_reg,
+    get_tree_state_cls,
+    get_tree_state_reg,
+)
 from .kernel_functions import linear_kernel, poly_kernel, rbf_kernel, sigmoid_kernel
 
 __all__ = [
+    "get_forest_state_cls",
+    "get_forest_state_reg",
     "get_tree_state_cls",
     "get_tree_state_reg",
     "linear_kernel",
@@ -25,3 +25,11 @@ def get_tree_state_cls(model, iTree, n_classes):
 
 def get_tree_state_reg(model, iTree, n_classes):
     return backend.get_tree.regression.get_tree_state(model, iTree, n_classes)
+
+
+def get_forest_state_cls(model, n_classes):
+    return backend.get_tree.classification.get_forest_state(model, n_classes)
+
+
+def get_forest_state_reg(model, n_classes):
+    return backend.get_tree.regression.get_forest_state(model, n_classes)
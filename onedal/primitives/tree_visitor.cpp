@@ -314,10 +314,85 @@ void init_get_tree_state(py::module_& m) {
         .def_readwrite("class_count", &tree_state_t::class_count);
 }
 
+// All trees of a forest in one array of nodes: the nodes of tree i are
+// [tree_offsets[i], tree_offsets[i + 1]) and their child ids are local to it
+template <typename T>
+struct forest_state {
+    py::array_t<skl_tree_node> node_ar;
+    py::array_t<double> value_ar;
+    py::array_t<Py_ssize_t> tree_offsets;
+    py::array_t<Py_ssize_t> max_depths;
+    std::size_t class_count;
+};
+
+template <typename Task>
+void init_get_forest_state(py::module_& m) {
+    using namespace decision_forest;
+    using model_t = model<Task>;
+    using forest_state_t = forest_state<Task>;
+
+    py::class_<forest_state_t>(m, "get_forest_state")
+        .def(py::init([](const model_t& model, std::size_t n_classes) {
+            const std::size_t tree_count = model.get_tree_count();
+            forest_state_t output;
+            output.class_count = n_classes;
+            output.tree_offsets = py::array_t<Py_ssize_t>(tree_count + 1);
+            output.max_depths = py::array_t<Py_ssize_t>(tree_count);
+            auto offsets = output.tree_offsets.mutable_unchecked<1>();
+            auto depths = output.max_depths.mutable_unchecked<1>();
+
+            // First count nodes of every tree
+            std::vector<node_count_visitor<Task>> counts(tree_count);
+            offsets(0) = 0;
+            for (std::size_t i = 0; i < tree_count; ++i) {
+                node_visitor<Task, node_count_visitor<Task>> ncv_decorator{ &counts[i] };
+                model.traverse_depth_first(i, std::move(ncv_decorator));
+                offsets(i + 1) = offsets(i) + static_cast<Py_ssize_t>(counts[i].n_nodes);
+                depths(i) = static_cast<Py_ssize_t>(counts[i].depth);
+            }
+
+            const std::size_t node_count = static_cast<std::size_t>(offsets(tree_count));
+            OVERFLOW_CHECK_BY_MULTIPLICATION(std::size_t, node_count, n_classes);
+            output.node_ar = py::array_t<skl_tree_node>(node_count);
+            output.value_ar = py::array_t<double>(
+                py::array::ShapeContainer({ static_cast<Py_ssize_t>(node_count),
+                                            1,
+                                            static_cast<Py_ssize_t>(n_classes) }));
+            skl_tree_node* node_ar_ptr = output.node_ar.mutable_data();
+            double* value_ar_ptr = output.value_ar.mutable_data();
+
+            // then copy the state of every tree to its slice of the arrays
+            for (std::size_t i = 0; i < tree_count; ++i) {
+                to_sklearn_tree_object_visitor<Task> tsv(counts[i].depth,
+                                                         counts[i].n_nodes,
+                                                         counts[i].n_leaf_nodes,
+                                                         n_classes);
+                node_visitor<Task, decltype(tsv)> tsv_decorator{ &tsv };
+                model.traverse_depth_first(i, std::move(tsv_decorator));
+                std::copy_n(tsv.node_ar_ptr, counts[i].n_nodes, node_ar_ptr + offsets(i));
+                std::copy_n(tsv.value_ar_ptr,
+                            counts[i].n_nodes * n_classes,
+                            value_ar_ptr + offsets(i) * n_classes);
+            }
+            // fractional values, as for a single tree
+            if (output.class_count > 1) {
+                output.value_ar = output.value_ar /
+                                  output.value_ar.attr("sum")("axis"_a = 2, "keepdims"_a = true);
+            }
+            return output;
+        }))
+        .def_readwrite("node_ar", &forest_state_t::node_ar)
+        .def_readwrite("value_ar", &forest_state_t::value_ar)
+        .def_readwrite("tree_offsets", &forest_state_t::tree_offsets)
+        .def_readwrite("max_depths", &forest_state_t::max_depths)
+        .def_readwrite("class_count", &forest_state_t::class_count);
+}
+
 ONEDAL_PY_TYPE2STR(decision_forest::task::classification, "classification");
 ONEDAL_PY_TYPE2STR(decision_forest::task::regression, "regression");
 
 ONEDAL_PY_DECLARE_INSTANTIATOR(init_get_tree_state);
+ONEDAL_PY_DECLARE_INSTANTIATOR(init_get_forest_state);
 
 ONEDAL_PY_INIT_MODULE(get_tree) {
     using namespace decision_forest;
@@ -337,6 +412,7 @@ ONEDAL_PY_INIT_MODULE(get_tree) {
     auto sub = m.def_submodule("get_tree");
 #ifndef ONEDAL_DATA_PARALLEL_SPMD
     ONEDAL_PY_INSTANTIATE(init_get_tree_state, sub, task_list);
+    ONEDAL_PY_INSTANTIATE(init_get_forest_state, sub, task_list);
 #endif
 }
 } // namespace oneapi::dal::python
@@ -21,5 +21,6 @@ __all__ = ["DBSCAN"]
 
 if onedal_check_version(2023, 2, 0):
     from .kmeans import KMeans
+    from .minibatch_kmeans import MiniBatchKMeans
 
-    __all__ += ["KMeans"]
+    __all__ += ["KMeans", "MiniBatchKMeans"]
@@ -21,3 +21,9 @@ from ...common._backend import bind_spmd_backend
 class DBSCAN(DBSCAN_Batch):
     @bind_spmd_backend("dbscan.clustering")
     def compute(self, params, data_table, weights_table): ...
+
+    def _fit_region_queries(self, X, sample_weight, queue=None):
+        raise NotImplementedError(
+            "Only dense data, the 'euclidean' metric and the 'auto' or 'brute' "
+            "algorithms are supported by the SPMD DBSCAN."
+        )
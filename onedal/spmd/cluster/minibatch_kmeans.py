@@ -0,0 +1,34 @@
+# ==============================================================================
+# Copyright 2023 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import numpy as np
+
+from ...cluster import MiniBatchKMeans as MiniBatchKMeans_Batch
+from ...datatypes import from_table, to_table
+from ...utils import _sycl_queue_manager as QM
+from .kmeans import KMeans
+
+
+class MiniBatchKMeans(MiniBatchKMeans_Batch, KMeans):
+    def _allreduce(self, values):
+        # every process contributes a single row, so the column sums of the
+        # distributed table are the sums of the values over the processes
+        values = np.asarray(values, dtype=np.float64)[None, :]
+        bs = self._get_basic_statistics_backend("sum")
+        result = bs._compute_raw(
+            to_table(values, queue=QM.get_global_queue()), to_table(None), np.float64
+        )
+        return from_table(result.sum)[0, :]
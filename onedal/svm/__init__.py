@@ -14,6 +14,6 @@
 # limitations under the License.
 # ==============================================================================
 
-from .svm import SVC, SVR, NuSVC, NuSVR
+from .svm import SVC, SVR, KernelCache, NuSVC, NuSVR
 
-__all__ = ["SVC", "SVR", "NuSVC", "NuSVR"]
+__all__ = ["KernelCache", "SVC", "SVR", "NuSVC", "NuSVR"]
@@ -121,6 +121,30 @@ struct params2desc {
     }
 };
 
+// Same as train_ops, but the GIL is released while oneDAL trains, so that
+// the binary problems of the class pairs can be trained from concurrent
+// Python threads.
+template <typename Policy, typename Input, typename Ops>
+struct train_ops_without_gil {
+    using Task = typename Input::task_t;
+
+    train_ops_without_gil(const Policy& policy, const Input& input, const Ops& ops)
+            : policy(policy),
+              input(input),
+              ops(ops) {}
+
+    template <typename Float, typename Method, typename... Args>
+    auto operator()(const pybind11::dict& params) {
+        auto desc = ops.template operator()<Float, Method, Task, Args...>(params);
+        py::gil_scoped_release release;
+        return dal::train(policy, desc, input);
+    }
+
+    Policy policy;
+    Input input;
+    Ops ops;
+};
+
 template <typename Policy, typename Task>
 void init_train_ops(py::module_& m) {
     m.def("train",
@@ -132,7 +156,9 @@ void init_train_ops(py::module_& m) {
               using namespace dal::svm;
               using input_t = train_input<Task>;
 
-              train_ops ops(policy, input_t{ data, responses, weights }, params2desc{});
+              train_ops_without_gil ops(policy,
+                                        input_t{ data, responses, weights },
+                                        params2desc{});
               return fptype2t{ method2t{ Task{}, kernel2t{ ops } } }(params);
           });
     m.def("train",
@@ -143,7 +169,7 @@ void init_train_ops(py::module_& m) {
               using namespace dal::svm;
               using input_t = train_input<Task>;
 
-              train_ops ops(policy, input_t{ data, responses }, params2desc{});
+              train_ops_without_gil ops(policy, input_t{ data, responses }, params2desc{});
               return fptype2t{ method2t{ Task{}, kernel2t{ ops } } }(params);
           });
 }
@@ -14,14 +14,21 @@
 # limitations under the License.
 # ==============================================================================
 
+import hashlib
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from math import sqrt
 
+import numpy as np
 from scipy import sparse as sp
+from scipy.special import expit
 
 from daal4py.sklearn._utils import is_sparse
 
-from .._device_offload import supports_queue
+from .._device_offload import _transfer_to_host, supports_queue
 from ..common._backend import bind_default_backend
 from ..common._estimator_checks import _check_is_fitted
 from ..datatypes import from_table, to_table
@@ -30,6 +37,218 @@ from ..utils.validation import _is_csr
 _csr_array = sp.csr_array if hasattr(sp, "csr_array") else sp.csr_matrix
 
 
+def _fit_sigmoid(decision, y, sample_weight=None, max_iter=100, eps=1e-5):
+    """Fit the sigmoid ``P(y=1|f) = 1 / (1 + exp(a * f + b))`` of Platt scaling.
+
+    The regularized targets of Platt are fitted with the Newton method with
+    backtracking line search of Lin, Lin and Weng (2007), which is the
+    calibration libsvm does for probability estimates.
+
+    Parameters
+    ----------
+    decision : ndarray of shape (n_samples,)
+        Decision function values.
+
+    y : ndarray of shape (n_samples,)
+        Boolean targets, True for the positive class.
+
+    sample_weight : ndarray of shape (n_samples,), default=None
+        Sample weights of the log loss.
+
+    Returns
+    -------
+    sigmoid : ndarray of shape (2,)
+        Parameters ``a`` and ``b`` of the sigmoid.
+    """
+    f = np.asarray(decision, dtype=np.float64).reshape(-1)
+    y = np.asarray(y, dtype=bool).reshape(-1)
+    w = (
+        np.ones_like(f)
+        if sample_weight is None
+        else np.asarray(sample_weight, dtype=np.float64).reshape(-1)
+    )
+
+    # priors count the samples with their weights
+    prior1 = w[y].sum()
+    prior0 = w.sum() - prior1
+    t = np.where(y, (prior1 + 1.0) / (prior1 + 2.0), 1.0 / (prior0 + 2.0))
+
+    def loss(a, b):
+        fab = a * f + b
+        return np.dot(w, np.logaddexp(0.0, fab) - (1.0 - t) * fab)
+
+    a, b = 0.0, np.log((prior0 + 1.0) / (prior1 + 1.0))
+    fval = loss(a, b)
+    for _ in range(max_iter):
+        p = expit(-(a * f + b))
+        d1 = w * (t - p)
+        d2 = w * p * (1.0 - p)
+        g = np.array([np.dot(d1, f), d1.sum()])
+        if np.all(np.abs(g) < eps):
+            break
+        # the Hessian is regularized as it is singular for separable data
+        h11 = np.dot(d2, f * f) + 1e-12
+        h22 = d2.sum() + 1e-12
+        h21 = np.dot(d2, f)
+        det = h11 * h22 - h21 * h21
+        da = -(h22 * g[0] - h21 * g[1]) / det
+        db = -(-h21 * g[0] + h11 * g[1]) / det
+        gd = g[0] * da + g[1] * db
+
+        step = 1.0
+        while step >= 1e-10:
+            new_fval = loss(a + step * da, b + step * db)
+            if new_fval < fval + 1e-4 * step * gd:
+                break
+            step /= 2.0
+        else:
+            # no sufficient decrease along the Newton direction
+            break
+        a, b, fval = a + step * da, b + step * db, new_fval
+    return np.array([a, b])
+
+
+def _sigmoid_proba(decision, sigmoids):
+    """Class probabilities of the decision values calibrated by ``sigmoids``.
+
+    A single sigmoid gives the probability of the positive class of a binary
+    problem. Otherwise, every column of ``decision`` is a one-vs-rest decision
+    function with its own sigmoid and the probabilities of a sample are
+    normalized to sum to one.
+    """
+    decision = np.asarray(decision, dtype=np.float64).reshape(-1, sigmoids.shape[0])
+    proba = expit(-(decision * sigmoids[:, 0] + sigmoids[:, 1]))
+    if sigmoids.shape[0] == 1:
+        return np.hstack([1.0 - proba, proba])
+
+    n_classes = sigmoids.shape[0]
+    denominator = proba.sum(axis=1, keepdims=True)
+    uniform = np.full_like(proba, 1.0 / n_classes)
+    return np.divide(proba, denominator, out=uniform, where=denominator != 0)
+
+
+# The Gram matrix of a precomputed or callable kernel is factored with a
+# dense eigendecomposition, whose cost grows with the cube of the samples.
+_MAX_CUSTOM_KERNEL_SAMPLES = 4096
+
+
+def _custom_kernel_features(kernel, X, kernel_cache=None, data_key=None):
+    """Factor the Gram matrix of a precomputed or callable kernel on X.
+
+    The Gram matrix K is factored as K = F F^T with a dense
+    eigendecomposition, so that oneDAL solves the same problem with the
+    linear kernel on the rows of F. Eigenvalues at the rounding level of
+    the largest one are dropped. The factorization only solves the problem
+    of a semi-definite kernel: None is returned for indefinite kernels,
+    such as the sigmoid kernel on most data, whose smallest eigenvalue is
+    significantly negative. The result is kept in ``kernel_cache``, if
+    given, under the key of the data.
+    """
+    X = np.asarray(X, dtype=X.dtype if X.dtype.kind == "f" else np.float64)
+    key = None
+    if kernel_cache is not None:
+        key = ("features", data_key or kernel_cache._data_key(X), kernel)
+        cached = kernel_cache._get(key)
+        if cached is not None:
+            return cached[0]
+
+    if kernel == "precomputed":
+        gram = X
+    else:
+        gram = kernel(X, X)
+        gram = np.asarray(gram.toarray() if sp.issparse(gram) else gram, dtype=X.dtype)
+
+    eigvals, eigvecs = np.linalg.eigh((gram + gram.T) / 2)
+    cutoff = max(eigvals[-1], 0.0) * gram.shape[0] * np.finfo(gram.dtype).eps
+    features = None
+    if eigvals[0] >= -cutoff:
+        keep = eigvals > cutoff
+        keep[-1] = True
+        features = eigvecs[:, keep] * np.sqrt(np.maximum(eigvals[keep], 0.0))
+        features = np.ascontiguousarray(features, dtype=X.dtype)
+    if key is not None:
+        kernel_cache._put(key, (features,))
+    return features
+
+
+class KernelCache:
+    """Kernel data shared by the fits of SVMs on the same training data.
+
+    An instance passed as ``kernel_cache`` to several estimators, such as
+    the candidates of a hyperparameter search, keeps for every training set:
+
+    - the factorization of the Gram matrix of a precomputed or callable
+      kernel, which is then computed once for all the fits;
+    - the support vectors of the last fit of a C-SVC with the same kernel,
+      which are the starting working set of the next fit. When only ``C``
+      changes, most support vectors stay the same, and the fit solves
+      problems of about their size instead of one on all the samples.
+
+    Copies of an instance, such as the ones made by ``sklearn.base.clone``,
+    share its entries. Fits in other processes only share the entries made
+    before the instance was sent to them.
+
+    Parameters
+    ----------
+    max_entries : int, default=16
+        Maximum number of entries. The least recently used ones are dropped.
+    """
+
+    def __init__(self, max_entries=16):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _data_key(*arrays):
+        digest = hashlib.blake2b(digest_size=16)
+        for array in arrays:
+            parts = (
+                (array.data, array.indices, array.indptr)
+                if sp.issparse(array)
+                else (array,)
+            )
+            for part in parts:
+                part = np.ascontiguousarray(part)
+                digest.update(f"{part.shape}{part.dtype.str}".encode())
+                digest.update(part.reshape(-1).view(np.uint8))
+        return digest.hexdigest()
+
+    def _get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+        return value
+
+    def _put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
 class BaseSVM(ABC):
 
     def __init__(
@@ -48,6 +267,8 @@ class BaseSVM(ABC):
         max_iter=-1,
         tau=1e-12,
         algorithm="thunder",
+        pairwise_jobs=None,
+        kernel_cache=None,
     ):
         self.C = C
         self.nu = nu
@@ -62,7 +283,10 @@ class BaseSVM(ABC):
         self.max_iter = max_iter
         self.tau = tau
         self.algorithm = algorithm
+        self.pairwise_jobs = pairwise_jobs
+        self.kernel_cache = kernel_cache
         self._onedal_model = None
+        self._pair_models = None
 
     @abstractmethod
     def train(self, *args, **kwargs): ...
@@ -70,20 +294,25 @@ class BaseSVM(ABC):
     @abstractmethod
     def infer(self, *args, **kwargs): ...
 
+    def _is_custom_kernel(self):
+        return callable(self.kernel) or self.kernel == "precomputed"
+
     def _get_onedal_params(self, X):
         max_iter = 10000 if self.max_iter == -1 else self.max_iter
         # if gamma is not given as a value, use sklearn's "auto"
         gamma = 1 / X.shape[1] if self.gamma is None else self.gamma
+        # custom kernels are the linear kernel of the features of their Gram matrix
+        kernel = "linear" if self._is_custom_kernel() else self.kernel
         return {
             "fptype": X.dtype,
             "c": self.C,
             "nu": self.nu,
             "epsilon": self.epsilon,
-            "kernel": self.kernel,
+            "kernel": kernel,
             "degree": self.degree,
-            "shift": self.coef0 if self.kernel != "linear" else 0.0,
-            "scale": gamma if self.kernel != "linear" else 1.0,
-            "sigma": sqrt(0.5 / gamma) if self.kernel != "linear" else 1.0,
+            "shift": self.coef0 if kernel != "linear" else 0.0,
+            "scale": gamma if kernel != "linear" else 1.0,
+            "sigma": sqrt(0.5 / gamma) if kernel != "linear" else 1.0,
             "accuracy_threshold": self.tol,
             "shrinking": self.shrinking,
             "cache_size": self.cache_size,
@@ -93,13 +322,96 @@ class BaseSVM(ABC):
             "class_count": self.class_count_,
         }
 
+    def _compute_kernel(self, X, Y):
+        gram = self.kernel(X, Y)
+        if sp.issparse(gram):
+            gram = gram.toarray()
+        return np.asarray(gram, dtype=X.dtype)
+
+    def _fit_kernel_features(self, X, data_key=None, features=None):
+        # features whose linear kernel is the precomputed or callable kernel,
+        # unless they were already factored by the caller
+        _, (X,) = _transfer_to_host(X)
+        if self.kernel == "precomputed" and X.shape[0] != X.shape[1]:
+            raise ValueError(
+                "Precomputed matrix must be a square matrix."
+                f" Input is a {X.shape[0]}x{X.shape[1]} matrix."
+            )
+        if features is None:
+            features = _custom_kernel_features(
+                self.kernel, X, self.kernel_cache, data_key
+            )
+        if features is None:
+            raise ValueError("Kernel matrix is not positive semi-definite.")
+        return X, np.ascontiguousarray(features, dtype=X.dtype)
+
+    def _kernel_features(self, X):
+        # features whose linear kernel with the features of the support vectors
+        # is the kernel of the samples with the support vectors
+        _, (X,) = _transfer_to_host(X)
+        if self.kernel == "precomputed":
+            gram = np.asarray(X[:, self._support_indices], dtype=X.dtype)
+        else:
+            gram = self._compute_kernel(X, self._support_X)
+        return np.ascontiguousarray(gram @ self._kernel_map, dtype=X.dtype)
+
     @supports_queue
-    def fit(self, X, y, sample_weight=None, class_count=0, queue=None):
+    def fit(
+        self, X, y, sample_weight=None, class_count=0, kernel_features=None, queue=None
+    ):
         # oneDAL expects that the user has a priori knowledge of the y data
         # and has placed them in a oneDAL-acceptable format, most important
         # for this is the number of classes.
         self.class_count_ = class_count
 
+        data_key = working_key = None
+        if self.kernel_cache is not None:
+            _, (X, y, sample_weight) = _transfer_to_host(X, y, sample_weight)
+            data_key = self.kernel_cache._data_key(X)
+            working_key = (
+                "support",
+                data_key,
+                self.kernel_cache._data_key(y),
+                self.kernel,
+                self.degree,
+                self.gamma,
+                self.coef0,
+                class_count,
+            )
+
+        if self._is_custom_kernel():
+            X_fit, X = self._fit_kernel_features(X, data_key, kernel_features)
+
+        working = None
+        if working_key is not None and self._supports_working_set():
+            working = self.kernel_cache._get(working_key)
+        if working is None:
+            self._fit_rows(X, y, sample_weight, queue=queue)
+        else:
+            self._fit_working_set(X, y, sample_weight, working, queue=queue)
+
+        if working_key is not None:
+            _, (support,) = _transfer_to_host(self.support_)
+            self.kernel_cache._put(working_key, np.asarray(support, dtype=np.intp))
+
+        if self._is_custom_kernel():
+            _, (support, support_vectors) = _transfer_to_host(
+                self.support_, self.support_vectors_
+            )
+            self._support_indices = np.asarray(support, dtype=np.intp)
+            if callable(self.kernel):
+                self._support_X = X_fit[self._support_indices]
+            # maps kernel values with the support vectors to features, exactly
+            # whenever the kernel of the sample lies in their span
+            self._kernel_map = np.linalg.pinv(support_vectors).T
+        return self
+
+    def _fit_rows(self, X, y, sample_weight=None, queue=None):
+        if self.class_count_ > 2 and self.pairwise_jobs is not None:
+            self._fit_pairwise(X, y, sample_weight, queue=queue)
+            return
+
+        self._pair_models = None
         data = (X, y) if sample_weight is None else (X, y, sample_weight)
 
         self._sparse = is_sparse(X)
@@ -132,7 +444,156 @@ class BaseSVM(ABC):
             self.n_iter_ = max(1, max_iter)
 
         self._onedal_model = result.model
-        return self
+
+    def _supports_working_set(self):
+        # the solution must not change when samples outside of the support
+        # are removed, which doesn't hold for the nu and epsilon problems
+        return False
+
+    def _margin_violations(self, decision, y):
+        raise NotImplementedError
+
+    def _fit_working_set(self, X, y, sample_weight, working, queue=None):
+        # The problem is solved on a working set, which starts from the
+        # support vectors of a previous fit and grows by the samples that
+        # violate the margin of the model fitted on it. The samples outside
+        # of it have zero dual coefficients, so the model is optimal for all
+        # the samples once none of them violates the margin.
+        y = np.asarray(y).reshape(-1)
+        # samples without weight never become support vectors
+        candidates = (
+            np.ones(y.shape[0], dtype=bool)
+            if sample_weight is None
+            else np.asarray(sample_weight).reshape(-1) > 0
+        )
+        active = np.zeros(y.shape[0], dtype=bool)
+        active[working[working < y.shape[0]]] = True
+        active &= candidates
+        for label in range(self.class_count_):
+            in_class = np.flatnonzero((y == label) & candidates)
+            if in_class.shape[0] and not active[in_class].any():
+                active[in_class[0]] = True
+
+        while True:
+            rows = np.flatnonzero(active)
+            self._fit_rows(
+                X[rows],
+                y[rows],
+                None if sample_weight is None else sample_weight[rows],
+                queue=queue,
+            )
+            rest = np.flatnonzero(~active & candidates)
+            if rest.shape[0] == 0:
+                break
+            decision = np.asarray(self._decision_values(X[rest], queue=queue))
+            violators = rest[self._margin_violations(decision, y[rest])]
+            if violators.shape[0] == 0:
+                break
+            active[violators] = True
+
+        _, (support,) = _transfer_to_host(self.support_)
+        self.support_ = rows[np.asarray(support, dtype=np.intp).reshape(-1)]
+
+    def _fit_pairwise(self, X, y, sample_weight=None, queue=None):
+        # The binary problems of the class pairs are trained as separate oneDAL
+        # fits from a pool of threads, which run concurrently as the backend
+        # releases the GIL while training. This keeps all the cores busy for
+        # many classes, where every one-vs-one problem is small.
+        _, (X, y, sample_weight) = _transfer_to_host(X, y, sample_weight)
+        y = np.asarray(y).reshape(-1)
+        n_classes = self.class_count_
+        pairs = [(i, j) for i in range(n_classes) for j in range(i + 1, n_classes)]
+        rows = [np.flatnonzero((y == i) | (y == j)) for i, j in pairs]
+
+        def fit_pair(p):
+            i, j = pairs[p]
+            # the first class of a pair is the positive one, as in libsvm
+            model = type(self)(
+                C=self.C,
+                nu=self.nu,
+                epsilon=self.epsilon,
+                kernel="linear" if self._is_custom_kernel() else self.kernel,
+                degree=self.degree,
+                gamma=self.gamma,
+                coef0=self.coef0,
+                tol=self.tol,
+                shrinking=self.shrinking,
+                cache_size=self.cache_size,
+                max_iter=self.max_iter,
+                tau=self.tau,
+                algorithm=self.algorithm,
+            )
+            return model.fit(
+                X[rows[p]],
+                (y[rows[p]] == i).astype(y.dtype),
+                None if sample_weight is None else sample_weight[rows[p]],
+                class_count=2,
+                queue=queue,
+            )
+
+        n_jobs = self.pairwise_jobs
+        if n_jobs < 0:
+            n_jobs = max(1, os.cpu_count() + 1 + n_jobs)
+        # the largest problems are started first to balance the load
+        order = sorted(range(len(pairs)), key=lambda p: -rows[p].shape[0])
+        with ThreadPoolExecutor(max_workers=max(1, n_jobs)) as executor:
+            fitted = dict(zip(order, executor.map(fit_pair, order)))
+        self._pairs = pairs
+        self._pair_models = [fitted[p] for p in range(len(pairs))]
+
+        # support vectors are grouped by class as in libsvm
+        pair_support = [
+            rows[p][np.asarray(model.support_, dtype=np.intp).reshape(-1)]
+            for p, model in enumerate(self._pair_models)
+        ]
+        support = np.unique(np.concatenate(pair_support))
+        support = support[np.argsort(y[support], kind="stable")]
+        column = np.empty(y.shape[0], dtype=np.intp)
+        column[support] = np.arange(support.shape[0])
+
+        # the coefficients of pair (i, j) are in row j - 1 for the support
+        # vectors of class i, and in row i for the ones of class j
+        dual_coef = np.zeros((n_classes - 1, support.shape[0]), dtype=X.dtype)
+        for (i, j), sv, model in zip(pairs, pair_support, self._pair_models):
+            coef = model.dual_coef_
+            coef = np.asarray(coef.toarray() if sp.issparse(coef) else coef)
+            in_i = y[sv] == i
+            dual_coef[np.where(in_i, j - 1, i), column[sv]] = coef.reshape(-1)
+
+        self._sparse = is_sparse(X)
+        if self._sparse:
+            self.dual_coef_ = _csr_array(dual_coef)
+            self.support_vectors_ = _csr_array(X[support])
+        else:
+            self.dual_coef_ = dual_coef
+            self.support_vectors_ = X[support]
+        self.intercept_ = np.concatenate(
+            [np.asarray(model.intercept_).reshape(-1) for model in self._pair_models]
+        )
+        self.support_ = support
+        self.n_iter_ = np.concatenate(
+            [np.asarray(model.n_iter_).reshape(-1) for model in self._pair_models]
+        )
+        self._onedal_model = None
+
+    def _pairwise_decision_function(self, X, queue=None):
+        _, (X,) = _transfer_to_host(X)
+        return np.hstack(
+            [
+                np.asarray(model.decision_function(X, queue=queue)).reshape(-1, 1)
+                for model in self._pair_models
+            ]
+        )
+
+    def _pairwise_predict(self, X, queue=None):
+        decision = self._pairwise_decision_function(X, queue=queue)
+        votes = np.zeros((decision.shape[0], self.class_count_), dtype=np.intp)
+        for p, (i, j) in enumerate(self._pairs):
+            wins = decision[:, p] > 0
+            votes[:, i] += wins
+            votes[:, j] += ~wins
+        # ties go to the class with the lowest index, as in libsvm
+        return np.argmax(votes, axis=1).astype(decision.dtype)
 
     def _create_model(self, support_vectors_, dual_coef_, intercept_):
         m = self.model()
@@ -171,7 +632,17 @@ class BaseSVM(ABC):
 
         return self.infer(params, self._onedal_model, X)
 
+    def _decision_values(self, X, queue=None):
+        # decision function of samples in the representation of the training
+        if self._pair_models is not None:
+            return self._pairwise_decision_function(X, queue=queue)
+        return from_table(self._infer(X, queue=queue).decision_function, like=X)
+
     def predict(self, X, queue=None):
+        if self._is_custom_kernel():
+            X = self._kernel_features(X)
+        if self._pair_models is not None:
+            return self._pairwise_predict(X, queue=queue)
         return from_table(self._infer(X, queue=queue).responses, like=X)[:, 0]
 
 
@@ -245,6 +716,8 @@ class SVC(BaseSVM):
         max_iter=-1,
         tau=1e-12,
         algorithm="thunder",
+        pairwise_jobs=None,
+        kernel_cache=None,
     ):
         super().__init__(
             C=C,
@@ -260,6 +733,8 @@ class SVC(BaseSVM):
             max_iter=max_iter,
             tau=tau,
             algorithm=algorithm,
+            pairwise_jobs=pairwise_jobs,
+            kernel_cache=kernel_cache,
         )
 
     def _create_model(self, support_vectors_, dual_coef_, intercept_) -> None:
@@ -274,6 +749,25 @@ class SVC(BaseSVM):
         params.pop("epsilon")
         return params
 
+    def _supports_working_set(self):
+        return True
+
+    def _margin_violations(self, decision, y):
+        # the positive class is the second one of binary models, and the first
+        # one of every pair of multi-class models, as in libsvm
+        decision = decision.reshape(y.shape[0], -1)
+        if self.class_count_ <= 2:
+            margin = np.where(y == 1, decision[:, 0], -decision[:, 0])
+            return margin < 1.0 - self.tol
+        violated = np.zeros(y.shape[0], dtype=bool)
+        p = 0
+        for i in range(self.class_count_):
+            for j in range(i + 1, self.class_count_):
+                violated |= (y == i) & (decision[:, p] < 1.0 - self.tol)
+                violated |= (y == j) & (-decision[:, p] < 1.0 - self.tol)
+                p += 1
+        return violated
+
     @bind_default_backend("svm.classification")
     def train(self, *args, **kwargs): ...
 
@@ -284,7 +778,9 @@ class SVC(BaseSVM):
     def model(self): ...
 
     def decision_function(self, X, queue=None):
-        return from_table(self._infer(X, queue=queue).decision_function, like=X)
+        if self._is_custom_kernel():
+            X = self._kernel_features(X)
+        return self._decision_values(X, queue=queue)
 
 
 class NuSVR(BaseSVM):
@@ -356,6 +852,8 @@ class NuSVC(BaseSVM):
         max_iter=-1,
         tau=1e-12,
         algorithm="thunder",
+        pairwise_jobs=None,
+        kernel_cache=None,
     ):
         super().__init__(
             C=C,
@@ -371,6 +869,8 @@ class NuSVC(BaseSVM):
             max_iter=max_iter,
             tau=tau,
             algorithm=algorithm,
+            pairwise_jobs=pairwise_jobs,
+            kernel_cache=kernel_cache,
         )
 
     def _create_model(self, support_vectors_, dual_coef_, intercept_) -> None:
@@ -395,4 +895,6 @@ class NuSVC(BaseSVM):
     def model(self): ...
 
     def decision_function(self, X, queue=None):
-        return from_table(self._infer(X, queue=queue).decision_function, like=X)
+        if self._is_custom_kernel():
+            X = self._kernel_features(X)
+        return self._decision_values(X, queue=queue)
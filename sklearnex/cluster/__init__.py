@@ -16,5 +16,6 @@
 
 from .dbscan import DBSCAN
 from .k_means import KMeans
+from .minibatch_k_means import MiniBatchKMeans
 
-__all__ = ["DBSCAN", "KMeans"]
+__all__ = ["DBSCAN", "KMeans", "MiniBatchKMeans"]
@@ -16,6 +16,7 @@
 
 from sklearn.cluster import DBSCAN as _sklearn_DBSCAN
 from sklearn.utils._array_api import get_namespace
+from sklearn.utils.validation import _num_features
 
 from daal4py.sklearn._n_jobs_support import control_n_jobs
 from daal4py.sklearn._utils import is_sparse
@@ -69,6 +70,16 @@ class DBSCAN(oneDALEstimator, _sklearn_DBSCAN):
 
     _onedal_dbscan = staticmethod(onedal_DBSCAN)
 
+    # metrics of the region queries done by the oneDAL neighbors search
+    _onedal_metrics = [
+        "euclidean",
+        "minkowski",
+        "manhattan",
+        "chebyshev",
+        "cosine",
+        "haversine",
+    ]
+
     def _onedal_fit(self, X, y, sample_weight=None, queue=None):
         xp, _ = get_namespace(X, y, sample_weight)
         X = validate_data(self, X, accept_sparse="csr", dtype=[xp.float64, xp.float32])
@@ -98,7 +109,10 @@ class DBSCAN(oneDALEstimator, _sklearn_DBSCAN):
         else:
             self.core_sample_indices_ = self._onedal_estimator.core_sample_indices_
 
-        self.components_ = xp.take(X, self.core_sample_indices_, axis=0)
+        if is_sparse(X):
+            self.components_ = X[self.core_sample_indices_]
+        else:
+            self.components_ = xp.take(X, self.core_sample_indices_, axis=0)
         self.labels_ = self._onedal_estimator.labels_
         self.n_features_in_ = X.shape[1]
 
@@ -109,20 +123,31 @@ class DBSCAN(oneDALEstimator, _sklearn_DBSCAN):
         )
         if method_name == "fit":
             X = data[0]
+            p = 2 if self.p is None else self.p
+            is_euclidean = self.metric == "euclidean" or (
+                self.metric == "minkowski" and p == 2
+            )
             patching_status.and_conditions(
                 [
                     (
-                        self.algorithm in ["auto", "brute"],
-                        f"'{self.algorithm}' algorithm is not supported. "
-                        "Only 'auto' and 'brute' algorithms are supported",
+                        self.metric in self._onedal_metrics,
+                        f"'{self.metric}' metric is not supported. Supported metrics "
+                        f"are {self._onedal_metrics}.",
+                    ),
+                    (
+                        self.metric != "minkowski" or p >= 1,
+                        f"'minkowski' metric with p={p} < 1 is not supported.",
                     ),
+                    (self.metric_params is None, "metric_params are not supported."),
                     (
-                        self.metric == "euclidean"
-                        or (self.metric == "minkowski" and self.p == 2),
-                        f"'{self.metric}' (p={self.p}) metric is not supported. "
-                        "Only 'euclidean' or 'minkowski' with p=2 metrics are supported.",
+                        self.metric != "haversine" or _num_features(X) == 2,
+                        "'haversine' metric is only supported for 2 features.",
+                    ),
+                    (
+                        not is_sparse(X) or is_euclidean or self.metric == "cosine",
+                        "Sparse input is only supported with 'euclidean' and "
+                        "'cosine' metrics.",
                     ),
-                    (not is_sparse(X), "X is sparse. Sparse input is not supported."),
                 ]
             )
             return patching_status
@@ -132,7 +157,11 @@ class DBSCAN(oneDALEstimator, _sklearn_DBSCAN):
         return self._onedal_supported(method_name, *data)
 
     def _onedal_gpu_supported(self, method_name, *data):
-        return self._onedal_supported(method_name, *data)
+        patching_status = self._onedal_supported(method_name, *data)
+        patching_status.and_conditions(
+            [(not is_sparse(data[0]), "Sparse input is only supported on CPU.")]
+        )
+        return patching_status
 
     def fit(self, X, y=None, sample_weight=None):
         self._validate_params()
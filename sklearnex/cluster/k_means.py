@@ -20,7 +20,6 @@ from daal4py.sklearn._utils import daal_check_version
 
 if daal_check_version((2023, "P", 200)):
 
-    import numbers
     import warnings
 
     import numpy as np
@@ -46,7 +45,7 @@ if daal_check_version((2023, "P", 200)):
     from .._utils import PatchingConditionsChain
     from ..base import oneDALEstimator
     from ..utils._array_api import enable_array_api
-    from ..utils.validation import validate_data
+    from ..utils.validation import _check_sample_weight, validate_data
 
     if sklearn_check_version("1.9"):
         from sklearn.utils._array_api import check_same_namespace
@@ -92,6 +91,7 @@ if daal_check_version((2023, "P", 200)):
                 "n_init": getattr(self, "_n_init", self._resolve_n_init()),
                 "verbose": self.verbose,
                 "random_state": self.random_state,
+                "algorithm": self.algorithm,
             }
 
             self._onedal_estimator = onedal_KMeans(**onedal_params)
@@ -105,9 +105,9 @@ if daal_check_version((2023, "P", 200)):
             sample_count = _num_samples(X)
             supported_algs = ["lloyd", "elkan"]
 
-            if self.algorithm == "elkan":
+            if self.algorithm == "elkan" and is_sparse(X):
                 logging.getLogger("sklearnex").info(
-                    "oneDAL does not support 'elkan', using 'lloyd' algorithm instead."
+                    "'elkan' is computed with 'lloyd' algorithm for sparse data."
                 )
             correct_count = self.n_clusters < sample_count
 
@@ -115,20 +115,14 @@ if daal_check_version((2023, "P", 200)):
                 _is_csr(X) and daal_check_version((2024, "P", 700))
             ) or not is_sparse(X)
 
-            _acceptable_sample_weights = self._validate_sample_weight(sample_weight, X)
-
             patching_status.and_conditions(
                 [
                     (
                         self.algorithm in supported_algs,
-                        "Only 'lloyd' algorithm is supported, 'elkan' is computed using lloyd",
+                        "Only 'lloyd' and 'elkan' algorithms are supported.",
                     ),
                     (self.n_clusters != 1, "n_clusters=1 is not supported"),
                     (correct_count, "n_clusters is smaller than number of samples"),
-                    (
-                        _acceptable_sample_weights,
-                        "oneDAL doesn't support sample_weight. Accepted options are None, constant, or equal weights.",
-                    ),
                     (
                         is_data_supported,
                         "Supported data formats: Dense, CSR (oneDAL version >= 2024.7.0).",
@@ -239,11 +233,11 @@ if daal_check_version((2023, "P", 200)):
                     f"n_samples={X.shape[0]} should be >= n_clusters={self.n_clusters}."
                 )
 
-            # Validate algorithm (only lloyd supported in oneDAL)
+            # Validate algorithm
             if self.algorithm not in ["lloyd", "elkan"]:
                 raise ValueError(
                     f"Algorithm {self.algorithm} is not supported. "
-                    "Supported algorithms are 'lloyd' and 'elkan' (computed as lloyd)."
+                    "Supported algorithms are 'lloyd' and 'elkan'."
                 )
 
             # Skip sklearn's _check_params / _check_params_vs_input entirely:
@@ -255,33 +249,15 @@ if daal_check_version((2023, "P", 200)):
 
             self._n_features_out = self.n_clusters
 
+            if sample_weight is not None:
+                sample_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
+
             self._initialize_onedal_estimator()
             self._n_threads = _openmp_effective_n_threads()
-            self._onedal_estimator.fit(X, queue=queue)
+            self._onedal_estimator.fit(X, sample_weight=sample_weight, queue=queue)
 
             self._save_attributes()
 
-        def _validate_sample_weight(self, sample_weight, X):
-            """Check if sample_weight is acceptable for oneDAL.
-
-            oneDAL only supports None or uniform weights. Validates shape
-            and uniformity using xp ops for array API compatibility.
-            """
-            if sample_weight is None:
-                return True
-            if isinstance(sample_weight, numbers.Number) or isinstance(
-                sample_weight, str
-            ):
-                return True
-            try:
-                xp, _ = get_namespace(sample_weight)
-                sw = xp.asarray(sample_weight)
-                if sw.ndim != 1 or sw.shape[0] != X.shape[0]:
-                    return False
-                return bool(xp.all(sw == sw[0])) and (sw[0] != 0)
-            except (TypeError, IndexError, AttributeError, ValueError):
-                return False
-
         def _onedal_predict_supported(self, method_name, *data):
             class_name = self.__class__.__name__
 
@@ -296,16 +272,12 @@ if daal_check_version((2023, "P", 200)):
             ) or not is_sparse(X)
 
             supported_algs = ["lloyd", "elkan"]
-            if self.algorithm == "elkan":
-                logging.getLogger("sklearnex").info(
-                    "oneDAL does not support 'elkan', using 'lloyd' algorithm instead."
-                )
 
             patching_status.and_conditions(
                 [
                     (
                         self.algorithm in supported_algs,
-                        "Only 'lloyd' algorithm is supported, 'elkan' is computed using lloyd.",
+                        "Only 'lloyd' and 'elkan' algorithms are supported.",
                     ),
                     (self.n_clusters != 1, "n_clusters=1 is not supported"),
                     (
@@ -466,7 +438,11 @@ if daal_check_version((2023, "P", 200)):
                     check_same_namespace(
                         X, self, attribute="cluster_centers_", method="score"
                     )
-            return self._onedal_estimator.score(X, queue=queue)
+            if sample_weight is not None:
+                sample_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
+            return self._onedal_estimator.score(
+                X, sample_weight=sample_weight, queue=queue
+            )
 
         def _save_attributes(self):
             assert hasattr(self, "_onedal_estimator")
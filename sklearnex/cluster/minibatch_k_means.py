@@ -0,0 +1,280 @@
+# ==============================================================================
+# Copyright contributors to the oneDAL project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans as _sklearn_MiniBatchKMeans
+from sklearn.utils import check_array
+from sklearn.utils.validation import check_is_fitted
+
+from daal4py.sklearn._n_jobs_support import control_n_jobs
+from daal4py.sklearn._utils import daal_check_version, is_sparse
+from onedal.cluster import MiniBatchKMeans as onedal_MiniBatchKMeans
+from onedal.utils.validation import _is_arraylike_not_scalar
+
+from .._device_offload import dispatch, wrap_output_data
+from .._utils import PatchingConditionsChain
+from ..base import oneDALEstimator
+from ..utils.validation import _check_sample_weight, validate_data
+
+
+@control_n_jobs(
+    decorated_methods=["fit", "partial_fit", "predict", "_onedal_finalize_fit"]
+)
+class MiniBatchKMeans(oneDALEstimator, _sklearn_MiniBatchKMeans):
+    __doc__ = _sklearn_MiniBatchKMeans.__doc__
+
+    _parameter_constraints: dict = {**_sklearn_MiniBatchKMeans._parameter_constraints}
+
+    _onedal_minibatch_kmeans = staticmethod(onedal_MiniBatchKMeans)
+
+    def __init__(
+        self,
+        n_clusters=8,
+        *,
+        init="k-means++",
+        max_iter=100,
+        batch_size=1024,
+        verbose=0,
+        compute_labels=True,
+        random_state=None,
+        tol=0.0,
+        max_no_improvement=10,
+        init_size=None,
+        n_init="auto",
+        reassignment_ratio=0.01,
+    ):
+        super().__init__(
+            n_clusters=n_clusters,
+            init=init,
+            max_iter=max_iter,
+            batch_size=batch_size,
+            verbose=verbose,
+            compute_labels=compute_labels,
+            random_state=random_state,
+            tol=tol,
+            max_no_improvement=max_no_improvement,
+            init_size=init_size,
+            n_init=n_init,
+            reassignment_ratio=reassignment_ratio,
+        )
+
+    def _onedal_supported(self, method_name, *data):
+        patching_status = PatchingConditionsChain(
+            f"sklearn.cluster.{self.__class__.__name__}.{method_name}"
+        )
+        X = data[0]
+        # sparse data is converted to CSR by the input validation
+        is_data_supported = not is_sparse(X) or daal_check_version((2024, "P", 700))
+
+        if method_name in ["fit", "partial_fit"]:
+            # a fit started by one of the implementations is continued by it
+            is_same_backend = (
+                method_name == "fit"
+                or not hasattr(self, "cluster_centers_")
+                or hasattr(self, "_onedal_estimator")
+            )
+            patching_status.and_conditions(
+                [
+                    (self.n_clusters != 1, "n_clusters=1 is not supported"),
+                    (
+                        is_data_supported,
+                        "Supported data formats: Dense, CSR (oneDAL version >= 2024.7.0).",
+                    ),
+                    (
+                        is_same_backend,
+                        "partial_fit of a model fitted with scikit-learn.",
+                    ),
+                ]
+            )
+        elif method_name == "predict":
+            patching_status.and_conditions(
+                [
+                    (
+                        hasattr(self, "_onedal_estimator"),
+                        "The model is fitted with scikit-learn.",
+                    ),
+                    (
+                        is_data_supported,
+                        "Supported data formats: Dense, CSR (oneDAL version >= 2024.7.0).",
+                    ),
+                ]
+            )
+        else:
+            raise RuntimeError(
+                f"Unknown method {method_name} in {self.__class__.__name__}"
+            )
+        return patching_status
+
+    _onedal_cpu_supported = _onedal_supported
+
+    def _onedal_gpu_supported(self, method_name, *data):
+        patching_status = self._onedal_supported(method_name, *data)
+        if method_name in ["fit", "partial_fit"]:
+            # callable init uses numpy ops which don't work on GPU arrays
+            patching_status.and_conditions(
+                [(not callable(self.init), "Callable 'init' is not supported on GPU.")]
+            )
+        return patching_status
+
+    def _initialize_onedal_estimator(self, X):
+        init = self.init
+        if _is_arraylike_not_scalar(init):
+            init = check_array(init, dtype=X.dtype, copy=True, order="C")
+            self._validate_center_shape(X, init)
+
+        self._onedal_estimator = self._onedal_minibatch_kmeans(
+            n_clusters=self.n_clusters,
+            init=init,
+            max_iter=self.max_iter,
+            batch_size=self._batch_size,
+            verbose=self.verbose,
+            compute_labels=self.compute_labels,
+            random_state=self.random_state,
+            tol=self.tol,
+            max_no_improvement=self.max_no_improvement,
+            init_size=self._init_size,
+            n_init=self._n_init,
+            reassignment_ratio=self.reassignment_ratio,
+        )
+
+    def _validate_input(self, X, sample_weight, reset):
+        X = validate_data(
+            self,
+            X,
+            accept_sparse="csr",
+            dtype=[np.float64, np.float32],
+            order="C",
+            accept_large_sparse=False,
+            reset=reset,
+        )
+        sample_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
+        return X, sample_weight
+
+    def _onedal_fit(self, X, _, sample_weight, queue=None):
+        X, sample_weight = self._validate_input(X, sample_weight, reset=True)
+        self._check_params_vs_input(X)
+
+        self._initialize_onedal_estimator(X)
+        self._onedal_estimator.fit(X, sample_weight=sample_weight, queue=queue)
+
+        self._cluster_centers_ = self._onedal_estimator.cluster_centers_
+        self._need_to_finalize = False
+        self._n_features_out = self.n_clusters
+        self.n_steps_ = self._onedal_estimator.n_steps_
+        self.n_iter_ = self._onedal_estimator.n_iter_
+        self.inertia_ = self._onedal_estimator.inertia_
+        if self.compute_labels:
+            self.labels_ = self._onedal_estimator.labels_
+
+    def _onedal_partial_fit(self, X, sample_weight=None, queue=None):
+        first_pass = not hasattr(self, "_onedal_estimator")
+        X, sample_weight = self._validate_input(X, sample_weight, reset=first_pass)
+
+        if first_pass:
+            self._check_params_vs_input(X)
+            self._initialize_onedal_estimator(X)
+
+        self._onedal_estimator.partial_fit(X, sample_weight=sample_weight, queue=queue)
+        self._need_to_finalize = True
+
+        self._n_features_out = self.n_clusters
+        self.n_steps_ = self._onedal_estimator.n_steps_
+        if self.compute_labels:
+            self.labels_ = self._onedal_estimator.labels_
+            self.inertia_ = self._onedal_estimator.inertia_
+
+    def _onedal_finalize_fit(self):
+        assert hasattr(self, "_onedal_estimator")
+        self._onedal_estimator.finalize_fit()
+        self._cluster_centers_ = self._onedal_estimator.cluster_centers_
+        self._need_to_finalize = False
+
+    def _onedal_predict(self, X, queue=None):
+        X = validate_data(
+            self,
+            X,
+            accept_sparse="csr",
+            reset=False,
+            dtype=[np.float64, np.float32],
+            order="C",
+            accept_large_sparse=False,
+        )
+        if self._need_to_finalize:
+            self._onedal_finalize_fit()
+        return self._onedal_estimator.predict(X, queue=queue)
+
+    def fit(self, X, y=None, sample_weight=None):
+        self._validate_params()
+        # a refit discards the state of a previous oneDAL fit
+        if hasattr(self, "_onedal_estimator"):
+            del self._onedal_estimator
+        dispatch(
+            self,
+            "fit",
+            {
+                "onedal": self.__class__._onedal_fit,
+                "sklearn": _sklearn_MiniBatchKMeans.fit,
+            },
+            X,
+            y,
+            sample_weight,
+        )
+        return self
+
+    def partial_fit(self, X, y=None, sample_weight=None):
+        self._validate_params()
+        dispatch(
+            self,
+            "partial_fit",
+            {
+                "onedal": self.__class__._onedal_partial_fit,
+                "sklearn": _sklearn_MiniBatchKMeans.partial_fit,
+            },
+            X,
+            sample_weight=sample_weight,
+        )
+        return self
+
+    @wrap_output_data
+    def predict(self, X):
+        check_is_fitted(self)
+        return dispatch(
+            self,
+            "predict",
+            {
+                "onedal": self.__class__._onedal_predict,
+                "sklearn": _sklearn_MiniBatchKMeans.predict,
+            },
+            X,
+        )
+
+    @property
+    def cluster_centers_(self):
+        if hasattr(self, "_onedal_estimator") and self._need_to_finalize:
+            self._onedal_finalize_fit()
+        return self._cluster_centers_
+
+    @cluster_centers_.setter
+    def cluster_centers_(self, value):
+        self._cluster_centers_ = value
+
+    @cluster_centers_.deleter
+    def cluster_centers_(self):
+        del self._cluster_centers_
+
+    fit.__doc__ = _sklearn_MiniBatchKMeans.fit.__doc__
+    partial_fit.__doc__ = _sklearn_MiniBatchKMeans.partial_fit.__doc__
+    predict.__doc__ = _sklearn_MiniBatchKMeans.predict.__doc__
@@ -16,7 +16,10 @@
 
 import numpy as np
 import pytest
-from numpy.testing import assert_allclose
+import scipy.sparse as sp
+from numpy.testing import assert_allclose, assert_array_equal
+from sklearn.cluster import DBSCAN as _sklearn_DBSCAN
+from sklearn.datasets import make_blobs
 
 from onedal.tests.utils._dataframes_support import (
     _convert_to_dataframe,
@@ -36,3 +39,22 @@ def test_sklearnex_import_dbscan(dataframe, queue):
     result = dbscan.labels_
     expected = np.array([0, 0, 0, 1, 1, -1], dtype=np.int32)
     assert_allclose(expected, result)
+
+
+@pytest.mark.parametrize("metric", ["euclidean", "cosine"])
+def test_sparse_dbscan(metric):
+    from sklearnex.cluster import DBSCAN
+
+    X, _ = make_blobs(n_samples=300, n_features=10, centers=3, random_state=0)
+    X[np.abs(X) < 3] = 0
+    X = sp.csr_matrix(X)
+    eps = 3.0 if metric == "euclidean" else 0.1
+
+    dbscan = DBSCAN(eps=eps, min_samples=5, metric=metric).fit(X)
+    expected = _sklearn_DBSCAN(eps=eps, min_samples=5, metric=metric).fit(X)
+
+    assert hasattr(dbscan, "_onedal_estimator")
+    assert_array_equal(dbscan.labels_, expected.labels_)
+    assert_array_equal(dbscan.core_sample_indices_, expected.core_sample_indices_)
+    assert sp.issparse(dbscan.components_)
+    assert_allclose(dbscan.components_.toarray(), expected.components_.toarray())
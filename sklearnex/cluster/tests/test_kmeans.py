@@ -396,3 +396,39 @@ def test_array_api_dispatch_results(xp, device, with_array_api):
     assert type(km.transform(X)) == type(X)
     assert type(km.cluster_centers_) == type(X)
     _check_kmeans_results(km, X, X_np)
+
+
+@pytest.mark.parametrize(
+    "dataframe,queue", get_dataframes_and_queues("numpy,dpnp") + [("csr", None)]
+)
+def test_weighted_fit_matches_sklearn(dataframe, queue):
+    if dataframe == "csr" and not daal_check_version((2024, "P", 700)):
+        pytest.skip("Sparse data requires oneDAL>=2024.7.0")
+    from sklearn.cluster import KMeans as _sklearn_KMeans
+
+    X = generate_dense_dataset(2000, 6, 0.7, 5)
+    sample_weight = np.random.default_rng(0).integers(1, 10, X.shape[0])
+    if dataframe == "csr":
+        X_fit = CSR_CTOR(X)
+    else:
+        X_fit = _convert_to_dataframe(X, sycl_queue=queue, target_df=dataframe)
+
+    # weighted Lloyd iterations from the same centers are deterministic
+    params = dict(n_clusters=5, init=X[:5].copy(), n_init=1)
+    kmeans = KMeans(**params).fit(X_fit, sample_weight=sample_weight)
+    reference = _sklearn_KMeans(**params).fit(X, sample_weight=sample_weight)
+
+    assert hasattr(kmeans, "_onedal_estimator")
+    assert_allclose(_as_numpy(kmeans.cluster_centers_), reference.cluster_centers_)
+    assert_allclose(kmeans.inertia_, reference.inertia_)
+    assert_allclose(_as_numpy(kmeans.labels_), reference.labels_)
+    assert_allclose(
+        kmeans.score(X_fit, sample_weight=sample_weight),
+        reference.score(X, sample_weight=sample_weight),
+    )
+
+    # count weights cluster deduplicated data as the repeated rows
+    repeated = np.repeat(X, sample_weight, axis=0)
+    kmeans = KMeans(n_clusters=5, random_state=0).fit(X, sample_weight=sample_weight)
+    reference = _sklearn_KMeans(n_clusters=5, random_state=0).fit(repeated)
+    assert_allclose(kmeans.inertia_, reference.inertia_, rtol=1e-2)
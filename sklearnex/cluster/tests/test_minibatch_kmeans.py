@@ -0,0 +1,135 @@
+# ==============================================================================
+# Copyright contributors to the oneDAL project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import pickle
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from numpy.testing import assert_allclose
+from sklearn.cluster import KMeans as _sklearn_KMeans
+from sklearn.cluster import MiniBatchKMeans as _sklearn_MiniBatchKMeans
+from sklearn.datasets import make_blobs
+from sklearn.metrics import adjusted_rand_score
+from sklearn.utils import gen_batches
+
+from daal4py.sklearn._utils import daal_check_version
+from onedal.tests.utils._dataframes_support import (
+    _as_numpy,
+    _convert_to_dataframe,
+    get_dataframes_and_queues,
+)
+
+
+@pytest.mark.parametrize("dataframe,queue", get_dataframes_and_queues())
+@pytest.mark.parametrize("init", ["k-means++", "random"])
+def test_sklearnex_import(dataframe, queue, init):
+    from sklearnex.cluster import MiniBatchKMeans
+
+    X, _ = make_blobs(n_samples=1000, n_features=10, centers=3, random_state=0)
+    X_df = _convert_to_dataframe(X, sycl_queue=queue, target_df=dataframe)
+
+    kmeans = MiniBatchKMeans(n_clusters=3, init=init, random_state=0).fit(X_df)
+    assert "sklearnex" in kmeans.__module__
+    assert hasattr(kmeans, "_onedal_estimator")
+
+    # the clustering of well separated blobs is the one of the full KMeans
+    reference = _sklearn_KMeans(n_clusters=3, random_state=0).fit(X)
+    assert_allclose(kmeans.inertia_, reference.inertia_, rtol=1e-2)
+    assert adjusted_rand_score(_as_numpy(kmeans.predict(X_df)), reference.labels_) == 1
+
+
+@pytest.mark.parametrize("dataframe,queue", get_dataframes_and_queues())
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("weighted", [False, True])
+def test_partial_fit_matches_sklearn(dataframe, queue, dtype, weighted):
+    from sklearnex.cluster import MiniBatchKMeans
+
+    X, _ = make_blobs(n_samples=2000, n_features=8, centers=5, random_state=0)
+    X = X.astype(dtype)
+    sample_weight = np.random.default_rng(0).uniform(0.5, 2.0, X.shape[0])
+    sample_weight = sample_weight.astype(dtype) if weighted else None
+    init = X[:5].copy()
+
+    # without random reassignments, the updates of the centers are deterministic
+    params = dict(n_clusters=5, init=init, n_init=1, reassignment_ratio=0.0)
+    kmeans = MiniBatchKMeans(**params)
+    reference = _sklearn_MiniBatchKMeans(**params)
+    for batch in gen_batches(X.shape[0], 256):
+        X_batch = _convert_to_dataframe(X[batch], sycl_queue=queue, target_df=dataframe)
+        weights = None if sample_weight is None else sample_weight[batch]
+        kmeans.partial_fit(X_batch, sample_weight=weights)
+        reference.partial_fit(X[batch], sample_weight=weights)
+
+    assert hasattr(kmeans, "_onedal_estimator")
+    assert kmeans.n_steps_ == reference.n_steps_
+    tol = 1e-4 if dtype == np.float32 else 1e-7
+    assert_allclose(kmeans.cluster_centers_, reference.cluster_centers_, rtol=tol)
+    assert_allclose(kmeans.inertia_, reference.inertia_, rtol=tol)
+    assert_allclose(_as_numpy(kmeans.labels_), reference.labels_)
+
+
+@pytest.mark.parametrize("compute_labels", [True, False])
+def test_weighted_inertia(compute_labels):
+    from sklearnex.cluster import MiniBatchKMeans
+
+    X, _ = make_blobs(n_samples=2000, n_features=6, centers=4, random_state=0)
+    sample_weight = np.random.default_rng(0).uniform(0.5, 4.0, X.shape[0])
+
+    kmeans = MiniBatchKMeans(
+        n_clusters=4, compute_labels=compute_labels, random_state=0
+    ).fit(X, sample_weight=sample_weight)
+    assert hasattr(kmeans, "_onedal_estimator")
+
+    # sum of the weighted squared distances, without further normalization
+    distances = ((X[:, None, :] - kmeans.cluster_centers_[None]) ** 2).sum(axis=-1)
+    expected = sample_weight @ distances.min(axis=1)
+    # without labels, the inertia is estimated from the last batches
+    rtol = 1e-5 if compute_labels else 0.1
+    assert_allclose(kmeans.inertia_, expected, rtol=rtol)
+
+
+@pytest.mark.skipif(
+    not daal_check_version((2024, "P", 700)),
+    reason="Sparse data requires oneDAL>=2024.7.0",
+)
+def test_dense_vs_sparse():
+    from sklearnex.cluster import MiniBatchKMeans
+
+    X, _ = make_blobs(n_samples=1000, n_features=10, centers=3, random_state=0)
+    X[np.abs(X) < 2] = 0
+    init = X[:3].copy()
+
+    dense = MiniBatchKMeans(n_clusters=3, init=init, random_state=0).fit(X)
+    sparse = MiniBatchKMeans(n_clusters=3, init=init, random_state=0).fit(
+        sp.csr_matrix(X)
+    )
+    assert hasattr(sparse, "_onedal_estimator")
+    assert_allclose(dense.cluster_centers_, sparse.cluster_centers_)
+    assert_allclose(dense.inertia_, sparse.inertia_)
+
+
+def test_pickle_between_partial_fits():
+    from sklearnex.cluster import MiniBatchKMeans
+
+    X, _ = make_blobs(n_samples=1000, n_features=4, centers=3, random_state=0)
+    kmeans = MiniBatchKMeans(n_clusters=3, random_state=0).partial_fit(X[:500])
+    restored = pickle.loads(pickle.dumps(kmeans))
+
+    kmeans.partial_fit(X[500:])
+    restored.partial_fit(X[500:])
+    assert_allclose(kmeans.cluster_centers_, restored.cluster_centers_)
+    assert_allclose(kmeans.predict(X), restored.predict(X))
@@ -130,6 +130,7 @@ def get_patch_map_core(preview: bool = False) -> PatchMap:
     from sklearn import set_config as set_config_sklearn
     from sklearn.cluster import DBSCAN as DBSCAN_sklearn
     from sklearn.cluster import KMeans as KMeans_sklearn
+    from sklearn.cluster import MiniBatchKMeans as MiniBatchKMeans_sklearn
     from sklearn.decomposition import PCA as PCA_sklearn
     from sklearn.dummy import DummyRegressor as DummyRegressor_sklearn
     from sklearn.ensemble import ExtraTreesClassifier as ExtraTreesClassifier_sklearn
@@ -138,10 +139,15 @@ def get_patch_map_core(preview: bool = False) -> PatchMap:
     from sklearn.ensemble import RandomForestRegressor as RandomForestRegressor_sklearn
     from sklearn.ensemble._gb import DummyRegressor as DummyRegressor_sklearn_gb
     from sklearn.linear_model import ElasticNet as ElasticNet_sklearn
+    from sklearn.linear_model import ElasticNetCV as ElasticNetCV_sklearn
     from sklearn.linear_model import Lasso as Lasso_sklearn
+    from sklearn.linear_model import LassoCV as LassoCV_sklearn
     from sklearn.linear_model import LinearRegression as LinearRegression_sklearn
     from sklearn.linear_model import LogisticRegression as LogisticRegression_sklearn
     from sklearn.linear_model import Ridge as Ridge_sklearn
+    from sklearn.linear_model import RidgeCV as RidgeCV_sklearn
+    from sklearn.linear_model import enet_path as enet_path_sklearn
+    from sklearn.linear_model import lasso_path as lasso_path_sklearn
     from sklearn.manifold import TSNE as TSNE_sklearn
     from sklearn.metrics import pairwise_distances as pairwise_distances_sklearn
     from sklearn.metrics import roc_auc_score as roc_auc_score_sklearn
@@ -163,6 +169,7 @@ def get_patch_map_core(preview: bool = False) -> PatchMap:
     from ._config import set_config as set_config_sklearnex
     from .cluster import DBSCAN as DBSCAN_sklearnex
     from .cluster import KMeans as KMeans_sklearnex
+    from .cluster import MiniBatchKMeans as MiniBatchKMeans_sklearnex
     from .covariance import (
         IncrementalEmpiricalCovariance as IncrementalEmpiricalCovariance_sklearnex,
     )
@@ -173,18 +180,26 @@ def get_patch_map_core(preview: bool = False) -> PatchMap:
     from .ensemble import RandomForestClassifier as RandomForestClassifier_sklearnex
     from .ensemble import RandomForestRegressor as RandomForestRegressor_sklearnex
     from .linear_model import ElasticNet as ElasticNet_sklearnex
+    from .linear_model import ElasticNetCV as ElasticNetCV_sklearnex
     from .linear_model import (
         IncrementalLinearRegression as IncrementalLinearRegression_sklearnex,
     )
     from .linear_model import IncrementalRidge as IncrementalRidge_sklearnex
     from .linear_model import Lasso as Lasso_sklearnex
+    from .linear_model import LassoCV as LassoCV_sklearnex
     from .linear_model import LinearRegression as LinearRegression_sklearnex
     from .linear_model import LogisticRegression as LogisticRegression_sklearnex
     from .linear_model import Ridge as Ridge_sklearnex
+    from .linear_model import RidgeCV as RidgeCV_sklearnex
+    from .linear_model import enet_path as enet_path_sklearnex
+    from .linear_model import lasso_path as lasso_path_sklearnex
     from .manifold import TSNE as TSNE_sklearnex
     from .metrics import pairwise_distances as pairwise_distances_sklearnex
     from .metrics import roc_auc_score as roc_auc_score_sklearnex
     from .model_selection import train_test_split as train_test_split_sklearnex
+    from .neighbors import (
+        ApproximateNearestNeighbors as ApproximateNearestNeighbors_sklearnex,
+    )
     from .neighbors import KNeighborsClassifier as KNeighborsClassifier_sklearnex
     from .neighbors import KNeighborsRegressor as KNeighborsRegressor_sklearnex
     from .neighbors import LocalOutlierFactor as LocalOutlierFactor_sklearnex
@@ -208,6 +223,12 @@ def get_patch_map_core(preview: bool = False) -> PatchMap:
             KMeans_sklearnex,
             KMeans_sklearn,
         ),
+        "sklearn.cluster.MiniBatchKMeans": (
+            cluster_module,
+            "MiniBatchKMeans",
+            MiniBatchKMeans_sklearnex,
+            MiniBatchKMeans_sklearn,
+        ),
         "sklearn.decomposition.PCA": (
             decomposition_module,
             "PCA",
@@ -230,6 +251,30 @@ def get_patch_map_core(preview: bool = False) -> PatchMap:
             Lasso_sklearnex,
             Lasso_sklearn,
         ),
+        "sklearn.linear_model.ElasticNetCV": (
+            linear_model_module,
+            "ElasticNetCV",
+            ElasticNetCV_sklearnex,
+            ElasticNetCV_sklearn,
+        ),
+        "sklearn.linear_model.LassoCV": (
+            linear_model_module,
+            "LassoCV",
+            LassoCV_sklearnex,
+            LassoCV_sklearn,
+        ),
+        "sklearn.linear_model.enet_path": (
+            linear_model_module,
+            "enet_path",
+            enet_path_sklearnex,
+            enet_path_sklearn,
+        ),
+        "sklearn.linear_model.lasso_path": (
+            linear_model_module,
+            "lasso_path",
+            lasso_path_sklearnex,
+            lasso_path_sklearn,
+        ),
         "sklearn.linear_model.LinearRegression": (
             linear_model_module,
             "LinearRegression",
@@ -248,6 +293,12 @@ def get_patch_map_core(preview: bool = False) -> PatchMap:
             Ridge_sklearnex,
             Ridge_sklearn,
         ),
+        "sklearn.linear_model.RidgeCV": (
+            linear_model_module,
+            "RidgeCV",
+            RidgeCV_sklearnex,
+            RidgeCV_sklearn,
+        ),
         "sklearn.linear_model.IncrementalLinearRegression": (
             linear_model_module,
             "IncrementalLinearRegression",
@@ -297,6 +348,12 @@ def get_patch_map_core(preview: bool = False) -> PatchMap:
             LocalOutlierFactor_sklearnex,
             LocalOutlierFactor_sklearn,
         ),
+        "sklearn.neighbors.ApproximateNearestNeighbors": (
+            neighbors_module,
+            "ApproximateNearestNeighbors",
+            ApproximateNearestNeighbors_sklearnex,
+            None,
+        ),
         "sklearn.ensemble.ExtraTreesClassifier": (
             ensemble_module,
             "ExtraTreesClassifier",
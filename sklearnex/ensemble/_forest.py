@@ -27,6 +27,7 @@ from sklearn.ensemble import ExtraTreesClassifier as _sklearn_ExtraTreesClassifi
 from sklearn.ensemble import ExtraTreesRegressor as _sklearn_ExtraTreesRegressor
 from sklearn.ensemble import RandomForestClassifier as _sklearn_RandomForestClassifier
 from sklearn.ensemble import RandomForestRegressor as _sklearn_RandomForestRegressor
+from sklearn.ensemble._forest import BaseForest as _sklearn_BaseForest
 from sklearn.ensemble._forest import ForestClassifier as _sklearn_ForestClassifier
 from sklearn.ensemble._forest import ForestRegressor as _sklearn_ForestRegressor
 from sklearn.ensemble._forest import _get_n_samples_bootstrap
@@ -55,7 +56,6 @@ from onedal.ensemble import ExtraTreesClassifier as onedal_ExtraTreesClassifier
 from onedal.ensemble import ExtraTreesRegressor as onedal_ExtraTreesRegressor
 from onedal.ensemble import RandomForestClassifier as onedal_RandomForestClassifier
 from onedal.ensemble import RandomForestRegressor as onedal_RandomForestRegressor
-from onedal.primitives import get_tree_state_cls, get_tree_state_reg
 from onedal.utils.validation import _num_features
 
 from .._device_offload import dispatch, support_input_format, wrap_output_data
@@ -80,6 +80,67 @@ __check_kwargs = {
 _check_array = partial(check_array, **__check_kwargs)
 
 
+class PreparedForest:
+    """Predictions of a fitted forest for small batches with low overhead.
+
+    Created by ``prepare_inference`` of the forest estimators. The input is
+    not validated beyond its shape: it must be a C-contiguous dense array of
+    the prepared data type, otherwise it is converted first.
+    """
+
+    def __init__(self, estimator, dtype):
+        self._dtype = np.dtype(dtype)
+        self._n_features = estimator.n_features_in_
+        self._classes = getattr(estimator, "classes_", None)
+        self._inference = estimator._onedal_estimator.prepare_inference(
+            self._n_features, dtype=self._dtype
+        )
+
+    def _check_X(self, X):
+        X = np.ascontiguousarray(X, dtype=self._dtype)
+        if X.ndim != 2 or X.shape[1] != self._n_features:
+            raise ValueError(
+                f"X must be of shape (n_samples, {self._n_features}), got {X.shape}."
+            )
+        return X
+
+    def predict(self, X):
+        """Predict for X.
+
+        Parameters
+        ----------
+        X : ndarray of shape (n_samples, n_features)
+            The input samples.
+
+        Returns
+        -------
+        y : ndarray of shape (n_samples,)
+            The predicted values or classes.
+        """
+        result = self._inference.predict(self._check_X(X))
+        if self._classes is not None:
+            return np.take(self._classes, result.astype(np.intp))
+        return result
+
+    def predict_proba(self, X):
+        """Predict class probabilities for X.
+
+        Parameters
+        ----------
+        X : ndarray of shape (n_samples, n_features)
+            The input samples.
+
+        Returns
+        -------
+        p : ndarray of shape (n_samples, n_classes)
+            The class probabilities of the input samples.
+        """
+        if self._classes is None:
+            raise AttributeError("Only classifiers predict class probabilities.")
+        result = self._inference.predict_proba(self._check_X(X))
+        return np.clip(result, 0.0, 1.0, out=result)
+
+
 class BaseForest(oneDALEstimator, ABC):
     _onedal_factory = None
 
@@ -159,6 +220,24 @@ class BaseForest(oneDALEstimator, ABC):
         else:
             self._n_samples_bootstrap = None
 
+        # a warm start trains the added trees only and merges them into the model
+        previous = getattr(self, "_onedal_estimator", None) if self.warm_start else None
+        n_estimators, n_fits = self.n_estimators, 0
+        if previous is not None:
+            n_estimators -= previous.n_estimators
+            n_fits = len(previous._onedal_models)
+            if n_estimators < 0:
+                raise ValueError(
+                    f"n_estimators={self.n_estimators} must be larger or equal to "
+                    f"len(estimators_)={previous.n_estimators} when warm_start==True"
+                )
+            elif n_estimators == 0:
+                warnings.warn(
+                    "Warm-start fitting without increasing n_estimators does not "
+                    "fit new trees."
+                )
+                return self
+
         if (self.random_state is not None) and (not daal_check_version((2024, "P", 0))):
             warnings.warn(
                 "Setting 'random_state' value is not supported. "
@@ -168,13 +247,13 @@ class BaseForest(oneDALEstimator, ABC):
 
         rs = check_random_state(self.random_state)
         # use numpy here due to lack of array API support in sklearn random state
-        # seed is a python integer
-        seed = rs.randint(0, np.iinfo("i").max)
+        # seed is a python integer, every fit of a warm start draws the next one
+        seed = int(rs.randint(0, np.iinfo("i").max, size=n_fits + 1)[-1])
 
         # These parameters need to reference onedal.ensemble._forest, as some parameters
         # use defaults set in that module
         onedal_params = {
-            "n_estimators": self.n_estimators,
+            "n_estimators": n_estimators,
             "max_depth": self.max_depth,
             "min_samples_split": self.min_samples_split,
             "min_samples_leaf": self.min_samples_leaf,
@@ -194,6 +273,7 @@ class BaseForest(oneDALEstimator, ABC):
             ),
             "max_bins": self.max_bins,
             "min_bin_size": self.min_bin_size,
+            "memory_saving_mode": self.memory_saving_mode,
             # voting mode is set by onedal estimator defaults
             "error_metric_mode": self._err if self.oob_score else "none",
             "variable_importance_mode": "mdi",
@@ -214,6 +294,8 @@ class BaseForest(oneDALEstimator, ABC):
             getattr(self, "n_classes_", 0),
             queue=queue,
         )
+        if previous is not None:
+            self._onedal_estimator = previous.merge(self._onedal_estimator)
 
         self._save_attributes(xp)
 
@@ -225,6 +307,14 @@ class BaseForest(oneDALEstimator, ABC):
 
         self._validate_estimator()
 
+    def _discard_onedal_estimator(self):
+        # trees fitted by scikit-learn are not part of the oneDAL model, a warm
+        # start continues from the converted trees of the oneDAL model
+        if hasattr(self, "_onedal_estimator"):
+            if self.warm_start and self._cached_estimators_ is None:
+                self._estimators_()
+            del self._onedal_estimator
+
     def _onedal_fit_ready(self, patching_status, X, y, sample_weight):
 
         patching_status.and_conditions(
@@ -235,7 +325,16 @@ class BaseForest(oneDALEstimator, ABC):
                     or not self.oob_score,
                     "OOB score is only supported starting from 2021.5 version of oneDAL.",
                 ),
-                (self.warm_start is False, "Warm start is not supported."),
+                (
+                    not (self.warm_start and self.oob_score),
+                    "Warm start with OOB score is not supported.",
+                ),
+                (
+                    not self.warm_start
+                    or not hasattr(self, "_cached_estimators_")
+                    or hasattr(self, "_onedal_estimator"),
+                    "Warm start of a forest fitted with scikit-learn is not supported.",
+                ),
                 (
                     self.ccp_alpha == 0.0,
                     f"Non-zero 'ccp_alpha' ({self.ccp_alpha}) is not supported.",
@@ -335,14 +434,18 @@ class BaseForest(oneDALEstimator, ABC):
                 ]
             )
 
-        elif method_name in self._n_jobs_supported_onedal_methods:
-            X = data[0]
+        elif method_name in ["apply", "decision_path"]:
+            # the trees are exported once and traversed on host, also for CSR
+            patching_status.and_conditions(
+                [(hasattr(self, "_onedal_estimator"), "oneDAL model was not trained.")]
+            )
 
+        elif method_name in self._n_jobs_supported_onedal_methods:
+            # sparse data is converted to CSR and predicted from the exported trees
+            # of forests fitted on dense data
             patching_status.and_conditions(
                 [
                     (hasattr(self, "_onedal_estimator"), "oneDAL model was not trained."),
-                    (not is_sparse(X), "X is sparse. Sparse input is not supported."),
-                    (self.warm_start is False, "Warm start is not supported."),
                     (
                         daal_check_version((2023, "P", 200))
                         or self.estimator.__class__ == DecisionTreeClassifier,
@@ -365,6 +468,23 @@ class BaseForest(oneDALEstimator, ABC):
                     ]
                 )
 
+            if (
+                patching_status.get_status()
+                and is_sparse(data[0])
+                and is_classifier(self)
+            ):
+                # CSR data goes down the exported trees, whose leaves hold the
+                # class distributions of oneDAL only in these cases
+                patching_status.and_conditions(
+                    [
+                        (
+                            self._onedal_estimator._leaf_distributions() is not None,
+                            "Sparse input is only supported for two classes or "
+                            "trees with pure leaves.",
+                        )
+                    ]
+                )
+
         else:
             raise RuntimeError(
                 f"Unknown method {method_name} in {self.__class__.__name__}"
@@ -395,6 +515,12 @@ class BaseForest(oneDALEstimator, ABC):
                 ]
             )
 
+        elif method_name in ["apply", "decision_path"]:
+            # the trees are exported once and traversed on host, also for CSR
+            patching_status.and_conditions(
+                [(hasattr(self, "_onedal_estimator"), "oneDAL model was not trained.")]
+            )
+
         elif method_name in self._n_jobs_supported_onedal_methods:
             X = data[0]
 
@@ -405,7 +531,6 @@ class BaseForest(oneDALEstimator, ABC):
                         not is_sparse(X),
                         "X is sparse. Sparse input is not supported.",
                     ),
-                    (self.warm_start is False, "Warm start is not supported."),
                     (
                         daal_check_version((2023, "P", 100)),
                         "ExtraTrees supported starting from oneDAL version 2023.1",
@@ -462,6 +587,82 @@ class BaseForest(oneDALEstimator, ABC):
         # Needed to allow for proper sklearn operation in fallback mode
         self._cached_estimators_ = estimators
 
+    def prepare_inference(self, dtype=np.float64):
+        """Prepare predictions of small batches of dense data.
+
+        The oneDAL parameters and models of the forest are bound once, so that
+        repeated predictions of single rows or small batches avoid the fixed
+        cost of the validation and setup of ``predict``.
+
+        Parameters
+        ----------
+        dtype : {np.float64, np.float32}, default=np.float64
+            Data type of the data to predict.
+
+        Returns
+        -------
+        prepared : PreparedForest
+            Object with ``predict`` and, for classifiers, ``predict_proba``
+            methods, which accept preallocated output arrays.
+        """
+        if not hasattr(self, "_onedal_estimator"):
+            check_is_fitted(self)
+            raise ValueError("Prepared inference requires a forest fitted by oneDAL.")
+        if np.dtype(dtype) not in (np.float64, np.float32):
+            raise ValueError(f"dtype must be float64 or float32, got {dtype}.")
+        return PreparedForest(self, dtype)
+
+    def _onedal_apply(self, X, queue=None):
+        X = validate_data(
+            self,
+            X,
+            dtype=np.float32,
+            accept_sparse="csr",
+            reset=False,
+            ensure_all_finite="allow-nan",
+        )
+        return self._onedal_estimator.apply(X)
+
+    def _onedal_decision_path(self, X, queue=None):
+        X = validate_data(
+            self,
+            X,
+            dtype=np.float32,
+            accept_sparse="csr",
+            reset=False,
+            ensure_all_finite="allow-nan",
+        )
+        return self._onedal_estimator.decision_path(X)
+
+    @support_input_format
+    def apply(self, X):
+        check_is_fitted(self)
+        return dispatch(
+            self,
+            "apply",
+            {
+                "onedal": self.__class__._onedal_apply,
+                "sklearn": _sklearn_BaseForest.apply,
+            },
+            X,
+        )
+
+    @support_input_format
+    def decision_path(self, X):
+        check_is_fitted(self)
+        return dispatch(
+            self,
+            "decision_path",
+            {
+                "onedal": self.__class__._onedal_decision_path,
+                "sklearn": _sklearn_BaseForest.decision_path,
+            },
+            X,
+        )
+
+    apply.__doc__ = _sklearn_BaseForest.apply.__doc__
+    decision_path.__doc__ = _sklearn_BaseForest.decision_path.__doc__
+
     def _estimators_(self):
         """This attribute provides lazy creation of scikit-learn conformant
         Decision Trees used for analysis in methods such as 'apply'. This will stay
@@ -497,7 +698,10 @@ class BaseForest(oneDALEstimator, ABC):
 
         random_state_checked = check_random_state(self.random_state)
 
-        for i in range(self._onedal_estimator.n_estimators):
+        # all trees are exported at once and every tree is a slice of the export
+        trees = self._onedal_estimator.export_trees()
+        offsets = trees["tree_offsets"]
+        for i in range(offsets.shape[0] - 1):
             est_i = clone(est)
             est_i.set_params(
                 random_state=random_state_checked.randint(np.iinfo(np.int32).max)
@@ -505,14 +709,11 @@ class BaseForest(oneDALEstimator, ABC):
             est_i.n_features_in_ = self.n_features_in_
             est_i.n_outputs_ = self.n_outputs_
             est_i.n_classes_ = n_classes_
-            tree_i_state_class = self._get_tree_state(
-                self._onedal_estimator._onedal_model, i, n_classes_
-            )
             tree_i_state_dict = {
-                "max_depth": tree_i_state_class.max_depth,
-                "node_count": tree_i_state_class.node_count,
-                "nodes": tree_i_state_class.node_ar,
-                "values": tree_i_state_class.value_ar,
+                "max_depth": int(trees["max_depths"][i]),
+                "node_count": int(offsets[i + 1] - offsets[i]),
+                "nodes": trees["nodes"][offsets[i] : offsets[i + 1]],
+                "values": trees["values"][offsets[i] : offsets[i + 1]],
             }
             # Note: only on host.
             est_i.tree_ = Tree(
@@ -533,7 +734,6 @@ class ForestClassifier(BaseForest, _sklearn_ForestClassifier):
     # significantly at some point then this may need to be versioned.
 
     _err = "out_of_bag_error_accuracy|out_of_bag_error_decision_function"
-    _get_tree_state = staticmethod(get_tree_state_cls)
 
     def __init__(
         self,
@@ -578,9 +778,6 @@ class ForestClassifier(BaseForest, _sklearn_ForestClassifier):
         if self._onedal_factory is None:
             raise TypeError(f" oneDAL estimator has not been set.")
 
-    decision_path = support_input_format(_sklearn_ForestClassifier.decision_path)
-    apply = support_input_format(_sklearn_ForestClassifier.apply)
-
     def _estimators_(self):
         super()._estimators_()
         for est in self._cached_estimators_:
@@ -725,7 +922,7 @@ class ForestClassifier(BaseForest, _sklearn_ForestClassifier):
             "fit",
             {
                 "onedal": self.__class__._onedal_fit,
-                "sklearn": _sklearn_ForestClassifier.fit,
+                "sklearn": self.__class__._sklearn_fit,
             },
             X,
             y,
@@ -733,6 +930,10 @@ class ForestClassifier(BaseForest, _sklearn_ForestClassifier):
         )
         return self
 
+    def _sklearn_fit(self, X, y, sample_weight=None):
+        self._discard_onedal_estimator()
+        return _sklearn_ForestClassifier.fit(self, X, y, sample_weight)
+
     @wrap_output_data
     def predict(self, X):
         check_is_fitted(self)
@@ -797,6 +998,7 @@ class ForestClassifier(BaseForest, _sklearn_ForestClassifier):
             self,
             X,
             dtype=[xp.float64, xp.float32],
+            accept_sparse="csr",
             reset=False,
         )
 
@@ -824,6 +1026,7 @@ class ForestClassifier(BaseForest, _sklearn_ForestClassifier):
             self,
             X,
             dtype=[xp.float64, xp.float32],
+            accept_sparse="csr",
             reset=False,
         )
 
@@ -845,7 +1048,6 @@ class ForestClassifier(BaseForest, _sklearn_ForestClassifier):
 
 class ForestRegressor(BaseForest, _sklearn_ForestRegressor):
     _err = "out_of_bag_error_r2|out_of_bag_error_prediction"
-    _get_tree_state = staticmethod(get_tree_state_reg)
 
     def __init__(
         self,
@@ -888,9 +1090,6 @@ class ForestRegressor(BaseForest, _sklearn_ForestRegressor):
         if self._onedal_factory is None:
             raise TypeError(f" oneDAL estimator has not been set.")
 
-    decision_path = support_input_format(_sklearn_ForestRegressor.decision_path)
-    apply = support_input_format(_sklearn_ForestRegressor.apply)
-
     @staticmethod
     def _check_criterion(criterion):
         if (
@@ -971,7 +1170,7 @@ class ForestRegressor(BaseForest, _sklearn_ForestRegressor):
             "fit",
             {
                 "onedal": self.__class__._onedal_fit,
-                "sklearn": _sklearn_ForestRegressor.fit,
+                "sklearn": self.__class__._sklearn_fit,
             },
             X,
             y,
@@ -979,6 +1178,10 @@ class ForestRegressor(BaseForest, _sklearn_ForestRegressor):
         )
         return self
 
+    def _sklearn_fit(self, X, y, sample_weight=None):
+        self._discard_onedal_estimator()
+        return _sklearn_ForestRegressor.fit(self, X, y, sample_weight)
+
     @wrap_output_data
     def predict(self, X):
         check_is_fitted(self)
@@ -1015,6 +1218,7 @@ class ForestRegressor(BaseForest, _sklearn_ForestRegressor):
             self,
             X,
             dtype=[xp.float64, xp.float32],
+            accept_sparse="csr",
             reset=False,
         )  # Warning, order of dtype matters
 
@@ -1045,6 +1249,7 @@ class RandomForestClassifier(ForestClassifier):
         **_sklearn_RandomForestClassifier._parameter_constraints,
         "max_bins": [Interval(numbers.Integral, 2, None, closed="left")],
         "min_bin_size": [Interval(numbers.Integral, 1, None, closed="left")],
+        "memory_saving_mode": ["boolean"],
     }
 
     def __init__(
@@ -1071,6 +1276,7 @@ class RandomForestClassifier(ForestClassifier):
         monotonic_cst=None,
         max_bins=256,
         min_bin_size=1,
+        memory_saving_mode=False,
     ):
         super().__init__(
             DecisionTreeClassifier(),
@@ -1110,6 +1316,7 @@ class RandomForestClassifier(ForestClassifier):
         self.max_bins = max_bins
         self.min_bin_size = min_bin_size
         self.monotonic_cst = monotonic_cst
+        self.memory_saving_mode = memory_saving_mode
 
 
 @enable_array_api
@@ -1122,6 +1329,7 @@ class RandomForestRegressor(ForestRegressor):
         **_sklearn_RandomForestRegressor._parameter_constraints,
         "max_bins": [Interval(numbers.Integral, 2, None, closed="left")],
         "min_bin_size": [Interval(numbers.Integral, 1, None, closed="left")],
+        "memory_saving_mode": ["boolean"],
     }
 
     def __init__(
@@ -1147,6 +1355,7 @@ class RandomForestRegressor(ForestRegressor):
         monotonic_cst=None,
         max_bins=256,
         min_bin_size=1,
+        memory_saving_mode=False,
     ):
         criterion = self._check_criterion(criterion)
         super().__init__(
@@ -1186,6 +1395,7 @@ class RandomForestRegressor(ForestRegressor):
         self.max_bins = max_bins
         self.min_bin_size = min_bin_size
         self.monotonic_cst = monotonic_cst
+        self.memory_saving_mode = memory_saving_mode
 
 
 @enable_array_api
@@ -1198,6 +1408,7 @@ class ExtraTreesClassifier(ForestClassifier):
         **_sklearn_ExtraTreesClassifier._parameter_constraints,
         "max_bins": [Interval(numbers.Integral, 2, None, closed="left")],
         "min_bin_size": [Interval(numbers.Integral, 1, None, closed="left")],
+        "memory_saving_mode": ["boolean"],
     }
 
     def __init__(
@@ -1224,6 +1435,7 @@ class ExtraTreesClassifier(ForestClassifier):
         monotonic_cst=None,
         max_bins=256,
         min_bin_size=1,
+        memory_saving_mode=False,
     ):
         super().__init__(
             ExtraTreeClassifier(),
@@ -1263,6 +1475,7 @@ class ExtraTreesClassifier(ForestClassifier):
         self.max_bins = max_bins
         self.min_bin_size = min_bin_size
         self.monotonic_cst = monotonic_cst
+        self.memory_saving_mode = memory_saving_mode
 
 
 @enable_array_api
@@ -1275,6 +1488,7 @@ class ExtraTreesRegressor(ForestRegressor):
         **_sklearn_ExtraTreesRegressor._parameter_constraints,
         "max_bins": [Interval(numbers.Integral, 2, None, closed="left")],
         "min_bin_size": [Interval(numbers.Integral, 1, None, closed="left")],
+        "memory_saving_mode": ["boolean"],
     }
 
     def __init__(
@@ -1300,6 +1514,7 @@ class ExtraTreesRegressor(ForestRegressor):
         monotonic_cst=None,
         max_bins=256,
         min_bin_size=1,
+        memory_saving_mode=False,
     ):
         criterion = self._check_criterion(criterion)
         super().__init__(
@@ -1339,6 +1554,7 @@ class ExtraTreesRegressor(ForestRegressor):
         self.max_bins = max_bins
         self.min_bin_size = min_bin_size
         self.monotonic_cst = monotonic_cst
+        self.memory_saving_mode = memory_saving_mode
 
 
 # Allow for isinstance calls without inheritance changes using ABCMeta
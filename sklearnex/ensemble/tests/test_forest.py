@@ -14,6 +14,8 @@
 # limitations under the License.
 # ===============================================================================
 
+from copy import copy
+
 import array_api_strict
 import numpy as np
 import pandas as pd
@@ -344,3 +346,164 @@ def test_rf_mixed_devices(
         proba = model.predict_proba(X)
         assert proba.__class__ == X.__class__
     _ = model.score(X, y)
+
+
+@pytest.mark.parametrize("memory_saving_mode", [False, True])
+def test_rf_regression_memory_saving_mode(memory_saving_mode):
+    from sklearnex.ensemble import RandomForestRegressor
+
+    X, y = make_regression(n_samples=2000, n_features=6, random_state=0)
+    rf = RandomForestRegressor(
+        n_estimators=10, random_state=0, memory_saving_mode=memory_saving_mode
+    ).fit(X, y)
+    assert rf._onedal_estimator.memory_saving_mode == memory_saving_mode
+    assert rf.score(X, y) > 0.8
+
+
+@pytest.mark.parametrize(
+    "estimator_class", ["RandomForestClassifier", "ExtraTreesRegressor"]
+)
+def test_forest_warm_start(estimator_class):
+    from sklearnex import ensemble
+
+    X, y = make_classification(n_samples=300, n_features=8, random_state=0)
+    model = getattr(ensemble, estimator_class)(
+        n_estimators=5, max_depth=4, warm_start=True, random_state=0
+    )
+    model.fit(X, y)
+    model.set_params(n_estimators=12).fit(X, y)
+
+    # only the added trees are trained, in a second model merged into the forest
+    assert "sklearnex" in model.__module__
+    assert [n for _, n in model._onedal_estimator._onedal_models] == [5, 7]
+    assert len(model.estimators_) == 12
+
+    # the merged forest predicts as the average of all of its trees
+    if is_regressor(model):
+        expected = np.mean([tree.predict(X) for tree in model.estimators_], axis=0)
+        assert_allclose(model.predict(X), expected, rtol=1e-5, atol=1e-5)
+    else:
+        # the trees vote with the class distributions of their leaves, which
+        # the exported trees don't hold, so the models are inferred one by one
+        forest = model._onedal_estimator
+        expected = 0.0
+        for onedal_model, n_trees in forest._onedal_models:
+            part = copy(forest)
+            part._onedal_model, part._onedal_models = onedal_model, [
+                (onedal_model, n_trees)
+            ]
+            part.n_estimators, part._trees = n_trees, None
+            expected = expected + part.predict_proba(X) * (n_trees / 12)
+        assert_allclose(model.predict_proba(X), expected, rtol=1e-5, atol=1e-5)
+
+    with pytest.warns(UserWarning, match="without increasing n_estimators"):
+        model.fit(X, y)
+    with pytest.raises(ValueError, match="must be larger or equal"):
+        model.set_params(n_estimators=4).fit(X, y)
+
+
+@pytest.mark.parametrize(
+    "estimator_class", ["RandomForestClassifier", "ExtraTreesRegressor"]
+)
+def test_forest_apply_decision_path(estimator_class):
+    from scipy.sparse import hstack
+
+    from sklearnex import ensemble
+
+    X, y = make_classification(n_samples=300, n_features=8, random_state=0)
+    model = getattr(ensemble, estimator_class)(
+        n_estimators=10, max_depth=6, random_state=0
+    ).fit(X, y)
+
+    # the forest is traversed without building the scikit-learn trees
+    leaves = model.apply(X)
+    indicator, n_nodes_ptr = model.decision_path(X)
+    assert model._cached_estimators_ is None
+
+    X32 = X.astype(np.float32)
+    assert leaves.shape == (X.shape[0], 10)
+    assert np.array_equal(
+        leaves, np.stack([tree.apply(X32) for tree in model.estimators_], axis=1)
+    )
+    expected = hstack([tree.decision_path(X32) for tree in model.estimators_])
+    assert indicator.shape == expected.shape
+    assert (indicator != expected.tocsr()).nnz == 0
+    assert np.array_equal(
+        n_nodes_ptr,
+        np.cumsum([0] + [tree.tree_.node_count for tree in model.estimators_]),
+    )
+
+
+@pytest.mark.parametrize(
+    "estimator_class", ["RandomForestClassifier", "ExtraTreesRegressor"]
+)
+@pytest.mark.parametrize("max_depth", [None, 3])
+def test_forest_sparse_predict(estimator_class, max_depth):
+    from scipy.sparse import csr_matrix
+
+    from sklearnex import ensemble
+
+    X, y = make_classification(n_samples=300, n_features=8, random_state=0)
+    # the first feature is kept dense, so that the samples stay distinct
+    X[:, 1:][np.random.default_rng(0).random((300, 7)) < 0.7] = 0.0
+    model = getattr(ensemble, estimator_class)(
+        n_estimators=10, max_depth=max_depth, random_state=0
+    )
+    model.fit(X, y)
+    X_csr = csr_matrix(X)
+
+    # CSR data goes down the exported trees without being densified
+    assert np.array_equal(model.apply(X_csr), model.apply(X))
+    if is_regressor(model):
+        assert_allclose(model.predict(X_csr), model.predict(X), rtol=1e-5, atol=1e-5)
+    else:
+        # the class distributions of impure leaves of two classes follow from
+        # their gini impurity, which is rounded in the exported trees
+        assert model._onedal_estimator._leaf_distributions() is not None
+        atol = 1e-5 if max_depth is None else 1e-3
+        assert_allclose(model.predict_proba(X_csr), model.predict_proba(X), atol=atol)
+        assert np.array_equal(model.predict(X_csr), model.predict(X))
+
+
+def test_forest_sparse_predict_multiclass_fallback():
+    from scipy.sparse import csr_matrix
+
+    from sklearnex.ensemble import RandomForestClassifier
+
+    X, y = make_classification(
+        n_samples=300, n_features=8, n_informative=4, n_classes=3, random_state=0
+    )
+    model = RandomForestClassifier(n_estimators=10, max_depth=3, random_state=0)
+    model.fit(X, y)
+
+    # impure leaves of three classes have unknown distributions in the
+    # exported trees, so sparse data is predicted by scikit-learn
+    assert model._onedal_estimator._leaf_distributions() is None
+    proba = model.predict_proba(csr_matrix(X))
+    assert proba.shape == (300, 3)
+    assert_allclose(proba.sum(axis=1), 1)
+    assert np.array_equal(model.predict(csr_matrix(X)), model.classes_[proba.argmax(1)])
+
+
+@pytest.mark.parametrize(
+    "estimator_class", ["RandomForestClassifier", "ExtraTreesRegressor"]
+)
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_forest_prepare_inference(estimator_class, dtype):
+    from sklearnex import ensemble
+
+    X, y = make_classification(n_samples=300, n_features=8, random_state=0)
+    X = X.astype(dtype)
+    model = getattr(ensemble, estimator_class)(n_estimators=10, random_state=0)
+    model.fit(X, y)
+    prepared = model.prepare_inference(dtype=dtype)
+
+    for batch in (X[:1], X[:10], X):
+        assert_allclose(prepared.predict(batch), model.predict(batch))
+        if not is_regressor(model):
+            assert_allclose(
+                prepared.predict_proba(batch), model.predict_proba(batch), rtol=1e-6
+            )
+
+    with pytest.raises(ValueError, match="must be of shape"):
+        prepared.predict(X[:, :4])
@@ -14,19 +14,31 @@
 # limitations under the License.
 # ===============================================================================
 
-from .coordinate_descent import ElasticNet, Lasso
+from .coordinate_descent import (
+    ElasticNet,
+    ElasticNetCV,
+    Lasso,
+    LassoCV,
+    enet_path,
+    lasso_path,
+)
 from .incremental_linear import IncrementalLinearRegression
 from .incremental_ridge import IncrementalRidge
 from .linear import LinearRegression
 from .logistic_regression import LogisticRegression
-from .ridge import Ridge
+from .ridge import Ridge, RidgeCV
 
 __all__ = [
     "ElasticNet",
+    "ElasticNetCV",
     "IncrementalLinearRegression",
     "IncrementalRidge",
     "Lasso",
+    "LassoCV",
     "LinearRegression",
     "LogisticRegression",
     "Ridge",
+    "RidgeCV",
+    "enet_path",
+    "lasso_path",
 ]
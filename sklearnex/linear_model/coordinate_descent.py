@@ -14,7 +14,14 @@
 # limitations under the License.
 # ===============================================================================
 
-from daal4py.sklearn.linear_model import ElasticNet, Lasso
+from daal4py.sklearn.linear_model import (
+    ElasticNet,
+    ElasticNetCV,
+    Lasso,
+    LassoCV,
+    enet_path,
+    lasso_path,
+)
 
 from ..base import oneDALEstimator
 
@@ -23,3 +30,9 @@ ElasticNet._doc_link_url_param_generator = oneDALEstimator._doc_link_url_param_g
 
 Lasso._doc_link_module = "daal4py"
 Lasso._doc_link_url_param_generator = oneDALEstimator._doc_link_url_param_generator
+
+ElasticNetCV._doc_link_module = "daal4py"
+ElasticNetCV._doc_link_url_param_generator = oneDALEstimator._doc_link_url_param_generator
+
+LassoCV._doc_link_module = "daal4py"
+LassoCV._doc_link_url_param_generator = oneDALEstimator._doc_link_url_param_generator
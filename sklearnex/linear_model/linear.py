@@ -31,7 +31,7 @@ from .._device_offload import dispatch, wrap_output_data
 from .._utils import PatchingConditionsChain, get_patch_message, register_hyperparameters
 from ..base import oneDALEstimator
 from ..utils._array_api import enable_array_api
-from ..utils.validation import validate_data
+from ..utils.validation import _check_sample_weight, validate_data
 from ._base_linear_model import _BaseLinearModel
 
 if sklearn_check_version("1.9"):
@@ -184,19 +184,20 @@ class LinearRegression(oneDALEstimator, _sklearn_LinearRegression, _BaseLinearMo
         n_samples = _num_samples(X)
         n_features = _num_features(X, fallback_1d=True)
 
-        # Note: support for some variants was either introduced in oneDAL 2025.1,
-        # or had bugs in some uncommon cases in older versions.
+        # Note: support for underdetermined problems was introduced in oneDAL 2025.1.
         is_underdetermined = n_samples < (n_features + int(self.fit_intercept))
         supports_all_variants = daal_check_version((2025, "P", 1))
-        is_multi_output = _num_features(y, fallback_1d=True) > 1
+        if sample_weight is not None:
+            xp_sw, _ = get_namespace(sample_weight)
+            non_negative_weights = bool(xp_sw.all(xp_sw.asarray(sample_weight) >= 0))
 
         patching_status.and_conditions(
             [
-                (sample_weight is None, "Sample weight is not supported."),
                 (
-                    not is_sparse(X) and not is_sparse(y),
-                    "Sparse input is not supported.",
+                    sample_weight is None or non_negative_weights,
+                    "Negative sample weights are not supported.",
                 ),
+                (not is_sparse(y), "Sparse target is not supported."),
                 (not normalize_is_set, "Normalization is not supported."),
                 (
                     not positive_is_set,
@@ -207,10 +208,6 @@ class LinearRegression(oneDALEstimator, _sklearn_LinearRegression, _BaseLinearMo
                     "The shape of X (fitting) does not satisfy oneDAL requirements:"
                     "Number of features + 1 >= number of samples.",
                 ),
-                (
-                    not is_multi_output or supports_all_variants,
-                    "Multi-output regression is not supported.",
-                ),
             ]
         )
 
@@ -224,7 +221,6 @@ class LinearRegression(oneDALEstimator, _sklearn_LinearRegression, _BaseLinearMo
         patching_status.and_conditions(
             [
                 (n_samples > 0, "Number of samples is less than 1."),
-                (not is_sparse(data[0]), "Sparse input is not supported."),
                 (not model_is_sparse, "Sparse coefficients are not supported."),
             ]
         )
@@ -239,27 +235,26 @@ class LinearRegression(oneDALEstimator, _sklearn_LinearRegression, _BaseLinearMo
         self._onedal_estimator = self._onedal_LinearRegression(**onedal_params)
 
     def _onedal_fit(self, X, y, sample_weight, queue=None):
-        assert sample_weight is None
-
         if sklearn_check_version("1.9"):
             xp, _ = get_namespace(X)
         else:
             xp, _ = get_namespace(X, y)
 
-        supports_multi_output = daal_check_version((2025, "P", 1))
         X, y = validate_data(
             self,
             X=X,
             y=y,
             dtype=[xp.float64, xp.float32],
-            accept_sparse=["csr", "csc", "coo"],
+            accept_sparse="csr",
             y_numeric=True,
-            multi_output=supports_multi_output,
+            multi_output=True,
         )
+        if sample_weight is not None:
+            sample_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
 
         self._initialize_onedal_estimator()
 
-        self._onedal_estimator.fit(X, y, queue=queue)
+        self._onedal_estimator.fit(X, y, sample_weight, queue=queue)
 
         self.n_features_in_ = self._onedal_estimator.n_features_in_
         self._sparse = False
@@ -274,7 +269,7 @@ class LinearRegression(oneDALEstimator, _sklearn_LinearRegression, _BaseLinearMo
         xp, _ = get_namespace(X)
 
         X = validate_data(
-            self, X, accept_sparse=False, dtype=[xp.float64, xp.float32], reset=False
+            self, X, accept_sparse="csr", dtype=[xp.float64, xp.float32], reset=False
         )
 
         if sklearn_check_version("1.9"):
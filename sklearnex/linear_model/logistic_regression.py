@@ -41,7 +41,8 @@ if daal_check_version((2024, "P", 1)):
     from .._device_offload import dispatch, wrap_output_data
     from .._utils import PatchingConditionsChain, get_patch_message
     from ..utils._array_api import enable_array_api
-    from ..utils.validation import validate_data
+    from ..utils.class_weight import _compute_class_weight
+    from ..utils.validation import _check_sample_weight, validate_data
 
     if sklearn_check_version("1.9"):
         from sklearn.utils._array_api import (
@@ -269,6 +270,9 @@ if daal_check_version((2024, "P", 1)):
             )
 
             target_type = type_of_target(y, input_name="y")
+            if sample_weight is not None:
+                xp_sw, _ = get_namespace(sample_weight)
+                non_negative_weights = bool(xp_sw.all(xp_sw.asarray(sample_weight) >= 0))
             patching_status.and_conditions(
                 [
                     (
@@ -285,8 +289,10 @@ if daal_check_version((2024, "P", 1)):
                         self.intercept_scaling == 1,
                         "Intercept scaling is not supported.",
                     ),
-                    (self.class_weight is None, "Class weight is not supported"),
-                    (self.solver == "newton-cg", "Only newton-cg solver is supported."),
+                    (
+                        self.solver in ["newton-cg", "lbfgs"],
+                        "Only newton-cg and lbfgs solvers are supported.",
+                    ),
                     (self.warm_start == False, "Warm start is not supported."),
                     (
                         sklearn_check_version("1.8") or self.multi_class != "multinomial",
@@ -296,7 +302,19 @@ if daal_check_version((2024, "P", 1)):
                         not self.l1_ratio,
                         "l1 penalty is not supported.",
                     ),
-                    (sample_weight is None, "Sample weight is not supported."),
+                    (
+                        sample_weight is None or non_negative_weights,
+                        "Negative sample weights are not supported.",
+                    ),
+                    (
+                        # weighted fits are solved with the operations of the
+                        # array namespace, which only run on the device for
+                        # array API inputs kept there
+                        (sample_weight is None and self.class_weight is None)
+                        or check_is_array_api(X),
+                        "Sample and class weights are only supported for array "
+                        "API inputs.",
+                    ),
                     (
                         target_type == "binary",
                         "Only binary classification is supported",
@@ -387,8 +405,8 @@ if daal_check_version((2024, "P", 1)):
             return patching_status
 
         def _onedal_gpu_initialize_estimator(self, override_solver: bool = False):
-            # We need to override solver in case the model is only used for inference, since newton-cg is the only supported solver for GPU
-            # For example, if we trained model with lbfgs solver (with fall back to stock sklearn) and we want to run the inference on GPU using sklearnex code
+            # We need to override solver in case the model is only used for inference, since the model can come from a solver that is not supported on GPU
+            # For example, if we trained model with saga solver (with fall back to stock sklearn) and we want to run the inference on GPU using sklearnex code
             onedal_params = {
                 "tol": self.tol,
                 "C": self.C,
@@ -407,7 +425,6 @@ if daal_check_version((2024, "P", 1)):
             if queue is None or queue.sycl_device.is_cpu:
                 # TODO add array-api support for CPU
                 return self._onedal_cpu_fit(X, y, sample_weight)
-            assert sample_weight is None
             xp, is_array_api = get_namespace(X)
             xp_y, is_array_api_compliant_y = get_namespace(y)
 
@@ -436,8 +453,27 @@ if daal_check_version((2024, "P", 1)):
             else:
                 y_bin = xp.asarray(y == self.classes_[1], dtype=xp.int32)
 
+            if sample_weight is not None or self.class_weight is not None:
+                sample_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
+                if self.class_weight is not None:
+                    class_weight_ = _compute_class_weight(
+                        self.class_weight,
+                        classes=self.classes_,
+                        y=y,
+                        sample_weight=sample_weight,
+                    )
+                    class_weight_ = xp.asarray(
+                        class_weight_, dtype=X.dtype, device=getattr(X, "device", None)
+                    )
+                    sample_weight = sample_weight * xp.take(class_weight_, y_bin)
+
+            if self.solver == "lbfgs":
+                logging.getLogger("sklearnex").info(
+                    "'lbfgs' is computed with the 'newton-cg' solver of oneDAL, "
+                    "n_iter_ counts its Newton iterations."
+                )
             self._onedal_gpu_initialize_estimator()
-            self._onedal_estimator.fit(X, y_bin, queue=queue)
+            self._onedal_estimator.fit(X, y_bin, sample_weight, queue=queue)
             self._onedal_gpu_save_attributes()
 
         # This should only be called when 'X' is on CPU
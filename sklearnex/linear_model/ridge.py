@@ -23,12 +23,15 @@ if daal_check_version((2024, "P", 600)):
 
     import numpy as np
     from sklearn.linear_model import Ridge as _sklearn_Ridge
+    from sklearn.linear_model import RidgeCV as _sklearn_RidgeCV
     from sklearn.metrics import r2_score
     from sklearn.utils._array_api import get_namespace
+    from sklearn.utils.metadata_routing import _raise_for_params
     from sklearn.utils.validation import check_is_fitted
 
     from daal4py.sklearn._n_jobs_support import control_n_jobs
     from daal4py.sklearn._utils import is_sparse
+    from onedal.linear_model import IncrementalRidge as onedal_IncrementalRidge
     from onedal.linear_model import Ridge as onedal_Ridge
     from onedal.utils.validation import _num_features, _num_samples
 
@@ -36,7 +39,7 @@ if daal_check_version((2024, "P", 600)):
     from .._utils import PatchingConditionsChain
     from ..base import oneDALEstimator
     from ..utils._array_api import enable_array_api
-    from ..utils.validation import validate_data
+    from ..utils.validation import _check_sample_weight, validate_data
     from ._base_linear_model import _BaseLinearModel
 
     if sklearn_check_version("1.9"):
@@ -140,6 +143,20 @@ if daal_check_version((2024, "P", 600)):
             )
             positive_is_set = hasattr(self, "positive") and self.positive
 
+            if sample_weight is not None:
+                xp_sw, _ = get_namespace(sample_weight)
+                non_negative_weights = bool(xp_sw.all(xp_sw.asarray(sample_weight) >= 0))
+
+            # a non-scalar alpha gives the penalties of the individual targets
+            if isinstance(self.alpha, numbers.Real):
+                is_alpha_supported = True
+            else:
+                alpha = np.asarray(self.alpha).reshape(-1)
+                n_targets = _num_features(y, fallback_1d=True)
+                is_alpha_supported = alpha.shape[0] in (1, n_targets) and bool(
+                    np.all(alpha >= 0)
+                )
+
             patching_status.and_conditions(
                 [
                     (
@@ -147,19 +164,20 @@ if daal_check_version((2024, "P", 600)):
                         f"'{self.solver}' solver is not supported. "
                         "Only 'auto' solver is supported.",
                     ),
+                    (not is_sparse(y), "Sparse target is not supported."),
                     (
-                        not is_sparse(X) and not is_sparse(y),
-                        "Sparse input is not supported.",
+                        sample_weight is None or non_negative_weights,
+                        "Negative sample weights are not supported.",
                     ),
-                    (sample_weight is None, "Sample weight is not supported."),
                     (not normalize_is_set, "Normalization is not supported."),
                     (
                         not positive_is_set,
                         "Forced positive coefficients are not supported.",
                     ),
                     (
-                        isinstance(self.alpha, numbers.Real),
-                        "Non-scalar alpha is not supported yet.",
+                        is_alpha_supported,
+                        "Non-scalar alpha must be non-negative and have one value "
+                        "per target.",
                     ),
                 ]
             )
@@ -182,7 +200,6 @@ if daal_check_version((2024, "P", 600)):
                         "Only 'auto' solver is supported.",
                     ),
                     (n_samples > 0, "Number of samples is less than 1."),
-                    (not is_sparse(data[0]), "Sparse input is not supported."),
                     (not model_is_sparse, "Sparse coefficients are not supported."),
                 ]
             )
@@ -261,9 +278,6 @@ if daal_check_version((2024, "P", 600)):
             self._onedal_estimator = self._onedal_Ridge(**onedal_params)
 
         def _onedal_fit(self, X, y, sample_weight, queue=None):
-            # `Sample weight` is not supported. Expected to be None value.
-            assert sample_weight is None
-
             if sklearn_check_version("1.9"):
                 xp, _ = get_namespace(X)
             else:
@@ -276,13 +290,15 @@ if daal_check_version((2024, "P", 600)):
                 X=X,
                 y=y,
                 dtype=[xp.float64, xp.float32],
-                accept_sparse=["csr", "csc", "coo"],
+                accept_sparse="csr",
                 y_numeric=True,
                 multi_output=True,
             )
+            if sample_weight is not None:
+                sample_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
 
             self._initialize_onedal_estimator()
-            self._onedal_estimator.fit(X, y, queue=queue)
+            self._onedal_estimator.fit(X, y, sample_weight, queue=queue)
             self.n_features_in_ = self._onedal_estimator.n_features_in_
             self._coef_ = self._onedal_estimator.coef_
             self._intercept_ = self._onedal_estimator.intercept_
@@ -294,7 +310,7 @@ if daal_check_version((2024, "P", 600)):
         def _onedal_predict(self, X, queue=None):
             xp, _ = get_namespace(X)
             X = validate_data(
-                self, X, accept_sparse=False, dtype=[xp.float64, xp.float32], reset=False
+                self, X, accept_sparse="csr", dtype=[xp.float64, xp.float32], reset=False
             )
 
             if sklearn_check_version("1.9"):
@@ -351,5 +367,336 @@ if daal_check_version((2024, "P", 600)):
         predict.__doc__ = _sklearn_Ridge.predict.__doc__
         score.__doc__ = _sklearn_Ridge.score.__doc__
 
+    @enable_array_api
+    @control_n_jobs(decorated_methods=["fit", "predict", "score"])
+    class RidgeCV(oneDALEstimator, _sklearn_RidgeCV, _BaseLinearModel):
+        __doc__ = _sklearn_RidgeCV.__doc__
+
+        _parameter_constraints: dict = {**_sklearn_RidgeCV._parameter_constraints}
+
+        _onedal_IncrementalRidge = staticmethod(onedal_IncrementalRidge)
+        _onedal_Ridge = staticmethod(onedal_Ridge)
+
+        def fit(self, X, y, sample_weight=None, **params):
+            self._validate_params()
+
+            # It is necessary to properly update coefs for predict if we
+            # fallback to sklearn in dispatch
+            if hasattr(self, "_onedal_estimator"):
+                del self._onedal_estimator
+
+            dispatch(
+                self,
+                "fit",
+                {
+                    "onedal": self.__class__._onedal_fit,
+                    "sklearn": _sklearn_RidgeCV.fit,
+                },
+                X,
+                y,
+                sample_weight,
+                **params,
+            )
+            return self
+
+        @wrap_output_data
+        def predict(self, X):
+            check_is_fitted(self)
+
+            return dispatch(
+                self,
+                "predict",
+                {
+                    "onedal": self.__class__._onedal_predict,
+                    "sklearn": _sklearn_RidgeCV.predict,
+                },
+                X,
+            )
+
+        @wrap_output_data
+        def score(self, X, y, sample_weight=None):
+            check_is_fitted(self)
+
+            return dispatch(
+                self,
+                "score",
+                {
+                    "onedal": self.__class__._onedal_score,
+                    "sklearn": _sklearn_RidgeCV.score,
+                },
+                X,
+                y,
+                sample_weight=sample_weight,
+            )
+
+        def _onedal_fit_supported(self, patching_status, method_name, *data):
+            assert method_name == "fit"
+            assert len(data) == 3
+            X, y, sample_weight = data
+
+            n_samples = _num_samples(X)
+            n_features = _num_features(X, fallback_1d=True)
+            alphas = np.asarray(self.alphas).reshape(-1)
+
+            if sample_weight is not None:
+                xp_sw, _ = get_namespace(sample_weight)
+                non_negative_weights = bool(xp_sw.all(xp_sw.asarray(sample_weight) >= 0))
+
+            patching_status.and_conditions(
+                [
+                    (
+                        self.cv is None,
+                        "Only leave-one-out cross-validation (cv=None) is supported.",
+                    ),
+                    (self.scoring is None, "Scoring is not supported."),
+                    (
+                        self.gcv_mode in [None, "auto", "eigen"],
+                        f"'{self.gcv_mode}' gcv_mode is not supported.",
+                    ),
+                    (
+                        getattr(self, "store_cv_values", "deprecated")
+                        in ["deprecated", False],
+                        "store_cv_values is not supported.",
+                    ),
+                    (
+                        not is_sparse(X) and not is_sparse(y),
+                        "Sparse input is not supported.",
+                    ),
+                    (
+                        n_samples > n_features,
+                        "The number of samples must be larger than the number "
+                        "of features.",
+                    ),
+                    (
+                        alphas.shape[0] > 0 and bool(np.all(alphas > 0)),
+                        "All alphas must be positive.",
+                    ),
+                    (
+                        sample_weight is None or non_negative_weights,
+                        "Negative sample weights are not supported.",
+                    ),
+                ]
+            )
+
+            return patching_status
+
+        def _onedal_predict_supported(self, patching_status, method_name, *data):
+            assert method_name in ["predict", "score"]
+            assert len(data) <= 2
+
+            n_samples = _num_samples(data[0])
+            model_is_sparse = is_sparse(self.coef_) or (
+                self.fit_intercept and is_sparse(self.intercept_)
+            )
+            patching_status.and_conditions(
+                [
+                    (n_samples > 0, "Number of samples is less than 1."),
+                    (not model_is_sparse, "Sparse coefficients are not supported."),
+                ]
+            )
+
+            return patching_status
+
+        def _onedal_supported(self, method_name, *data):
+            patching_status = PatchingConditionsChain(
+                f"sklearn.linear_model.{self.__class__.__name__}.{method_name}"
+            )
+
+            if method_name == "fit":
+                return self._onedal_fit_supported(patching_status, method_name, *data)
+
+            if method_name in ["predict", "score"]:
+                return self._onedal_predict_supported(patching_status, method_name, *data)
+
+            raise RuntimeError(
+                f"Unknown method {method_name} in {self.__class__.__name__}"
+            )
+
+        _onedal_cpu_supported = _onedal_supported
+        _onedal_gpu_supported = _onedal_supported
+
+        def _initialize_onedal_estimator(
+            self, override_fit_intercept: bool = False
+        ) -> None:
+            onedal_params = {
+                "fit_intercept": self._get_fit_intercept(override_fit_intercept),
+            }
+            self._onedal_estimator = self._onedal_Ridge(**onedal_params)
+
+        def _onedal_fit(self, X, y, sample_weight, queue=None, **params):
+            # the scorer is the only consumer of the extra parameters
+            _raise_for_params(params, self, "fit")
+
+            if sklearn_check_version("1.9"):
+                xp, _ = get_namespace(X)
+            else:
+                xp, _ = get_namespace(X, y)
+
+            X, y = validate_data(
+                self,
+                X=X,
+                y=y,
+                dtype=[xp.float64, xp.float32],
+                y_numeric=True,
+                multi_output=True,
+            )
+            if sample_weight is not None:
+                sample_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
+
+            n_samples = X.shape[0]
+            y_2d = xp.reshape(y, (-1, 1)) if y.ndim == 1 else y
+            y_2d = xp.astype(y_2d, X.dtype)
+            n_y = y_2d.shape[1]
+
+            # Centering with the (weighted) means and scaling the rows by the
+            # square roots of the weights reduce the problem to the unweighted
+            # one without intercept, as in scikit-learn.
+            if sample_weight is None:
+                sqrt_sw = xp.ones_like(X[:, 0])
+                X_offset, y_offset = xp.mean(X, axis=0), xp.mean(y_2d, axis=0)
+            else:
+                sqrt_sw = xp.sqrt(sample_weight)
+                sw_sum = xp.sum(sample_weight)
+                X_offset = (sample_weight @ X) / sw_sum
+                y_offset = (sample_weight @ y_2d) / sw_sum
+            if self.fit_intercept:
+                X, y_2d = X - X_offset, y_2d - y_offset
+            if sample_weight is not None:
+                X = X * xp.reshape(sqrt_sw, (-1, 1))
+                y_2d = y_2d * xp.reshape(sqrt_sw, (-1, 1))
+
+            # X^T X and X^T y do not depend on alpha, they are accumulated once
+            # by oneDAL and the problems of all alphas are solved from them
+            estimator = self._onedal_IncrementalRidge(fit_intercept=False, alpha=0.0)
+            estimator.partial_fit(X, y_2d, queue=queue)
+            xtx, xty = estimator._get_cross_products()
+
+            # With X^T X = V diag(eigvals) V^T, the hat matrix of alpha is
+            # (X V) diag(1 / (eigvals + alpha)) (X V)^T, so that one product
+            # X V gives the leave-one-out errors of every alpha.
+            eigvals, V = xp.linalg.eigh(xtx)
+            XV = X @ V
+            XV_sq = XV**2
+            VT_xty = V.T @ xty
+            intercept_leverage = (sqrt_sw**2) / xp.sum(sqrt_sw**2)
+
+            alphas = [float(alpha) for alpha in np.asarray(self.alphas).reshape(-1)]
+            if self.store_cv_results:
+                cv_results = []
+
+            best_coef, best_score, best_alpha = None, None, None
+            for alpha in alphas:
+                D = 1.0 / (eigvals + alpha)
+                D_VT_xty = xp.reshape(D, (-1, 1)) * VT_xty
+                coef = V @ D_VT_xty
+                alpha_c = y_2d - XV @ D_VT_xty
+                alpha_d = 1.0 - XV_sq @ D
+                if self.fit_intercept:
+                    alpha_d = alpha_d - intercept_leverage
+                looe = alpha_c / xp.reshape(alpha_d, (-1, 1))
+                if y.ndim == 1:
+                    looe = looe[:, 0]
+
+                squared_errors = looe**2
+                if self.alpha_per_target:
+                    alpha_score = xp.mean(-squared_errors, axis=0)
+                else:
+                    alpha_score = xp.mean(-squared_errors)
+                if self.store_cv_results:
+                    cv_results.append(squared_errors)
+
+                if best_score is None:
+                    best_coef, best_score = coef, alpha_score
+                    if self.alpha_per_target and n_y > 1:
+                        best_alpha = xp.full(
+                            n_y, alpha, dtype=X.dtype, device=getattr(X, "device", None)
+                        )
+                    else:
+                        best_alpha = alpha
+                elif self.alpha_per_target and n_y > 1:
+                    to_update = alpha_score > best_score
+                    best_coef = xp.where(to_update, coef, best_coef)
+                    best_score = xp.where(to_update, alpha_score, best_score)
+                    best_alpha = xp.where(
+                        to_update, xp.full_like(best_alpha, alpha), best_alpha
+                    )
+                elif alpha_score > best_score:
+                    best_coef, best_score, best_alpha = coef, alpha_score, alpha
+
+            self.alpha_ = best_alpha
+            self.best_score_ = best_score
+            if self.store_cv_results:
+                self.cv_results_ = xp.stack(cv_results, axis=-1)
+
+            coef = best_coef.T
+            intercept = y_offset - X_offset @ best_coef if self.fit_intercept else 0.0
+            if n_y == 1:
+                coef = xp.reshape(coef, (-1,))
+            if y.ndim == 1 and self.fit_intercept:
+                intercept = intercept[0]
+
+            self._coef_ = coef
+            self._intercept_ = intercept
+
+        def _onedal_predict(self, X, queue=None):
+            xp, _ = get_namespace(X)
+            X = validate_data(
+                self, X, accept_sparse="csr", dtype=[xp.float64, xp.float32], reset=False
+            )
+
+            if sklearn_check_version("1.9"):
+                check_same_namespace(X, self, attribute="coef_", method="predict")
+
+            if not hasattr(self, "_onedal_estimator"):
+                self._initialize_onedal_estimator_from_coefs()
+
+            res = self._onedal_estimator.predict(X, queue=queue)
+            if res.shape[1] == 1 and self.coef_.ndim == 1:
+                return xp.reshape(res, (-1,))
+            else:
+                return res
+
+        def _onedal_score(self, X, y, sample_weight=None, queue=None):
+            if sklearn_check_version("1.9"):
+                xp, _, device_ = get_namespace_and_device(X)
+                y = move_to(y, xp=xp, device=device_)
+            return r2_score(
+                y, self._onedal_predict(X, queue=queue), sample_weight=sample_weight
+            )
+
+        @property
+        def coef_(self):
+            return self._coef_
+
+        @coef_.setter
+        def coef_(self, value):
+            if hasattr(self, "_onedal_estimator"):
+                self._onedal_estimator.coef_ = value
+                self._onedal_estimator._onedal_model = None
+            self._coef_ = value
+
+        @coef_.deleter
+        def coef_(self):
+            del self._coef_
+
+        @property
+        def intercept_(self):
+            return self._intercept_
+
+        @intercept_.setter
+        def intercept_(self, value):
+            if hasattr(self, "_onedal_estimator"):
+                self._onedal_estimator.intercept_ = value
+                self._onedal_estimator._onedal_model = None
+            self._intercept_ = value
+
+        @intercept_.deleter
+        def intercept_(self):
+            del self._intercept_
+
+        fit.__doc__ = _sklearn_RidgeCV.fit.__doc__
+        predict.__doc__ = _sklearn_RidgeCV.predict.__doc__
+        score.__doc__ = _sklearn_RidgeCV.score.__doc__
+
 else:
     raise ImportError("Ridge requires oneDAL version >= 2024.6 but it was not found")
@@ -58,7 +58,7 @@ def test_sklearnex_import_linear(
     overdetermined,
     multi_output,
 ):
-    if (not overdetermined or multi_output) and not daal_check_version((2025, "P", 1)):
+    if not overdetermined and not daal_check_version((2025, "P", 1)):
         pytest.skip("Functionality introduced in later versions")
     if (
         not overdetermined
@@ -112,6 +112,82 @@ def test_sklearnex_import_linear(
         assert_allclose(linreg_list.intercept_, linreg.intercept_)
 
 
+@pytest.mark.parametrize("dataframe,queue", get_dataframes_and_queues())
+@pytest.mark.parametrize("fit_intercept", [True, False])
+@pytest.mark.parametrize("multi_output", [False, True])
+def test_sklearnex_linear_sample_weight(dataframe, queue, fit_intercept, multi_output):
+    from sklearn.linear_model import LinearRegression as _sklearn_LinearRegression
+
+    from sklearnex.linear_model import LinearRegression
+
+    rng = np.random.default_rng(seed=42)
+    X = rng.standard_normal(size=(50, 5))
+    y = rng.standard_normal(size=(50, 3) if multi_output else 50)
+    sample_weight = rng.random(50)
+    sample_weight[:5] = 0
+
+    expected = _sklearn_LinearRegression(fit_intercept=fit_intercept).fit(
+        X, y, sample_weight=sample_weight
+    )
+
+    X_c = _convert_to_dataframe(X, sycl_queue=queue, target_df=dataframe)
+    y_c = _convert_to_dataframe(y, sycl_queue=queue, target_df=dataframe)
+    sw_c = _convert_to_dataframe(sample_weight, sycl_queue=queue, target_df=dataframe)
+    linreg = LinearRegression(fit_intercept=fit_intercept).fit(X_c, y_c, sw_c)
+
+    assert hasattr(linreg, "_onedal_estimator")
+    assert_allclose(_as_numpy(linreg.coef_), expected.coef_, atol=1e-6)
+    assert_allclose(_as_numpy(linreg.intercept_), expected.intercept_, atol=1e-6)
+
+
+@pytest.mark.parametrize("fit_intercept", [True, False])
+@pytest.mark.parametrize("use_sample_weight", [False, True])
+def test_sklearnex_linear_sparse(fit_intercept, use_sample_weight):
+    import scipy.sparse as sp
+    from sklearn.linear_model import LinearRegression as _sklearn_LinearRegression
+
+    from sklearnex.linear_model import LinearRegression
+
+    rng = np.random.default_rng(seed=42)
+    X = sp.random(100, 8, density=0.3, format="csr", random_state=42)
+    y = rng.standard_normal(size=100)
+    sample_weight = rng.random(100) if use_sample_weight else None
+
+    expected = _sklearn_LinearRegression(fit_intercept=fit_intercept).fit(
+        X.toarray(), y, sample_weight=sample_weight
+    )
+    linreg = LinearRegression(fit_intercept=fit_intercept).fit(X, y, sample_weight)
+
+    assert hasattr(linreg, "_onedal_estimator")
+    assert_allclose(linreg.coef_, expected.coef_, atol=1e-6)
+    assert_allclose(linreg.intercept_, expected.intercept_, atol=1e-6)
+    assert_allclose(linreg.predict(X), expected.predict(X.toarray()), atol=1e-6)
+
+
+@pytest.mark.parametrize("fit_intercept", [True, False])
+def test_sklearnex_linear_sparse_small_variance(fit_intercept):
+    import scipy.sparse as sp
+    from sklearn.linear_model import LinearRegression as _sklearn_LinearRegression
+
+    from sklearnex.linear_model import LinearRegression
+
+    # the eigenvalue of the feature of small variance is far above the
+    # rounding errors of X^T X, even in float32 over many rows
+    rng = np.random.default_rng(seed=42)
+    X = rng.standard_normal(size=(200_000, 3)) * np.array([1.0, 1.0, 0.05])
+    X[rng.random(X.shape) < 0.5] = 0.0
+    y = X @ np.array([1.0, -2.0, 5.0]) + 0.5
+
+    expected = _sklearn_LinearRegression(fit_intercept=fit_intercept).fit(X, y)
+    linreg = LinearRegression(fit_intercept=fit_intercept).fit(
+        sp.csr_matrix(X, dtype=np.float32), y.astype(np.float32)
+    )
+
+    assert hasattr(linreg, "_onedal_estimator")
+    assert_allclose(linreg.coef_, expected.coef_, rtol=1e-3, atol=1e-3)
+    assert_allclose(linreg.intercept_, expected.intercept_, atol=1e-3)
+
+
 # Note: Lasso and ElasticNet do not have GPU implementations.
 # If that changes, then the filters for 'get_dataframes_and_queues'
 # should be removed from these tests.
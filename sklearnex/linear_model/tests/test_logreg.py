@@ -541,6 +541,115 @@ def test_custom_solvers_are_correct(multi_class, C, solver, n_classes):
     )
 
 
+@pytest.mark.skipif(
+    not sklearn_check_version("1.8"), reason="Weights require sklearn>=1.8"
+)
+@pytest.mark.parametrize("n_classes", [2, 3])
+@pytest.mark.parametrize(
+    "class_weight,weighted", [("balanced", False), ({0: 2.0, 1: 0.5}, True), (None, True)]
+)
+def test_lbfgs_weights_are_correct(n_classes, class_weight, weighted):
+    from sklearnex.linear_model import LogisticRegression
+
+    X, y = make_classification(
+        n_samples=300,
+        n_features=5,
+        n_informative=3,
+        n_classes=n_classes,
+        weights=[0.7] + [0.3 / (n_classes - 1)] * (n_classes - 1),
+        random_state=0,
+    )
+    # few distinct values, which are fitted with oneDAL
+    sample_weight = (
+        np.random.default_rng(0).integers(1, 4, size=y.shape[0]).astype(np.float64)
+        if weighted
+        else None
+    )
+    params = {"class_weight": class_weight, "max_iter": 10_000}
+    model_sklearn = _sklearn_LogisticRegression(**params, tol=1e-10).fit(
+        X, y, sample_weight=sample_weight
+    )
+    model_sklearnex = LogisticRegression(**params, tol=1e-8).fit(
+        X, y, sample_weight=sample_weight
+    )
+
+    assert_allclose(model_sklearnex.coef_, model_sklearn.coef_, atol=1e-4)
+    assert_allclose(
+        model_sklearnex.predict_proba(X), model_sklearn.predict_proba(X), atol=1e-5
+    )
+
+
+def test_gpu_weights_require_array_api_inputs():
+    from sklearnex.linear_model import LogisticRegression
+
+    X, y = make_classification(random_state=0)
+    model = LogisticRegression(solver="lbfgs")
+
+    # NumPy inputs are fitted on host, where the weighted Newton-CG
+    # iterations in the array namespace of the data wouldn't use the device
+    status = model._onedal_gpu_supported("fit", X, y, np.ones(y.shape[0]))
+    assert not status.get_status()
+    assert (
+        "Sample and class weights are only supported for array API inputs."
+        in status.messages
+    )
+    assert model._onedal_gpu_supported("fit", X, y, None).get_status()
+
+
+@pytest.mark.skipif(
+    not daal_check_version((2024, "P", 1)), reason="Requires oneDAL >= 2024.0.1"
+)
+@pytest.mark.parametrize("n_classes", [2, 3])
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_logistic_regression_cv_is_correct(n_classes, n_jobs, monkeypatch, tmp_path):
+    import sklearn.linear_model._logistic as logistic_module
+    from sklearn.linear_model import LogisticRegressionCV as _sklearn_LogisticRegressionCV
+
+    from daal4py.sklearn.linear_model import logistic_path
+    from sklearnex.preview.linear_model import LogisticRegressionCV
+
+    hook = logistic_path.log_reg_scoring_path_cv
+
+    def scoring_path(*args, **kwargs):
+        # records the process of the fold and whether the hook has to replace
+        # the path of scikit-learn there
+        original = logistic_module._logistic_regression_path is lr_path_original
+        (tmp_path / str(os.getpid())).write_text(str(original))
+        return hook(*args, **kwargs)
+
+    lr_path_original = logistic_path.lr_path_original
+    monkeypatch.setattr(logistic_path, "log_reg_scoring_path_cv", scoring_path)
+
+    X, y = make_classification(
+        n_samples=300,
+        n_features=5,
+        n_informative=3,
+        n_classes=n_classes,
+        random_state=0,
+    )
+    # the folds run in worker processes with 'n_jobs=2'
+    params = {"Cs": 5, "max_iter": 10_000, "n_jobs": n_jobs}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=FutureWarning)
+        model_sklearn = _sklearn_LogisticRegressionCV(**params, tol=1e-10).fit(X, y)
+        model_sklearnex = LogisticRegressionCV(**params, tol=1e-8).fit(X, y)
+
+    # sequential folds run with the path replaced by the fit, while the
+    # folds in worker processes get it from the hook
+    folds = {path.name: path.read_text() for path in tmp_path.iterdir()}
+    if n_jobs is None:
+        assert folds == {str(os.getpid()): "False"}
+    else:
+        assert folds and str(os.getpid()) not in folds
+        assert set(folds.values()) == {"True"}
+
+    assert_allclose(model_sklearnex.C_, model_sklearn.C_)
+    assert_allclose(model_sklearnex.coef_, model_sklearn.coef_, atol=1e-4)
+    assert_allclose(
+        model_sklearnex.predict_proba(X), model_sklearn.predict_proba(X), atol=1e-5
+    )
+
+
 @pytest.mark.parametrize(
     "dataframe,queue", get_dataframes_and_queues(device_filter_="gpu")
 )
@@ -14,6 +14,8 @@
 # limitations under the License.
 # ===============================================================================
 
+import logging
+
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
@@ -231,3 +233,137 @@ def test_underdetermined_positive_alpha_ridge(dataframe, queue):
 
     assert_allclose(ridge.coef_, coef_manual, rtol=1e-6, atol=1e-6)
     assert_allclose(ridge.intercept_, intercept, rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize("dataframe,queue", get_dataframes_and_queues())
+@pytest.mark.parametrize("fit_intercept", [True, False])
+@pytest.mark.parametrize("use_sample_weight", [False, True])
+def test_ridge_per_target_alpha(dataframe, queue, fit_intercept, use_sample_weight):
+    from sklearn.datasets import make_regression
+    from sklearn.linear_model import Ridge as _sklearn_Ridge
+
+    from sklearnex.linear_model import Ridge
+
+    X, y = make_regression(n_samples=30, n_features=4, n_targets=3, random_state=0)
+    alpha = np.array([0.1, 1.0, 10.0])
+    sample_weight = None
+    if use_sample_weight:
+        sample_weight = np.random.default_rng(seed=0).random(X.shape[0])
+
+    expected = _sklearn_Ridge(alpha=alpha, fit_intercept=fit_intercept).fit(
+        X, y, sample_weight=sample_weight
+    )
+
+    X_c = _convert_to_dataframe(X, sycl_queue=queue, target_df=dataframe)
+    y_c = _convert_to_dataframe(y, sycl_queue=queue, target_df=dataframe)
+    if use_sample_weight:
+        sample_weight = _convert_to_dataframe(
+            sample_weight, sycl_queue=queue, target_df=dataframe
+        )
+    ridge = Ridge(alpha=alpha, fit_intercept=fit_intercept).fit(X_c, y_c, sample_weight)
+
+    assert hasattr(ridge, "_onedal_estimator")
+    assert_allclose(_as_numpy(ridge.coef_), expected.coef_, rtol=1e-6, atol=1e-6)
+    assert_allclose(
+        _as_numpy(ridge.intercept_), expected.intercept_, rtol=1e-6, atol=1e-6
+    )
+    assert_allclose(
+        _as_numpy(ridge.predict(X_c)), expected.predict(X), rtol=1e-6, atol=1e-6
+    )
+
+
+@pytest.mark.parametrize("fit_intercept", [True, False])
+def test_ridge_per_target_alpha_small_variance(fit_intercept):
+    from sklearn.linear_model import Ridge as _sklearn_Ridge
+
+    from sklearnex.linear_model import Ridge
+
+    # the eigenvalue of the feature of small variance is far above the
+    # rounding errors of X^T X, even in float32 over many rows
+    rng = np.random.default_rng(seed=0)
+    X = rng.standard_normal(size=(200_000, 3)) * np.array([1.0, 1.0, 0.05])
+    y = X @ np.array([[1.0, -2.0, 5.0], [2.0, 1.0, -5.0]]).T + 0.5
+    alpha = np.array([1e-3, 1e-2])
+
+    expected = _sklearn_Ridge(alpha=alpha, fit_intercept=fit_intercept).fit(X, y)
+    ridge = Ridge(alpha=alpha, fit_intercept=fit_intercept).fit(
+        X.astype(np.float32), y.astype(np.float32)
+    )
+
+    assert hasattr(ridge, "_onedal_estimator")
+    assert_allclose(ridge.coef_, expected.coef_, rtol=1e-3, atol=1e-3)
+    assert_allclose(ridge.intercept_, expected.intercept_, atol=1e-3)
+
+
+@pytest.mark.parametrize("fit_intercept", [True, False])
+@pytest.mark.parametrize("multi_output", [False, True])
+@pytest.mark.parametrize("use_sample_weight", [False, True])
+def test_ridge_sparse(fit_intercept, multi_output, use_sample_weight):
+    import scipy.sparse as sp
+    from sklearn.linear_model import Ridge as _sklearn_Ridge
+
+    from sklearnex.linear_model import Ridge
+
+    rng = np.random.default_rng(seed=0)
+    X = sp.random(100, 8, density=0.3, format="csr", random_state=0)
+    y = rng.standard_normal(size=(100, 3) if multi_output else 100)
+    sample_weight = rng.random(100) if use_sample_weight else None
+
+    expected = _sklearn_Ridge(alpha=0.5, fit_intercept=fit_intercept).fit(
+        X.toarray(), y, sample_weight=sample_weight
+    )
+    ridge = Ridge(alpha=0.5, fit_intercept=fit_intercept).fit(X, y, sample_weight)
+
+    assert hasattr(ridge, "_onedal_estimator")
+    assert_allclose(ridge.coef_, expected.coef_, rtol=1e-6, atol=1e-6)
+    assert_allclose(ridge.intercept_, expected.intercept_, rtol=1e-6, atol=1e-6)
+    assert_allclose(ridge.predict(X), expected.predict(X.toarray()), rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize("dataframe,queue", get_dataframes_and_queues())
+@pytest.mark.parametrize("fit_intercept", [True, False])
+@pytest.mark.parametrize("alpha_per_target", [True, False])
+@pytest.mark.parametrize("use_sample_weight", [False, True])
+def test_ridge_cv(
+    caplog, dataframe, queue, fit_intercept, alpha_per_target, use_sample_weight
+):
+    from sklearn.datasets import make_regression
+    from sklearn.linear_model import RidgeCV as _sklearn_RidgeCV
+
+    from sklearnex.linear_model import RidgeCV
+
+    X, y = make_regression(
+        n_samples=50, n_features=5, n_targets=3, noise=10.0, random_state=0
+    )
+    params = {
+        "alphas": np.logspace(-3, 3, 13),
+        "fit_intercept": fit_intercept,
+        "alpha_per_target": alpha_per_target,
+        "store_cv_results": True,
+    }
+    sample_weight = None
+    if use_sample_weight:
+        sample_weight = np.random.default_rng(seed=0).random(X.shape[0])
+
+    expected = _sklearn_RidgeCV(**params).fit(X, y, sample_weight=sample_weight)
+
+    X_c = _convert_to_dataframe(X, sycl_queue=queue, target_df=dataframe)
+    y_c = _convert_to_dataframe(y, sycl_queue=queue, target_df=dataframe)
+    if use_sample_weight:
+        sample_weight = _convert_to_dataframe(
+            sample_weight, sycl_queue=queue, target_df=dataframe
+        )
+    with caplog.at_level(logging.INFO, logger="sklearnex"):
+        ridge = RidgeCV(**params).fit(X_c, y_c, sample_weight)
+
+    assert "sklearn.linear_model.RidgeCV.fit: running accelerated version" in caplog.text
+    assert_allclose(_as_numpy(ridge.alpha_), expected.alpha_)
+    assert_allclose(_as_numpy(ridge.best_score_), expected.best_score_, rtol=1e-6)
+    assert_allclose(_as_numpy(ridge.cv_results_), expected.cv_results_, rtol=1e-6)
+    assert_allclose(_as_numpy(ridge.coef_), expected.coef_, rtol=1e-6, atol=1e-6)
+    assert_allclose(
+        _as_numpy(ridge.intercept_), expected.intercept_, rtol=1e-6, atol=1e-6
+    )
+    assert_allclose(
+        _as_numpy(ridge.predict(X_c)), expected.predict(X), rtol=1e-6, atol=1e-6
+    )
@@ -15,11 +15,13 @@
 # ===============================================================================
 
 from ._lof import LocalOutlierFactor
+from .approximate_neighbors import ApproximateNearestNeighbors
 from .knn_classification import KNeighborsClassifier
 from .knn_regression import KNeighborsRegressor
 from .knn_unsupervised import NearestNeighbors
 
 __all__ = [
+    "ApproximateNearestNeighbors",
     "KNeighborsClassifier",
     "KNeighborsRegressor",
     "LocalOutlierFactor",
@@ -0,0 +1,256 @@
+# ==============================================================================
+# Copyright contributors to the oneDAL project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+from numbers import Integral
+
+import numpy as np
+from sklearn.base import BaseEstimator
+from sklearn.neighbors._base import KNeighborsMixin
+from sklearn.utils._param_validation import Interval, StrOptions
+from sklearn.utils.validation import check_is_fitted
+
+from daal4py.sklearn._n_jobs_support import control_n_jobs
+from onedal.neighbors import (
+    ApproximateNearestNeighbors as onedal_ApproximateNearestNeighbors,
+)
+
+from .._device_offload import dispatch, wrap_output_data
+from .._utils import PatchingConditionsChain
+from ..base import oneDALEstimator
+from ..utils.validation import validate_data
+
+
+@control_n_jobs(decorated_methods=["fit", "kneighbors"])
+class ApproximateNearestNeighbors(oneDALEstimator, KNeighborsMixin, BaseEstimator):
+    """
+    Approximate nearest neighbors search with an inverted file index.
+
+    The training data is partitioned into ``n_lists`` clusters (inverted
+    lists) with KMeans. Queries are only compared to the points of the
+    ``n_probes`` lists with the closest centroids, which trades recall of
+    the exact nearest neighbors for speed on large and high-dimensional
+    data, where exact kd-trees are not efficient.
+
+    Parameters
+    ----------
+    n_neighbors : int, default=5
+        Number of neighbors to use by default for :meth:`kneighbors` queries.
+
+    n_lists : int, default=None
+        Number of inverted lists. If None, the square root of the number
+        of training samples is used.
+
+    n_probes : int, default=8
+        Number of inverted lists searched per query. Higher values give
+        a higher recall at the cost of slower queries, and ``n_lists``
+        gives an exact search.
+
+    metric : {'euclidean', 'cosine'}, default='euclidean'
+        Metric to use for distance computation.
+
+    max_iter : int, default=20
+        Maximum number of KMeans iterations to build the inverted lists.
+
+    random_state : int, RandomState instance or None, default=None
+        Determines random number generation for the KMeans initialization.
+
+    Attributes
+    ----------
+    cluster_centers_ : ndarray of shape (n_lists, n_features)
+        Centroids of the inverted lists.
+
+    n_features_in_ : int
+        Number of features seen during :term:`fit`.
+
+    n_samples_fit_ : int
+        Number of samples in the fitted data.
+
+    Notes
+    -----
+    Queries whose probed lists hold fewer than ``n_neighbors`` points in
+    total are searched again with more lists, so that they always get
+    ``n_neighbors`` results.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from sklearnex.neighbors import ApproximateNearestNeighbors
+    >>> X = np.random.default_rng(seed=0).random((1000, 64))
+    >>> ann = ApproximateNearestNeighbors(n_neighbors=3, n_probes=4).fit(X)
+    >>> distances, indices = ann.kneighbors(X[:2])
+    """
+
+    _parameter_constraints: dict = {
+        "n_neighbors": [Interval(Integral, 1, None, closed="left")],
+        "n_lists": [Interval(Integral, 1, None, closed="left"), None],
+        "n_probes": [Interval(Integral, 1, None, closed="left")],
+        "metric": [StrOptions({"euclidean", "cosine"})],
+        "max_iter": [Interval(Integral, 1, None, closed="left")],
+        "random_state": ["random_state"],
+    }
+
+    def __init__(
+        self,
+        n_neighbors=5,
+        *,
+        n_lists=None,
+        n_probes=8,
+        metric="euclidean",
+        max_iter=20,
+        random_state=None,
+    ):
+        self.n_neighbors = n_neighbors
+        self.n_lists = n_lists
+        self.n_probes = n_probes
+        self.metric = metric
+        self.max_iter = max_iter
+        self.random_state = random_state
+
+    def _onedal_supported(self, device, method_name, *data):
+        return PatchingConditionsChain(
+            f"sklearnex.neighbors.{self.__class__.__name__}.{method_name}"
+        )
+
+    def _onedal_cpu_supported(self, method_name, *data):
+        return self._onedal_supported("cpu", method_name, *data)
+
+    def _onedal_gpu_supported(self, method_name, *data):
+        return self._onedal_supported("gpu", method_name, *data)
+
+    def _onedal_fit(self, X, queue=None):
+        X = validate_data(self, X, dtype=[np.float64, np.float32])
+
+        self._onedal_estimator = onedal_ApproximateNearestNeighbors(
+            n_neighbors=self.n_neighbors,
+            n_lists=self.n_lists,
+            n_probes=self.n_probes,
+            metric=self.metric,
+            max_iter=self.max_iter,
+            random_state=self.random_state,
+        )
+        self._onedal_estimator.fit(X, queue=queue)
+
+        self.cluster_centers_ = self._onedal_estimator.cluster_centers_
+        self.n_samples_fit_ = self._onedal_estimator.n_samples_fit_
+
+    def _onedal_kneighbors(
+        self, X=None, n_neighbors=None, return_distance=True, queue=None
+    ):
+        n_neighbors = self.n_neighbors if n_neighbors is None else n_neighbors
+        query_is_train = X is None
+        if not query_is_train:
+            X = validate_data(self, X, dtype=[np.float64, np.float32], reset=False)
+        elif n_neighbors >= self.n_samples_fit_:
+            raise ValueError(
+                "Expected n_neighbors < n_samples_fit, but "
+                f"n_neighbors = {n_neighbors}, n_samples_fit = {self.n_samples_fit_}, "
+                f"n_samples = {self.n_samples_fit_}"
+            )
+        if not query_is_train and n_neighbors > self.n_samples_fit_:
+            raise ValueError(
+                "Expected n_neighbors <= n_samples_fit, but "
+                f"n_neighbors = {n_neighbors}, n_samples_fit = {self.n_samples_fit_}, "
+                f"n_samples = {X.shape[0]}"
+            )
+
+        distances, indices = self._onedal_estimator.kneighbors(
+            X,
+            n_neighbors=n_neighbors + 1 if query_is_train else n_neighbors,
+            n_probes=self.n_probes,
+            queue=queue,
+        )
+
+        if query_is_train:
+            # drop the query point itself, or the farthest neighbor of the
+            # rows where it tied with duplicates and was left out
+            n_queries = indices.shape[0]
+            mask = indices != np.arange(n_queries)[:, None]
+            mask[mask.all(axis=1), -1] = False
+            distances = np.reshape(distances[mask], (n_queries, n_neighbors))
+            indices = np.reshape(indices[mask], (n_queries, n_neighbors))
+
+        if return_distance:
+            return distances, indices
+        return indices
+
+    def fit(self, X, y=None):
+        """Build the inverted file index from the training data.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Training data.
+
+        y : Ignored
+            Not used, present for API consistency by convention.
+
+        Returns
+        -------
+        self : ApproximateNearestNeighbors
+            The fitted approximate nearest neighbors estimator.
+        """
+        self._validate_params()
+        dispatch(
+            self,
+            "fit",
+            {
+                "onedal": self.__class__._onedal_fit,
+                "sklearn": None,
+            },
+            X,
+        )
+        return self
+
+    @wrap_output_data
+    def kneighbors(self, X=None, n_neighbors=None, return_distance=True):
+        """Find the approximate K-neighbors of a point.
+
+        Returns indices of and distances to the neighbors of each point.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_queries, n_features), default=None
+            The query point or points. If not provided, neighbors of each
+            indexed point are returned, not considering itself.
+
+        n_neighbors : int, default=None
+            Number of neighbors required for each sample. The default is the
+            value passed to the constructor.
+
+        return_distance : bool, default=True
+            Whether or not to return the distances.
+
+        Returns
+        -------
+        neigh_dist : ndarray of shape (n_queries, n_neighbors)
+            Array representing the lengths to points, only present if
+            return_distance=True.
+
+        neigh_ind : ndarray of shape (n_queries, n_neighbors)
+            Indices of the nearest points in the population matrix.
+        """
+        check_is_fitted(self)
+        return dispatch(
+            self,
+            "kneighbors",
+            {
+                "onedal": self.__class__._onedal_kneighbors,
+                "sklearn": None,
+            },
+            X,
+            n_neighbors=n_neighbors,
+            return_distance=return_distance,
+        )
@@ -14,6 +14,9 @@
 # limitations under the License.
 # ==============================================================================
 
+import copy
+import os
+import pickle
 import warnings
 from numbers import Integral
 
@@ -23,7 +26,9 @@ from sklearn.neighbors._ball_tree import BallTree
 from sklearn.neighbors._base import VALID_METRICS, KNeighborsMixin
 from sklearn.neighbors._base import NeighborsBase as _sklearn_NeighborsBase
 from sklearn.neighbors._kd_tree import KDTree
+from sklearn.utils import gen_batches
 from sklearn.utils._array_api import get_namespace
+from sklearn.utils._chunking import get_chunk_n_rows
 from sklearn.utils.validation import check_array, check_is_fitted
 
 from daal4py.sklearn._utils import is_sparse, sklearn_check_version
@@ -33,6 +38,7 @@ if sklearn_check_version("1.9"):
     from sklearn.utils._array_api import get_namespace_and_device, move_to
 
 from onedal._device_offload import _transfer_to_host
+from onedal.neighbors import NeighborsIndex
 from onedal.utils._array_api import _is_numpy_namespace
 from onedal.utils.validation import _num_features, _num_samples
 
@@ -346,6 +352,7 @@ class KNeighborsDispatchingBase(oneDALEstimator):
         n_neighbors,
         return_distance,
         query_is_train,
+        row_offset=0,
     ):
         """Post-process raw kneighbors results from onedal backend.
 
@@ -365,6 +372,9 @@ class KNeighborsDispatchingBase(oneDALEstimator):
             Whether to return distances.
         query_is_train : bool
             Whether query data is the training data.
+        row_offset : int, default=0
+            Index of the first query row in the training data, when
+            post-processing a block of a query_is_train result.
 
         Returns
         -------
@@ -411,16 +421,30 @@ class KNeighborsDispatchingBase(oneDALEstimator):
             sycl_queue = getattr(indices, "sycl_queue", None)
             if sycl_queue is not None:
                 sample_range = xp.reshape(
-                    xp.arange(n_queries, dtype=indices.dtype, sycl_queue=sycl_queue),
+                    xp.arange(
+                        row_offset,
+                        row_offset + n_queries,
+                        dtype=indices.dtype,
+                        sycl_queue=sycl_queue,
+                    ),
                     (-1, 1),
                 )
             else:
                 device = getattr(indices, "device", None)
                 sample_range = xp.reshape(
-                    xp.arange(n_queries, dtype=indices.dtype, device=device), (-1, 1)
+                    xp.arange(
+                        row_offset,
+                        row_offset + n_queries,
+                        dtype=indices.dtype,
+                        device=device,
+                    ),
+                    (-1, 1),
                 )
         else:
-            sample_range = xp.reshape(xp.arange(n_queries, dtype=indices.dtype), (-1, 1))
+            sample_range = xp.reshape(
+                xp.arange(row_offset, row_offset + n_queries, dtype=indices.dtype),
+                (-1, 1),
+            )
         sample_mask = indices != sample_range
 
         # Corner case: When the number of duplicates are more
@@ -442,6 +466,130 @@ class KNeighborsDispatchingBase(oneDALEstimator):
             return distances, indices
         return indices
 
+    def _get_kneighbors_batch_size(self, n_queries, n_neighbors):
+        """Number of query rows sent to the onedal backend per call.
+
+        Bounded by the ``working_memory`` option of scikit-learn, which
+        accounts for the raw and the post-processed distances and indices
+        of every row of a block, at up to 8 bytes each.
+        """
+        return get_chunk_n_rows(4 * 8 * n_neighbors, max_n_rows=n_queries)
+
+    def _onedal_kneighbors_query(
+        self, X, n_neighbors, return_distance, query_is_train, queue=None
+    ):
+        """Query the onedal estimator in blocks of rows and post-process them.
+
+        Post-processed blocks are written into preallocated outputs, so
+        that memory in use beyond the outputs themselves stays bounded
+        regardless of the number of queries.
+
+        Parameters
+        ----------
+        X : array-like
+            Validated query data, or the training data if query_is_train.
+        n_neighbors : int
+            Number of neighbors to return per query.
+        return_distance : bool
+            Whether to return distances.
+        query_is_train : bool
+            Whether query data is the training data.
+        queue : SyclQueue or None, default=None
+            SYCL Queue object for device code execution.
+
+        Returns
+        -------
+        distances, indices or just indices
+        """
+        effective_n_neighbors = n_neighbors + 1 if query_is_train else n_neighbors
+        n_queries = _num_samples(X)
+        batch_size = self._get_kneighbors_batch_size(n_queries, effective_n_neighbors)
+
+        distances = indices = None
+        for batch in gen_batches(n_queries, batch_size):
+            X_batch = X if batch_size >= n_queries else X[batch]
+            # Always get both distances and indices for post-processing
+            # Pass n_neighbors as keyword to avoid _transfer_to_host mixing
+            # USM array X with int n_neighbors in the same positional args tuple
+            dist_batch, ind_batch = self._onedal_estimator.kneighbors(
+                X_batch,
+                n_neighbors=effective_n_neighbors,
+                return_distance=True,
+                queue=queue,
+            )
+            dist_batch, ind_batch = self._kneighbors_postprocess(
+                dist_batch,
+                ind_batch,
+                n_neighbors,
+                True,
+                query_is_train,
+                row_offset=batch.start,
+            )
+            if batch_size >= n_queries:
+                distances, indices = dist_batch, ind_batch
+                break
+
+            if indices is None:
+                xp, _ = get_namespace(ind_batch)
+                shape = (n_queries, n_neighbors)
+                if _is_numpy_namespace(xp):
+                    distances = xp.empty(shape, dtype=dist_batch.dtype)
+                    indices = xp.empty(shape, dtype=ind_batch.dtype)
+                else:
+                    device = getattr(ind_batch, "device", None)
+                    distances = xp.empty(shape, dtype=dist_batch.dtype, device=device)
+                    indices = xp.empty(shape, dtype=ind_batch.dtype, device=device)
+            distances[batch, ...] = dist_batch
+            indices[batch, ...] = ind_batch
+
+        if return_distance:
+            return distances, indices
+        return indices
+
+    def _radius_neighbors_postprocess(
+        self, distances, indices, offsets, query_is_train, sort_results
+    ):
+        """Post-process raw radius_neighbors results from onedal backend.
+
+        Handles query_is_train self-exclusion and sorting of the results
+        by distance, on the flat CSR layout without splitting it per row.
+
+        Parameters
+        ----------
+        distances : ndarray of shape (n_nonzero,)
+            Concatenated neighbor distances of all queries.
+        indices : ndarray of shape (n_nonzero,)
+            Concatenated neighbor indices of all queries.
+        offsets : ndarray of shape (n_queries + 1,)
+            Row delimiters of ``distances`` and ``indices``.
+        query_is_train : bool
+            Whether query data is the training data.
+        sort_results : bool
+            Whether to sort the neighbors of each query by distance.
+
+        Returns
+        -------
+        distances, indices, offsets
+        """
+        n_queries = offsets.shape[0] - 1
+        rows = np.repeat(np.arange(n_queries), np.diff(offsets))
+
+        if query_is_train:
+            # the sample itself is not considered its own neighbor
+            sample_mask = indices != rows
+            rows = rows[sample_mask]
+            distances = distances[sample_mask]
+            indices = indices[sample_mask]
+            offsets = np.zeros(n_queries + 1, dtype=np.intp)
+            np.cumsum(np.bincount(rows, minlength=n_queries), out=offsets[1:])
+
+        if sort_results:
+            order = np.lexsort((distances, rows))
+            distances = distances[order]
+            indices = indices[order]
+
+        return distances, indices, offsets
+
     def _fit_validation(self, X, y=None):
         self._validate_params()
         self._validate_n_neighbors(self.n_neighbors)
@@ -466,7 +614,11 @@ class KNeighborsDispatchingBase(oneDALEstimator):
                     self.n_neighbors is not None
                     and self.n_neighbors >= self._fit_X.shape[0] // 2
                 )
-                if self._fit_X.shape[1] > 15 or is_n_neighbors_valid_for_brute:
+                if (
+                    is_sparse(self._fit_X)
+                    or self._fit_X.shape[1] > 15
+                    or is_n_neighbors_valid_for_brute
+                ):
                     self._fit_method = "brute"
                 else:
                     if self.effective_metric_ in VALID_METRICS["kd_tree"]:
@@ -554,10 +706,11 @@ class KNeighborsDispatchingBase(oneDALEstimator):
                 )
             ]
         )
-        if not patching_status.and_condition(
-            "radius" not in method_name, "RadiusNeighbors not implemented in sklearnex"
-        ):
-            return patching_status
+        if "radius" in method_name:
+            if not patching_status.and_condition(
+                device != "gpu", "Radius neighbors search is only supported on CPU."
+            ):
+                return patching_status
 
         if not patching_status.and_condition(
             not isinstance(data[0], (KDTree, BallTree, _sklearn_NeighborsBase)),
@@ -589,11 +742,6 @@ class KNeighborsDispatchingBase(oneDALEstimator):
         ):
             return patching_status
 
-        if not patching_status.and_condition(
-            not is_sparse(data[0]), "Sparse input is not supported."
-        ):
-            return patching_status
-
         if not is_unsupervised:
             is_valid_weights = self.weights in ["uniform", "distance"]
             if is_classifier:
@@ -626,6 +774,23 @@ class KNeighborsDispatchingBase(oneDALEstimator):
             if self.effective_metric_ in aliases:
                 self.effective_metric_ = origin
                 break
+        if is_sparse(data[0]):
+            if not patching_status.and_conditions(
+                [
+                    (device != "gpu", "Sparse input is only supported on CPU."),
+                    (
+                        result_method == "brute",
+                        f"Sparse input is not supported with {result_method} method.",
+                    ),
+                    (
+                        self.effective_metric_ in ["euclidean", "cosine"],
+                        f"Sparse input with {self.effective_metric_} metric "
+                        "is not supported.",
+                    ),
+                ]
+            ):
+                return patching_status
+
         onedal_brute_metrics = [
             "manhattan",
             "minkowski",
@@ -668,7 +833,14 @@ class KNeighborsDispatchingBase(oneDALEstimator):
                     class_count >= 2, "One-class case is not supported."
                 )
             return patching_status
-        if method_name in ["predict", "predict_proba", "kneighbors", "score"]:
+        if method_name in [
+            "predict",
+            "predict_proba",
+            "kneighbors",
+            "radius_neighbors",
+            "radius_neighbors_graph",
+            "score",
+        ]:
             # Check if _onedal_estimator is an instance attribute (model was trained)
             # For SPMD classes, _onedal_estimator is a class-level staticmethod, so we check __dict__
             patching_status.and_condition(
@@ -719,21 +891,92 @@ class KNeighborsDispatchingBase(oneDALEstimator):
             )
 
         n_queries = A_ind.shape[0]
-        n_samples_fit = self.n_samples_fit_
         n_nonzero = n_queries * n_neighbors
         A_indptr = xp.arange(0, n_nonzero + 1, n_neighbors)
 
-        if sklearn_check_version("1.9"):
-            _csr_container = sp.csr_array if hasattr(sp, "csr_array") else sp.csr_matrix
-        else:
-            _csr_container = sp.csr_matrix
-        kneighbors_graph = _csr_container(
-            (A_data, xp.reshape(A_ind, (-1,)), A_indptr), shape=(n_queries, n_samples_fit)
+        return _build_csr_graph(
+            A_data, xp.reshape(A_ind, (-1,)), A_indptr, self.n_samples_fit_
         )
 
-        if sklearn_check_version("1.9"):
-            kneighbors_graph = _align_api_if_sparse(kneighbors_graph)
+    kneighbors_graph.__doc__ = KNeighborsMixin.kneighbors_graph.__doc__
 
-        return kneighbors_graph
+    def save_index(self, path):
+        """Save the fitted estimator and its search index to a directory.
 
-    kneighbors_graph.__doc__ = KNeighborsMixin.kneighbors_graph.__doc__
+        The training data and the precomputed norms are stored as a
+        :class:`onedal.neighbors.NeighborsIndex` next to the pickled
+        estimator. :meth:`load_index` memory-maps them and trains the
+        oneDAL model again on the mapped data. Data fitted on a device is
+        saved on host.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Directory where the files are written, created if it does
+            not exist.
+        """
+        check_is_fitted(self)
+        onedal_estimator = getattr(self, "_onedal_estimator", None)
+        if onedal_estimator is None or getattr(self, "_tree", None) is not None:
+            raise ValueError(
+                "Only estimators fitted with the oneDAL backend have a search "
+                "index to save."
+            )
+
+        NeighborsIndex.from_estimator(onedal_estimator).save(path)
+
+        # the index files hold the large fitted state, the rest is pickled
+        estimator = copy.copy(self)
+        estimator._onedal_estimator = copy.copy(onedal_estimator)
+        for attr in ("_fit_X", "_fit_norms", "_onedal_model"):
+            estimator.__dict__.pop(attr, None)
+            estimator._onedal_estimator.__dict__.pop(attr, None)
+
+        with open(os.path.join(path, "estimator.pkl"), "wb") as f:
+            pickle.dump(estimator, f)
+
+    @classmethod
+    def load_index(cls, path, mmap_mode="r"):
+        """Load an estimator saved with :meth:`save_index`.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Directory where the estimator was saved.
+        mmap_mode : {None, 'r', 'c'}, default='r'
+            Memory-mapping mode of the training data and norms, see
+            :func:`numpy.load`. With ``'r'``, processes loading the same
+            index share the pages of its read-only data.
+
+        Returns
+        -------
+        estimator : object
+            Fitted estimator, ready to serve queries.
+        """
+        with open(os.path.join(path, "estimator.pkl"), "rb") as f:
+            estimator = pickle.load(f)
+        if not isinstance(estimator, cls):
+            raise TypeError(
+                f"Expected a saved {cls.__name__}, got {type(estimator).__name__}."
+            )
+
+        index = NeighborsIndex.load(path, mmap_mode=mmap_mode)
+        index.to_estimator(estimator._onedal_estimator)
+        estimator._fit_X = index.fit_X
+        return estimator
+
+
+def _build_csr_graph(data, indices, indptr, n_samples_fit):
+    """Assemble a neighbors graph of shape (n_queries, n_samples_fit)."""
+    if sklearn_check_version("1.9"):
+        _csr_container = sp.csr_array if hasattr(sp, "csr_array") else sp.csr_matrix
+    else:
+        _csr_container = sp.csr_matrix
+    graph = _csr_container(
+        (data, indices, indptr), shape=(indptr.shape[0] - 1, n_samples_fit)
+    )
+
+    if sklearn_check_version("1.9"):
+        graph = _align_api_if_sparse(graph)
+
+    return graph
@@ -23,7 +23,7 @@ from sklearn.utils.multiclass import check_classification_targets
 from sklearn.utils.validation import check_is_fitted
 
 from daal4py.sklearn._n_jobs_support import control_n_jobs
-from daal4py.sklearn._utils import sklearn_check_version
+from daal4py.sklearn._utils import is_sparse, sklearn_check_version
 from daal4py.sklearn.utils.validation import get_requires_y_tag
 from onedal.datatypes import from_table
 from onedal.neighbors import KNeighborsClassifier as onedal_KNeighborsClassifier
@@ -274,6 +274,21 @@ class KNeighborsClassifier(KNeighborsDispatchingBase, _sklearn_KNeighborsClassif
             if sklearn_check_version("1.9"):
                 check_same_namespace(X, self, attribute="_fit_X", method="predict")
 
+        if is_sparse(X) or is_sparse(self._fit_X):
+            # there is no oneDAL model for sparse data, votes are counted
+            # from the neighbors found by the sparse brute force search
+            neigh_dist, neigh_ind = self._onedal_estimator.kneighbors(X)
+            proba = self._compute_class_probabilities(
+                neigh_dist,
+                neigh_ind,
+                self.weights,
+                self._y,
+                self.classes_,
+                self.outputs_2d_,
+            )
+            xp, _ = get_namespace(proba)
+            return xp.take(self.classes_, xp.argmax(proba, axis=1))
+
         params = self._onedal_estimator._get_onedal_params(X)
         params["result_option"] = "responses"
         result = self._onedal_estimator._onedal_predict(
@@ -338,19 +353,12 @@ class KNeighborsClassifier(KNeighborsDispatchingBase, _sklearn_KNeighborsClassif
         # Validate bounds with adjusted n_neighbors
         self._validate_kneighbors_bounds(effective_n_neighbors, query_is_train, X)
 
-        # Always get both distances and indices for post-processing
-        # Pass n_neighbors as keyword to avoid _transfer_to_host mixing
-        # USM array X with int n_neighbors in the same positional args tuple
-        distances, indices = self._onedal_estimator.kneighbors(
-            X, n_neighbors=effective_n_neighbors, return_distance=True, queue=queue
-        )
-
-        return self._kneighbors_postprocess(
-            distances,
-            indices,
+        return self._onedal_kneighbors_query(
+            X,
             n_neighbors if n_neighbors is not None else self.n_neighbors,
             return_distance,
             query_is_train,
+            queue=queue,
         )
 
     def _onedal_score(self, X, y, sample_weight=None, queue=None):
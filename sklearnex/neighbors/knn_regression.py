@@ -301,19 +301,12 @@ class KNeighborsRegressor(KNeighborsDispatchingBase, _sklearn_KNeighborsRegresso
         # Validate bounds with adjusted n_neighbors
         self._validate_kneighbors_bounds(effective_n_neighbors, query_is_train, X)
 
-        # Always get both distances and indices for post-processing
-        # Pass n_neighbors as keyword to avoid _transfer_to_host mixing
-        # USM array X with int n_neighbors in the same positional args tuple
-        distances, indices = self._onedal_estimator.kneighbors(
-            X, n_neighbors=effective_n_neighbors, return_distance=True, queue=queue
-        )
-
-        return self._kneighbors_postprocess(
-            distances,
-            indices,
+        return self._onedal_kneighbors_query(
+            X,
             n_neighbors if n_neighbors is not None else self.n_neighbors,
             return_distance,
             query_is_train,
+            queue=queue,
         )
 
     def _onedal_score(self, X, y, sample_weight=None, queue=None):
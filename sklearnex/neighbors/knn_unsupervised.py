@@ -14,6 +14,8 @@
 # limitations under the License.
 # ===============================================================================
 
+import numpy as np
+from sklearn.neighbors._base import _to_object_array
 from sklearn.neighbors._unsupervised import NearestNeighbors as _sklearn_NearestNeighbors
 from sklearn.utils._array_api import get_namespace
 from sklearn.utils.validation import _deprecate_positional_args, check_is_fitted
@@ -28,7 +30,7 @@ from onedal.utils._array_api import _is_numpy_namespace
 from .._device_offload import dispatch, wrap_output_data
 from ..utils._array_api import enable_array_api
 from ..utils.validation import validate_data
-from .common import KNeighborsDispatchingBase
+from .common import KNeighborsDispatchingBase, _build_csr_graph
 
 if sklearn_check_version("1.9"):
     from sklearn.utils._array_api import check_same_namespace, get_namespace_and_device
@@ -110,28 +112,19 @@ class NearestNeighbors(KNeighborsDispatchingBase, _sklearn_NearestNeighbors):
             return_distance=return_distance,
         )
 
-    # radius_neighbors always falls back to sklearn on CPU and returns
-    # ragged object-dtype arrays that cannot be converted to array API
-    # or GPU formats, so @wrap_output_data is intentionally omitted.
+    # radius_neighbors returns ragged object-dtype arrays that cannot be
+    # converted to array API or GPU formats, so @wrap_output_data is
+    # intentionally omitted.
     def radius_neighbors(
         self, X=None, radius=None, return_distance=True, sort_results=False
     ):
-        if (
-            hasattr(self, "_onedal_estimator")
-            or getattr(self, "_tree", 0) is None
-            and self._fit_method == "kd_tree"
-        ):
-            # _fit_X may be on a non-host device (e.g. torch XPU, dpnp GPU)
-            # after Array API fit(). Transfer to host for sklearn refit.
-            _, (fit_X_host,) = _transfer_to_host(self._fit_X)
-            _sklearn_NearestNeighbors.fit(self, fit_X_host, getattr(self, "_y", None))
         check_is_fitted(self)
         return dispatch(
             self,
             "radius_neighbors",
             {
-                "onedal": None,
-                "sklearn": _sklearn_NearestNeighbors.radius_neighbors,
+                "onedal": self.__class__._onedal_radius_neighbors,
+                "sklearn": self.__class__._sklearn_radius_neighbors,
             },
             X,
             radius=radius,
@@ -142,11 +135,12 @@ class NearestNeighbors(KNeighborsDispatchingBase, _sklearn_NearestNeighbors):
     def radius_neighbors_graph(
         self, X=None, radius=None, mode="connectivity", sort_results=False
     ):
+        check_is_fitted(self)
         return dispatch(
             self,
             "radius_neighbors_graph",
             {
-                "onedal": None,
+                "onedal": self.__class__._onedal_radius_neighbors_graph,
                 "sklearn": _sklearn_NearestNeighbors.radius_neighbors_graph,
             },
             X,
@@ -155,6 +149,26 @@ class NearestNeighbors(KNeighborsDispatchingBase, _sklearn_NearestNeighbors):
             sort_results=sort_results,
         )
 
+    def _sklearn_radius_neighbors(
+        self, X=None, radius=None, return_distance=True, sort_results=False
+    ):
+        if (
+            hasattr(self, "_onedal_estimator")
+            or getattr(self, "_tree", 0) is None
+            and self._fit_method == "kd_tree"
+        ):
+            # _fit_X may be on a non-host device (e.g. torch XPU, dpnp GPU)
+            # after Array API fit(). Transfer to host for sklearn refit.
+            _, (fit_X_host,) = _transfer_to_host(self._fit_X)
+            _sklearn_NearestNeighbors.fit(self, fit_X_host, getattr(self, "_y", None))
+        return _sklearn_NearestNeighbors.radius_neighbors(
+            self,
+            X,
+            radius=radius,
+            return_distance=return_distance,
+            sort_results=sort_results,
+        )
+
     def _onedal_fit(self, X, y=None, queue=None):
         xp, _ = get_namespace(X)
         self._set_effective_metric()
@@ -168,6 +182,7 @@ class NearestNeighbors(KNeighborsDispatchingBase, _sklearn_NearestNeighbors):
 
         onedal_params = {
             "n_neighbors": self.n_neighbors,
+            "radius": self.radius,
             "algorithm": self.algorithm,
             "metric": self.effective_metric_,
             "p": self.effective_metric_params_.get("p", 2),
@@ -228,21 +243,79 @@ class NearestNeighbors(KNeighborsDispatchingBase, _sklearn_NearestNeighbors):
         # Validate bounds with adjusted n_neighbors
         self._validate_kneighbors_bounds(effective_n_neighbors, query_is_train, X)
 
-        # Always get both distances and indices for post-processing
-        # Pass n_neighbors as keyword to avoid _transfer_to_host mixing
-        # USM array X with int n_neighbors in the same positional args tuple
-        distances, indices = self._onedal_estimator.kneighbors(
-            X, n_neighbors=effective_n_neighbors, return_distance=True, queue=queue
-        )
-
-        return self._kneighbors_postprocess(
-            distances,
-            indices,
+        return self._onedal_kneighbors_query(
+            X,
             n_neighbors if n_neighbors is not None else self.n_neighbors,
             return_distance,
             query_is_train,
+            queue=queue,
         )
 
+    def _onedal_radius_neighbors_csr(
+        self, X=None, radius=None, sort_results=False, queue=None
+    ):
+        if X is not None:
+            query_is_train = False
+            xp, _ = get_namespace(X)
+            X = validate_data(
+                self,
+                X,
+                dtype=[xp.float64, xp.float32],
+                accept_sparse="csr",
+                reset=False,
+            )
+        else:
+            query_is_train = True
+            X = self._fit_X
+
+        # ragged results are assembled on host
+        _, (X,) = _transfer_to_host(X)
+        distances, indices, offsets = self._onedal_estimator.radius_neighbors(
+            X, radius=radius, queue=queue
+        )
+
+        return self._radius_neighbors_postprocess(
+            distances, indices, offsets, query_is_train, sort_results
+        )
+
+    def _onedal_radius_neighbors(
+        self, X=None, radius=None, return_distance=True, sort_results=False, queue=None
+    ):
+        if sort_results and not return_distance:
+            raise ValueError("return_distance must be True if sort_results is True.")
+
+        distances, indices, offsets = self._onedal_radius_neighbors_csr(
+            X, radius=radius, sort_results=sort_results, queue=queue
+        )
+
+        neigh_ind = _to_object_array(np.split(indices, offsets[1:-1]))
+        if return_distance:
+            neigh_dist = _to_object_array(np.split(distances, offsets[1:-1]))
+            return neigh_dist, neigh_ind
+        return neigh_ind
+
+    def _onedal_radius_neighbors_graph(
+        self, X=None, radius=None, mode="connectivity", sort_results=False, queue=None
+    ):
+        if mode == "connectivity":
+            sort_results = False
+        elif mode != "distance":
+            raise ValueError(
+                'Unsupported mode, must be one of "connectivity", '
+                f'or "distance" but got "{mode}" instead'
+            )
+
+        distances, indices, offsets = self._onedal_radius_neighbors_csr(
+            X, radius=radius, sort_results=sort_results, queue=queue
+        )
+
+        if mode == "connectivity":
+            data = np.ones(indices.shape[0])
+        else:
+            data = distances
+
+        return _build_csr_graph(data, indices, offsets, self.n_samples_fit_)
+
     def _save_attributes(self):
         self.classes_ = self._onedal_estimator.classes_
         self.n_features_in_ = self._onedal_estimator.n_features_in_
@@ -41,6 +41,7 @@ from onedal.tests.utils._dataframes_support import (
 )
 from onedal.tests.utils._device_selection import is_sycl_device_available
 from sklearnex.neighbors import (
+    ApproximateNearestNeighbors,
     KNeighborsClassifier,
     KNeighborsRegressor,
     LocalOutlierFactor,
@@ -197,8 +198,9 @@ def test_p_present_if_metric_is_minkowski():
 
 
 # This triggers a fallback on the call to 'predict' by passing
-# a sparse matrix, which is not supported by oneDAL. If this
-# changes, a fallback would need to be triggered in some other way.
+# a sparse matrix with a metric that oneDAL does not support for
+# sparse data. If this changes, a fallback would need to be
+# triggered in some other way.
 @pytest.mark.allow_sklearn_fallback
 def test_no_metric_args_warning_on_fallback():
     rng = np.random.default_rng(seed=123)
@@ -207,7 +209,7 @@ def test_no_metric_args_warning_on_fallback():
 
     X_sp = CSR_CTOR(X)
 
-    knn = KNeighborsRegressor(algorithm="brute").fit(X, y)
+    knn = KNeighborsRegressor(algorithm="brute", metric="manhattan").fit(X, y)
     with warnings.catch_warnings():
         warnings.simplefilter("error")
         _ = knn.predict(X_sp)
@@ -362,3 +364,174 @@ def test_knn_mixed_devices(X_xp, y_xp, X_device, y_device, estimator, with_array
         proba = estimator.predict_proba(X)
         assert proba.__class__ == X.__class__
     _ = estimator.score(X, y)
+
+
+@pytest.mark.parametrize("algorithm", ["brute", "kd_tree"])
+@pytest.mark.parametrize("query_is_train", [False, True])
+@pytest.mark.parametrize("radius", [0.0, 0.5, 10.0])
+def test_radius_neighbors(algorithm, query_is_train, radius):
+    from sklearn.neighbors import NearestNeighbors as _sklearn_NearestNeighbors
+
+    rng = np.random.default_rng(seed=123)
+    X = rng.random(size=(200, 3))
+    X_test = None if query_is_train else rng.random(size=(30, 3))
+
+    neigh = NearestNeighbors(radius=radius, algorithm=algorithm).fit(X)
+    expected = _sklearn_NearestNeighbors(radius=radius, algorithm=algorithm).fit(X)
+
+    dist, ind = neigh.radius_neighbors(X_test, sort_results=True)
+    expected_dist, expected_ind = expected.radius_neighbors(X_test, sort_results=True)
+    assert hasattr(neigh, "_onedal_estimator")
+    assert ind.shape == expected_ind.shape
+    for i in range(expected_ind.shape[0]):
+        assert_array_equal(ind[i], expected_ind[i])
+        assert_allclose(dist[i], expected_dist[i], rtol=1e-5, atol=1e-7)
+
+    for mode in ["connectivity", "distance"]:
+        graph = neigh.radius_neighbors_graph(X_test, mode=mode)
+        expected_graph = expected.radius_neighbors_graph(X_test, mode=mode)
+        assert graph.shape == expected_graph.shape
+        assert_allclose(graph.toarray(), expected_graph.toarray(), rtol=1e-5, atol=1e-7)
+
+
+@pytest.mark.parametrize("algorithm", ["brute", "kd_tree"])
+def test_radius_neighbors_working_memory(algorithm):
+    from sklearn import config_context
+
+    rng = np.random.default_rng(seed=123)
+    X = rng.random(size=(300, 3))
+    X_test = rng.random(size=(100, 3))
+
+    neigh = NearestNeighbors(radius=0.8, algorithm=algorithm).fit(X)
+    expected_dist, expected_ind = neigh.radius_neighbors(X_test, sort_results=True)
+
+    # a budget of a few query rows splits the queries with many neighbors
+    with config_context(working_memory=0.01):
+        dist, ind = neigh.radius_neighbors(X_test, sort_results=True)
+
+    for i in range(expected_ind.shape[0]):
+        assert_array_equal(ind[i], expected_ind[i])
+        assert_allclose(dist[i], expected_dist[i])
+
+
+@pytest.mark.parametrize("metric", ["euclidean", "cosine"])
+@pytest.mark.parametrize(
+    "sparse_fit,sparse_query", [(True, True), (True, False), (False, True)]
+)
+def test_sparse_brute_kneighbors(metric, sparse_fit, sparse_query):
+    from sklearn.neighbors import KNeighborsClassifier as _sklearn_KNeighborsClassifier
+
+    X = sp.random(300, 50, density=0.2, format="csr", random_state=123)
+    X_test = sp.random(40, 50, density=0.2, format="csr", random_state=456)
+    y = np.random.default_rng(seed=123).integers(3, size=X.shape[0])
+    X_fit = X if sparse_fit else X.toarray()
+    X_query = X_test if sparse_query else X_test.toarray()
+
+    clf = KNeighborsClassifier(n_neighbors=5, algorithm="brute", metric=metric)
+    clf.fit(X_fit, y)
+    expected = _sklearn_KNeighborsClassifier(
+        n_neighbors=5, algorithm="brute", metric=metric
+    ).fit(X_fit, y)
+
+    assert hasattr(clf, "_onedal_estimator")
+    dist, ind = clf.kneighbors(X_query)
+    expected_dist, expected_ind = expected.kneighbors(X_query)
+    assert_allclose(dist, expected_dist, rtol=1e-5, atol=1e-6)
+    assert_array_equal(ind, expected_ind)
+    assert_array_equal(clf.predict(X_query), expected.predict(X_query))
+    assert_allclose(clf.predict_proba(X_query), expected.predict_proba(X_query))
+
+    # query is the training data
+    dist, ind = clf.kneighbors()
+    expected_dist, expected_ind = expected.kneighbors()
+    assert_allclose(dist, expected_dist, rtol=1e-5, atol=1e-6)
+    assert_array_equal(ind, expected_ind)
+
+
+@pytest.mark.parametrize("algorithm", ["brute", "kd_tree"])
+@pytest.mark.parametrize("query_is_train", [False, True])
+def test_kneighbors_working_memory(algorithm, query_is_train):
+    from sklearn import config_context
+
+    rng = np.random.default_rng(seed=42)
+    X = rng.random((200, 4))
+    X_query = None if query_is_train else rng.random((150, 4))
+
+    nn = NearestNeighbors(n_neighbors=6, algorithm=algorithm).fit(X)
+    expected_dist, expected_ind = nn.kneighbors(X_query)
+    expected_graph = nn.kneighbors_graph(X_query, mode="distance")
+
+    # a budget of a few query rows forces the blocked path
+    with config_context(working_memory=0.001):
+        assert nn._get_kneighbors_batch_size(len(expected_ind), 7) < 10
+        dist, ind = nn.kneighbors(X_query)
+        graph = nn.kneighbors_graph(X_query, mode="distance")
+
+    assert_allclose(dist, expected_dist)
+    assert_array_equal(ind, expected_ind)
+    assert_allclose(graph.toarray(), expected_graph.toarray())
+
+
+@pytest.mark.parametrize("algorithm", ["brute", "kd_tree"])
+@pytest.mark.parametrize("sparse", [False, True])
+def test_save_load_index(tmp_path, algorithm, sparse):
+    if sparse and algorithm == "kd_tree":
+        pytest.skip("Sparse data is only supported with brute force search")
+
+    X = sp.random(200, 8, density=0.5, format="csr", random_state=0)
+    X_test = sp.random(30, 8, density=0.5, format="csr", random_state=1)
+    if not sparse:
+        X, X_test = X.toarray(), X_test.toarray()
+    y = np.random.default_rng(seed=0).integers(3, size=X.shape[0])
+
+    clf = KNeighborsClassifier(n_neighbors=4, algorithm=algorithm).fit(X, y)
+    clf.save_index(tmp_path)
+    loaded = KNeighborsClassifier.load_index(tmp_path)
+
+    assert hasattr(loaded, "_onedal_estimator")
+    if not sparse:
+        # the oneDAL model is trained again on the mapped training data
+        assert isinstance(loaded._fit_X, np.memmap)
+        assert loaded._onedal_estimator._onedal_model is not None
+    assert not (tmp_path / "model.bin").exists()
+    dist, ind = loaded.kneighbors(X_test)
+    expected_dist, expected_ind = clf.kneighbors(X_test)
+    assert_allclose(dist, expected_dist)
+    assert_array_equal(ind, expected_ind)
+    assert_array_equal(loaded.predict(X_test), clf.predict(X_test))
+
+    with pytest.raises(TypeError):
+        NearestNeighbors.load_index(tmp_path)
+
+
+@pytest.mark.parametrize("metric", ["euclidean", "cosine"])
+def test_approximate_neighbors(metric):
+    X, _ = datasets.make_blobs(n_samples=2000, n_features=32, centers=20, random_state=0)
+    X_test = X[:100] + 0.01
+    n_neighbors = 10
+
+    exact = NearestNeighbors(n_neighbors=n_neighbors, metric=metric, algorithm="brute")
+    expected_dist, expected_ind = exact.fit(X).kneighbors(X_test)
+
+    ann = ApproximateNearestNeighbors(
+        n_neighbors=n_neighbors, n_lists=40, metric=metric, random_state=0
+    ).fit(X)
+    assert ann.cluster_centers_.shape == (40, 32)
+
+    def recall(ind):
+        return np.mean([len(np.intersect1d(i, j)) for i, j in zip(ind, expected_ind)])
+
+    # recall increases with the number of probed lists, exact with all of them
+    recalls = [recall(ann.set_params(n_probes=p).kneighbors(X_test)[1]) for p in (1, 40)]
+    assert recalls[0] <= recalls[1] == n_neighbors
+    dist, ind = ann.kneighbors(X_test)
+    assert_allclose(dist, expected_dist, rtol=1e-5, atol=1e-6)
+
+    # a single probe still returns n_neighbors results per query
+    ind = ann.set_params(n_probes=1).kneighbors(X_test, n_neighbors=300)[1]
+    assert ind.shape == (100, 300) and (ind >= 0).all()
+
+    # query is the training data, the point itself is excluded
+    ind = ann.kneighbors(n_neighbors=3, return_distance=False)
+    assert ind.shape == (2000, 3)
+    assert not (ind == np.arange(2000)[:, None]).any()
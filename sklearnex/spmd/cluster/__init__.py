@@ -20,8 +20,9 @@ from .dbscan import DBSCAN
 
 if daal_check_version((2023, "P", 200)):
     from .kmeans import KMeans
+    from .minibatch_kmeans import MiniBatchKMeans
 
-    __all__ = ["DBSCAN", "KMeans"]
+    __all__ = ["DBSCAN", "KMeans", "MiniBatchKMeans"]
 else:
     # TODO:
     # update versioning for DBSCAN.
@@ -16,6 +16,7 @@
 
 from abc import ABC
 
+from daal4py.sklearn._utils import is_sparse
 from onedal.spmd.cluster import DBSCAN as onedal_DBSCAN
 
 from ...cluster import DBSCAN as DBSCAN_Batch
@@ -24,3 +25,24 @@ from ...cluster import DBSCAN as DBSCAN_Batch
 class DBSCAN(DBSCAN_Batch):
     __doc__ = DBSCAN_Batch.__doc__
     _onedal_dbscan = staticmethod(onedal_DBSCAN)
+
+    def _onedal_supported(self, method_name, *data):
+        # region queries of the batch DBSCAN only see the local data
+        patching_status = super()._onedal_supported(method_name, *data)
+        patching_status.and_conditions(
+            [
+                (
+                    self.algorithm in ["auto", "brute"],
+                    f"'{self.algorithm}' algorithm is not supported. "
+                    "Only 'auto' and 'brute' algorithms are supported",
+                ),
+                (
+                    self.metric == "euclidean"
+                    or (self.metric == "minkowski" and self.p == 2),
+                    f"'{self.metric}' (p={self.p}) metric is not supported. "
+                    "Only 'euclidean' or 'minkowski' with p=2 metrics are supported.",
+                ),
+                (not is_sparse(data[0]), "X is sparse. Sparse input is not supported."),
+            ]
+        )
+        return patching_status
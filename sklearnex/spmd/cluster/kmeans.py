@@ -20,6 +20,18 @@ from ...cluster import KMeans as base_KMeans
 
 
 class KMeans(base_KMeans):
+    def _onedal_supported(self, method_name, *data):
+        # weighted fits and scores are computed on host with the local data only
+        patching_status = super()._onedal_supported(method_name, *data)
+        if method_name in ["fit", "score"]:
+            sample_weight = data[2] if len(data) > 2 else None
+            patching_status.and_conditions(
+                [(sample_weight is None, "Sample weight is not supported.")]
+            )
+        return patching_status
+
+    _onedal_cpu_supported = _onedal_supported
+
     def _initialize_onedal_estimator(self):
         """Override to use SPMD backend instead of batch backend."""
         onedal_params = {
@@ -0,0 +1,73 @@
+# ==============================================================================
+# Copyright contributors to the oneDAL project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from onedal.tests.utils._dataframes_support import (
+    _convert_to_dataframe,
+    get_dataframes_and_queues,
+)
+from sklearnex.tests.utils.spmd import (
+    _as_numpy,
+    _generate_clustering_data,
+    _get_local_tensor,
+    _mpi_libs_and_gpu_available,
+)
+
+
+@pytest.mark.skipif(
+    not _mpi_libs_and_gpu_available,
+    reason="GPU device and MPI libs required for test",
+)
+@pytest.mark.parametrize(
+    "dataframe,queue",
+    get_dataframes_and_queues(dataframe_filter_="dpnp", device_filter_="gpu"),
+)
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.mpi
+def test_minibatch_kmeans_spmd_partial_fit(dataframe, queue, dtype):
+    # Import spmd and batch algo
+    from sklearnex.cluster import MiniBatchKMeans as MiniBatchKMeans_Batch
+    from sklearnex.spmd.cluster import MiniBatchKMeans as MiniBatchKMeans_SPMD
+
+    X_train, X_test = _generate_clustering_data(1000, 10, 4, dtype=dtype)
+    init = X_train[:4].copy()
+    local_dpt_X_train = _convert_to_dataframe(
+        _get_local_tensor(X_train), sycl_queue=queue, target_df=dataframe
+    )
+    local_dpt_X_test = _convert_to_dataframe(
+        _get_local_tensor(X_test), sycl_queue=queue, target_df=dataframe
+    )
+
+    # without random reassignments, a step of all processes on their local
+    # data is the step of the batch algorithm on the whole data
+    params = dict(n_clusters=4, init=init, n_init=1, reassignment_ratio=0.0)
+    spmd_model = MiniBatchKMeans_SPMD(**params)
+    batch_model = MiniBatchKMeans_Batch(**params)
+    for _ in range(3):
+        spmd_model.partial_fit(local_dpt_X_train)
+        batch_model.partial_fit(X_train)
+
+    tol = 1e-4 if dtype == np.float32 else 1e-7
+    assert_allclose(spmd_model.cluster_centers_, batch_model.cluster_centers_, rtol=tol)
+    assert_allclose(spmd_model.inertia_, batch_model.inertia_, rtol=tol)
+
+    # Ensure predictions of batch algo match spmd
+    spmd_result = spmd_model.predict(local_dpt_X_test)
+    batch_result = batch_model.predict(_get_local_tensor(X_test))
+    assert_allclose(_as_numpy(spmd_result), _as_numpy(batch_result))
@@ -65,6 +65,7 @@ class RandomForestClassifier(RandomForestClassifier_Batch):
         monotonic_cst=None,
         max_bins=256,
         min_bin_size=1,
+        memory_saving_mode=False,
         local_trees_mode=False,
     ):
         self.local_trees_mode = local_trees_mode
@@ -90,6 +91,7 @@ class RandomForestClassifier(RandomForestClassifier_Batch):
             monotonic_cst=monotonic_cst,
             max_bins=max_bins,
             min_bin_size=min_bin_size,
+            memory_saving_mode=memory_saving_mode,
         )
 
     def _onedal_cpu_supported(self, method_name, *data):
@@ -147,6 +149,7 @@ class RandomForestRegressor(RandomForestRegressor_Batch):
         monotonic_cst=None,
         max_bins=256,
         min_bin_size=1,
+        memory_saving_mode=False,
         local_trees_mode=False,
     ):
         self.local_trees_mode = local_trees_mode
@@ -171,6 +174,7 @@ class RandomForestRegressor(RandomForestRegressor_Batch):
             monotonic_cst=monotonic_cst,
             max_bins=max_bins,
             min_bin_size=min_bin_size,
+            memory_saving_mode=memory_saving_mode,
         )
 
     def _onedal_cpu_supported(self, method_name, *data):
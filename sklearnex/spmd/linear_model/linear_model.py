@@ -14,7 +14,9 @@
 # limitations under the License.
 # ==============================================================================
 
+from daal4py.sklearn._utils import daal_check_version, is_sparse
 from onedal.spmd.linear_model import LinearRegression as onedal_LinearRegression
+from onedal.utils.validation import _num_features
 
 from ...linear_model import LinearRegression as LinearRegression_Batch
 
@@ -22,3 +24,23 @@ from ...linear_model import LinearRegression as LinearRegression_Batch
 class LinearRegression(LinearRegression_Batch):
     __doc__ = LinearRegression_Batch.__doc__
     _onedal_LinearRegression = staticmethod(onedal_LinearRegression)
+
+    def _onedal_fit_supported(self, patching_status, method_name, *data):
+        patching_status = super()._onedal_fit_supported(
+            patching_status, method_name, *data
+        )
+        # sparse and weighted problems, and multi-output problems of older oneDAL
+        # versions, are solved outside of oneDAL on the local data only
+        X, y, sample_weight = data
+        is_multi_output = _num_features(y, fallback_1d=True) > 1
+        patching_status.and_conditions(
+            [
+                (not is_sparse(X), "Sparse input is not supported."),
+                (sample_weight is None, "Sample weight is not supported."),
+                (
+                    not is_multi_output or daal_check_version((2025, "P", 1)),
+                    "Multi-output regression is not supported.",
+                ),
+            ]
+        )
+        return patching_status
@@ -23,6 +23,18 @@ class LogisticRegression(LogisticRegression_Batch):
     __doc__ = LogisticRegression_Batch.__doc__
     _onedal_LogisticRegression = staticmethod(onedal_LogisticRegression)
 
+    def _onedal_gpu_fit_supported(self, method_name, *data):
+        patching_status = super()._onedal_gpu_fit_supported(method_name, *data)
+        # weighted problems are solved outside of oneDAL, on the local data only
+        _, _, sample_weight = data
+        patching_status.and_conditions(
+            [
+                (self.class_weight is None, "Class weight is not supported."),
+                (sample_weight is None, "Sample weight is not supported."),
+            ]
+        )
+        return patching_status
+
     def _onedal_fit(self, X, y, sample_weight=None, queue=None):
         if queue is None or queue.sycl_device.is_cpu:
             # We don't use onedal backend for CPU, so we need an additional check here
@@ -29,6 +29,10 @@ from ...neighbors import NearestNeighbors as base_NearestNeighbors
 class KNeighborsClassifier(base_KNeighborsClassifier):
     _onedal_estimator = onedal_KNeighborsClassifier
 
+    def _get_kneighbors_batch_size(self, n_queries, n_neighbors):
+        # Distributed queries are collective, every rank must send all rows at once
+        return n_queries
+
     def _onedal_predict(self, X, queue=None):
         """Override to call SPMD estimator predict directly."""
         return self._onedal_estimator.predict(X, queue=queue)
@@ -56,6 +60,10 @@ class KNeighborsClassifier(base_KNeighborsClassifier):
 class KNeighborsRegressor(base_KNeighborsRegressor):
     _onedal_estimator = onedal_KNeighborsRegressor
 
+    def _get_kneighbors_batch_size(self, n_queries, n_neighbors):
+        # Distributed queries are collective, every rank must send all rows at once
+        return n_queries
+
     def _onedal_fit(self, X, y, queue=None):
         # SPMD is always GPU; extract queue from data when not provided
         if queue is None:
@@ -71,3 +79,7 @@ class KNeighborsRegressor(base_KNeighborsRegressor):
 
 class NearestNeighbors(base_NearestNeighbors):
     _onedal_estimator = onedal_NearestNeighbors
+
+    def _get_kneighbors_batch_size(self, n_queries, n_neighbors):
+        # Distributed queries are collective, every rank must send all rows at once
+        return n_queries
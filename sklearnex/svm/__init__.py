@@ -17,8 +17,10 @@
 from daal4py.sklearn._utils import daal_check_version
 
 if daal_check_version((2021, "P", 300)):
+    from onedal.svm import KernelCache
+
     from ._classes import SVC, SVR, NuSVC, NuSVR
 
-    __all__ = ["SVR", "SVC", "NuSVC", "NuSVR"]
+    __all__ = ["KernelCache", "SVR", "SVC", "NuSVC", "NuSVR"]
 else:
     raise ImportError("Sklearnex SVM classes require oneDAL version >= 2021.3.")
@@ -20,20 +20,23 @@ from functools import wraps
 import numpy as np
 from scipy import sparse as sp
 from sklearn.base import RegressorMixin, is_classifier
-from sklearn.calibration import CalibratedClassifierCV, _fit_calibrator
 from sklearn.exceptions import NotFittedError
-from sklearn.frozen import FrozenEstimator
 from sklearn.metrics import accuracy_score, r2_score
 from sklearn.svm._base import BaseLibSVM as _sklearn_BaseLibSVM
 from sklearn.svm._base import BaseSVC as _sklearn_BaseSVC
-from sklearn.utils import indexable
 from sklearn.utils._array_api import get_namespace
-from sklearn.utils._response import _get_response_values
 from sklearn.utils.metaestimators import available_if
 from sklearn.utils.multiclass import check_classification_targets
 from sklearn.utils.validation import check_is_fitted, column_or_1d
 
 from daal4py.sklearn._utils import sklearn_check_version
+from onedal._device_offload import _transfer_to_host
+from onedal.svm.svm import (
+    _MAX_CUSTOM_KERNEL_SAMPLES,
+    _custom_kernel_features,
+    _fit_sigmoid,
+    _sigmoid_proba,
+)
 
 if sklearn_check_version("1.9"):
     from sklearn.utils._sparse import _align_api_if_sparse
@@ -43,7 +46,6 @@ if sklearn_check_version("1.9"):
         move_to,
     )
 
-from .._config import config_context, get_config
 from .._device_offload import dispatch, wrap_output_data
 from .._utils import PatchingConditionsChain
 from ..base import oneDALEstimator
@@ -51,77 +53,6 @@ from ..utils.class_weight import _compute_class_weight
 from ..utils.validation import _check_sample_weight, validate_data
 
 
-def _prefit_CalibratedClassifierCV_fit(self, X, y, **fit_params):
-    # This is a stop-gap solution where the cv='prefit' of CalibratedClassifierCV
-    # was removed and the single fold solution needs to be maintained. Discussion
-    # of the mathematical and performance implications of this choice can be found
-    # here: https://github.com/uxlfoundation/scikit-learn-intelex/pull/1879
-    # This is distilled from the sklearn CalibratedClassifierCV for sklearn <1.8 for
-    # use in sklearn > 1.8 to maintain performance.
-
-    # Comment 2026-02-16: scikit-learn doesn't have support for array API with the
-    # arguments used for 'CalibratedClassifierCV' inside of '_fit_calibrator', despite
-    # the apparent usage of 'xp' here. As a result, this works when using 'target_offload'
-    # even though some things end up running on CPU (not sure how much of the
-    # workload is CPU vs. GPU in that case), but doesn't work when using array API
-    # classes, and cannot be made to work by simply moving data to host here,
-    # because the metaestimator from scikit-learn will then make calls to
-    # 'SVC.predict' which sklearnex is overriding and which won't work with
-    # NumPy arrays if fitted to array API.
-    # Some discussions throughout scikit-learn GitHub issues indicate that there
-    # is some desire to remove the option for 'probability=True' from SVC, so perhaps
-    # this problem could be ignored as it will disappear in the future.
-    # TODO: find some way to make this work with array API classes. Maybe it
-    # could work by temporarily removing the '_onedal' estimator from the sklearnex
-    # class, casting both the input data and the support vectors to NumPy, and then
-    # reverting all of this.
-    xp, _ = get_namespace(X, y)
-    check_classification_targets(y)
-    X, y = indexable(X, y)
-
-    estimator = self._get_estimator()
-
-    self.calibrated_classifiers_ = []
-    check_is_fitted(self.estimator, attributes=["classes_"])
-    self.classes_ = self.estimator.classes_
-
-    predictions, _ = _get_response_values(
-        estimator,
-        X,
-        response_method=["decision_function", "predict_proba"],
-    )
-    if predictions.ndim == 1:
-        # Reshape binary output from `(n_samples,)` to `(n_samples, 1)`
-        predictions = xp.reshape(predictions, (-1, 1))
-
-    if sklearn_check_version("1.8"):
-        xp, _ = get_namespace(X, y)
-        calibrated_classifier = _fit_calibrator(
-            estimator,
-            predictions,
-            y,
-            self.classes_,
-            self.method,
-            xp,
-        )
-    else:
-        calibrated_classifier = _fit_calibrator(
-            estimator,
-            predictions,
-            y,
-            self.classes_,
-            self.method,
-        )
-    self.calibrated_classifiers_.append(calibrated_classifier)
-
-    first_clf = self.calibrated_classifiers_[0].estimator
-    if hasattr(first_clf, "n_features_in_"):
-        self.n_features_in_ = first_clf.n_features_in_
-    if hasattr(first_clf, "feature_names_in_"):
-        self.feature_names_in_ = first_clf.feature_names_in_
-    return self
-
-
 class BaseSVM(oneDALEstimator):
 
     _onedal_factory = None
@@ -200,6 +131,9 @@ class BaseSVM(oneDALEstimator):
             return self.classes_.shape[0] > 2
         return False
 
+    def _is_custom_kernel(self) -> bool:
+        return callable(self.kernel) or self.kernel == "precomputed"
+
     def _raise_immutable_error(self) -> None:
         raise ValueError(
             "Cannot manually assign to fitted attributes in multi-class"
@@ -328,6 +262,13 @@ class BaseSVM(oneDALEstimator):
             self._onedal_estimator.dual_coef_ = None
             self._onedal_estimator._onedal_model = None
 
+    def _get_support_vectors(self, X, xp):
+        # as in scikit-learn, models of precomputed and callable kernels
+        # don't keep their support vectors
+        if self._is_custom_kernel():
+            return xp.zeros((0, 0), dtype=X.dtype)
+        return self._onedal_estimator.support_vectors_
+
     def _create_onedal_estimator_from_fitted_attrs(self):
         assert not self._is_multi_class_classifier()
         self._onedal_estimator = self._onedal_factory(**self._get_onedal_params())
@@ -381,12 +322,21 @@ class BaseSVM(oneDALEstimator):
             else:
                 xp, _ = get_namespace(*data)
                 _, _, sample_weight = data
+            X = data[0]
+            self.__dict__.pop("_fit_kernel_features", None)
             patching_status.and_conditions(
                 [
                     (
-                        self.kernel in ["linear", "rbf", "poly", "sigmoid"],
-                        f'Kernel is "{self.kernel}" while '
-                        'only "linear", "rbf", "poly" and "sigmoid" are supported.',
+                        self._is_custom_kernel()
+                        or self.kernel in ["linear", "rbf", "poly", "sigmoid"],
+                        f'Kernel is "{self.kernel}" while only "linear", "rbf", '
+                        '"poly", "sigmoid", "precomputed" and callables are supported.',
+                    ),
+                    (
+                        not self._is_custom_kernel()
+                        or (isinstance(X, np.ndarray) and X.dtype.kind in "biuf"),
+                        "Precomputed and callable kernels are supported on numeric "
+                        "NumPy arrays.",
                     ),
                     (
                         sample_weight is None
@@ -398,6 +348,22 @@ class BaseSVM(oneDALEstimator):
                     ),
                 ]
             )
+            if patching_status.get_status() and self._is_custom_kernel():
+                # the Gram matrix is factored by a dense eigendecomposition,
+                # which only solves the problem of semi-definite kernels; the
+                # factorization is handed over to the fit in _onedal_fit
+                n_samples = X.shape[0]
+                if patching_status.and_condition(
+                    n_samples <= _MAX_CUSTOM_KERNEL_SAMPLES,
+                    "Precomputed and callable kernels are supported up to "
+                    f"{_MAX_CUSTOM_KERNEL_SAMPLES} samples.",
+                ) and (self.kernel != "precomputed" or X.shape[1] == n_samples):
+                    features = _custom_kernel_features(self.kernel, X, self.kernel_cache)
+                    if patching_status.and_condition(
+                        features is not None,
+                        "Kernel matrix is not positive semi-definite.",
+                    ):
+                        self._fit_kernel_features = features
             return patching_status
         elif method_name in self._n_jobs_supported_onedal_methods:
             # TODO: using oneDAL to predict from a sparse model that was created
@@ -408,9 +374,14 @@ class BaseSVM(oneDALEstimator):
             patching_status.and_conditions(
                 [
                     (
-                        isinstance(self.kernel, str)
-                        and self.kernel in ["linear", "rbf", "poly", "sigmoid"],
-                        "Predictions on pre-computed and callable kernels are not supported.",
+                        not self._is_custom_kernel()
+                        or (
+                            hasattr(self, "_onedal_estimator")
+                            and isinstance(X, np.ndarray)
+                            and X.dtype.kind in "biuf"
+                        ),
+                        "Predictions on pre-computed and callable kernels are "
+                        "supported on numeric NumPy arrays for models fitted by oneDAL.",
                     ),
                     (
                         hasattr(self, "_onedal_estimator")
@@ -424,6 +395,10 @@ class BaseSVM(oneDALEstimator):
                         "Single-row prediction from a scikit-learn model has"
                         "substantial overhead due to data conversions",
                     ),
+                    (
+                        method_name != "_predict_proba" or hasattr(self, "_sigmoids"),
+                        "Probabilities of a model fitted by scikit-learn.",
+                    ),
                 ]
             )
             return patching_status
@@ -500,8 +475,8 @@ class BaseSVC(BaseSVM):
         patching_status = super()._onedal_cpu_supported(method_name, *data)
         if not patching_status.get_status():
             return patching_status
-        # TODO: remove this condition once scikit-learn gets array API
-        # support for CalibratedClassifierCV with the arguments used here.
+        # TODO: remove this condition once the Platt scaling, which is done
+        # on host, returns the probabilities in the namespace of the inputs.
         if method_name == "fit":
             X = data[0]
             dal_ready = patching_status.and_conditions(
@@ -606,9 +581,13 @@ class BaseSVC(BaseSVM):
             "shrinking": self.shrinking,
             "max_iter": self.max_iter,
             "cache_size": self.cache_size,
+            "pairwise_jobs": self.pairwise_jobs,
+            "kernel_cache": self.kernel_cache,
         }
 
     def _onedal_fit(self, X, y, sample_weight=None, queue=None):
+        # factorization of a custom kernel made by _onedal_cpu_supported
+        kernel_features = self.__dict__.pop("_fit_kernel_features", None)
         if sklearn_check_version("1.9"):
             xp, is_array_api = get_namespace(X)
         else:
@@ -666,7 +645,12 @@ class BaseSVC(BaseSVM):
 
         self._onedal_estimator = self._onedal_factory(**self._get_onedal_params())
         self._onedal_estimator.fit(
-            X, y, sample_weight, class_count=self.classes_.shape[0], queue=queue
+            X,
+            y,
+            sample_weight,
+            class_count=self.classes_.shape[0],
+            kernel_features=kernel_features,
+            queue=queue,
         )
 
         if (
@@ -684,50 +668,40 @@ class BaseSVC(BaseSVM):
         self._save_attributes(X, y, xp=xp)
 
     def _fit_proba(self, X, y, sample_weight=None, queue=None):
-        # TODO: rewrite this method when probabilities output is implemented in oneDAL
-
         # LibSVM uses the random seed to control cross-validation for probability generation
-        # CalibratedClassifierCV with "prefit" does not use an RNG nor a seed. This may
-        # impact users without their knowledge, so display a warning.
+        # The sigmoids here are fitted without cross-validation, so the seed is
+        # not used. This may impact users without their knowledge, so display a warning.
         if self.random_state is not None:
             warnings.warn(
                 "random_state does not influence oneDAL SVM results",
                 RuntimeWarning,
             )
 
-        params = self.get_params()
-        if sklearn_check_version("1.9"):
-            params["probability"] = "deprecated"
-        else:
-            params["probability"] = False
-        params["decision_function_shape"] = "ovr"
-        clf_base = self.__class__(**params)
-
-        # We use stock metaestimators below, so the only way
-        # to pass a queue is using config_context.
-        cfg = get_config()
-        cfg["target_offload"] = queue
-        with config_context(**cfg):
-            # Comment 2026-02-24: this causes it to fit the model twice.
-            # It looks redundant, but is required when using GPU offloading due to
-            # needing functionalities from sklearn that are not provided by oneDAL.
-            clf_base.fit(X, y)
-
-            # Forced use of FrozenEstimator starting in sklearn 1.6
-            clf_base = FrozenEstimator(clf_base)
-
-            self.clf_prob = CalibratedClassifierCV(
-                clf_base,
-                ensemble=False,
-                method="sigmoid",
-            )
-            # see custom stopgap solution defined above
-            _prefit_CalibratedClassifierCV_fit(
-                self.clf_prob, X, y, sample_weight=sample_weight
-            )
+        # Platt scaling of the one-vs-rest decision function of the fitted
+        # model on the training data, as done by CalibratedClassifierCV with
+        # method="sigmoid" for a prefitted estimator, without refitting it.
+        decision = self._onedal_ovr_decision_values(X, queue=queue)
+        _, (y, sample_weight) = _transfer_to_host(y, sample_weight)
+        n_classes = self.classes_.shape[0]
+        targets = [y == 1] if n_classes == 2 else [y == i for i in range(n_classes)]
+        self._sigmoids = np.array(
+            [
+                _fit_sigmoid(decision[:, i], target, sample_weight)
+                for i, target in enumerate(targets)
+            ]
+        )
+
+    def _onedal_ovr_decision_values(self, X, queue=None):
+        # host decision values with one column per sigmoid of the Platt scaling
+        decision = self._onedal_estimator.decision_function(X, queue=queue)
+        n_classes = self.classes_.shape[0]
+        if n_classes > 2:
+            decision = self._onedal_ovr_decision_function(decision, n_classes)
+        _, (decision,) = _transfer_to_host(decision)
+        return np.reshape(np.asarray(decision), (decision.shape[0], -1))
 
     def _save_attributes(self, X, y, xp=np):
-        self._support_vectors_internal = self._onedal_estimator.support_vectors_
+        self._support_vectors_internal = self._get_support_vectors(X, xp)
 
         self._dual_coef_internal = self._onedal_estimator.dual_coef_
         self.support_ = xp.asarray(self._onedal_estimator.support_, dtype=xp.int64)
@@ -889,17 +863,29 @@ class BaseSVC(BaseSVM):
         return decision_function
 
     def _onedal_predict_proba(self, X, queue=None):
-        if not hasattr(self, "clf_prob"):
+        if not hasattr(self, "_sigmoids"):
             raise NotFittedError(
                 "predict_proba is not available when fitted with probability=False"
             )
+        xp, _ = get_namespace(X)
 
-        # We use stock metaestimators below, so the only way
-        # to pass a queue is using config_context.
-        cfg = get_config()
-        cfg["target_offload"] = queue
-        with config_context(**cfg):
-            return self.clf_prob.predict_proba(X)
+        X = validate_data(
+            self,
+            X,
+            dtype=[xp.float64, xp.float32],
+            accept_sparse="csr",
+            reset=False,
+        )
+
+        self._error_out_on_mismatched_data(X, "predict_proba")
+
+        if not hasattr(self, "_onedal_estimator"):
+            self._create_onedal_estimator_from_fitted_attrs()
+
+        decision = self._onedal_ovr_decision_values(X, queue=queue)
+        proba = _sigmoid_proba(decision, self._sigmoids)
+        proba[(1.0 < proba) & (proba <= 1.0 + 1e-5)] = 1.0
+        return proba
 
     def _onedal_score(self, X, y, sample_weight=None, queue=None):
         return accuracy_score(
@@ -1012,6 +998,8 @@ class BaseSVR(BaseSVM):
         }
 
     def _onedal_fit(self, X, y, sample_weight=None, queue=None):
+        # factorization of a custom kernel made by _onedal_cpu_supported
+        kernel_features = self.__dict__.pop("_fit_kernel_features", None)
         if sklearn_check_version("1.9"):
             xp, _ = get_namespace(X)
         else:
@@ -1033,18 +1021,24 @@ class BaseSVR(BaseSVM):
         self._gamma = self._compute_gamma_sigma(X)
 
         self._onedal_estimator = self._onedal_factory(**self._get_onedal_params())
-        self._onedal_estimator.fit(X, y, sample_weight, queue=queue)
+        self._onedal_estimator.fit(
+            X,
+            y,
+            sample_weight,
+            kernel_features=kernel_features,
+            queue=queue,
+        )
         self._save_attributes(X, xp=xp)
 
     def _save_attributes(self, X, xp=None):
-        self._support_vectors_internal = self._onedal_estimator.support_vectors_
+        self._support_vectors_internal = self._get_support_vectors(X, xp)
         self.fit_status_ = 0
         self._dual_coef_internal = self._onedal_estimator.dual_coef_
         self.shape_fit_ = X.shape
         self.support_ = xp.asarray(self._onedal_estimator.support_, dtype=xp.int64)
 
         self._intercept_internal = self._onedal_estimator.intercept_
-        self._n_support = xp.asarray([self.support_vectors_.shape[0]], dtype=xp.int64)
+        self._n_support = xp.asarray([self.support_.shape[0]], dtype=xp.int64)
 
         self._sparse = False
         self._gamma = self._onedal_estimator.gamma
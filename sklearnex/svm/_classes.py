@@ -14,6 +14,8 @@
 # limitations under the License.
 # ==============================================================================
 
+from numbers import Integral
+
 import numpy as np
 from scipy.sparse import issparse
 from sklearn.svm import SVC as _sklearn_SVC
@@ -28,6 +30,7 @@ from daal4py.sklearn._n_jobs_support import control_n_jobs
 from daal4py.sklearn._utils import is_sparse, sklearn_check_version
 from onedal.svm import SVC as onedal_SVC
 from onedal.svm import SVR as onedal_SVR
+from onedal.svm import KernelCache
 from onedal.svm import NuSVC as onedal_NuSVC
 from onedal.svm import NuSVR as onedal_NuSVR
 
@@ -49,7 +52,11 @@ class SVC(BaseSVC, _sklearn_SVC):
     __doc__ = _sklearn_SVC.__doc__
     _onedal_factory = onedal_SVC
 
-    _parameter_constraints: dict = {**_sklearn_SVC._parameter_constraints}
+    _parameter_constraints: dict = {
+        **_sklearn_SVC._parameter_constraints,
+        "pairwise_jobs": [Integral, None],
+        "kernel_cache": [KernelCache, None],
+    }
 
     @_deprecate_positional_args
     def __init__(
@@ -70,6 +77,8 @@ class SVC(BaseSVC, _sklearn_SVC):
         decision_function_shape="ovr",
         break_ties=False,
         random_state=None,
+        pairwise_jobs=None,
+        kernel_cache=None,
     ):
         super().__init__(
             C=C,
@@ -88,11 +97,16 @@ class SVC(BaseSVC, _sklearn_SVC):
             break_ties=break_ties,
             random_state=random_state,
         )
+        self.pairwise_jobs = pairwise_jobs
+        self.kernel_cache = kernel_cache
 
     def fit(self, X, y, sample_weight=None):
         self._validate_params()
         if hasattr(self, "_onedal_estimator"):
             del self._onedal_estimator
+        # the sigmoids of the Platt scaling belong to the previous oneDAL fit
+        if hasattr(self, "_sigmoids"):
+            del self._sigmoids
         dispatch(
             self,
             "fit",
@@ -134,6 +148,10 @@ class SVC(BaseSVC, _sklearn_SVC):
             patching_status.and_conditions(
                 [
                     (self.class_weight is None, "Class weight is not supported on GPU."),
+                    (
+                        self.kernel_cache is None,
+                        "Kernel cache is not supported on GPU.",
+                    ),
                     (
                         len(data) < 2 or type_of_target(data[1]) == "binary",
                         "Multiclassification is not supported on GPU.",
@@ -146,8 +164,8 @@ class SVC(BaseSVC, _sklearn_SVC):
                         ),
                         "negative or all zero weights are not supported",
                     ),
-                    # TODO: remove this condition once scikit-learn gets array API
-                    # support for CalibratedClassifierCV with the arguments used here.
+                    # TODO: remove this condition once the Platt scaling, which is done
+                    # on host, returns the probabilities in the namespace of the inputs.
                     (
                         not (
                             hasattr(self, "probability")
@@ -178,6 +196,10 @@ class SVC(BaseSVC, _sklearn_SVC):
                         or self._is_binary_classifier(),
                         "oneDAL model was not trained and cannot be re-created",
                     ),
+                    (
+                        method_name != "_predict_proba" or hasattr(self, "_sigmoids"),
+                        "Probabilities of a model fitted by scikit-learn.",
+                    ),
                 ]
             )
         else:
@@ -196,7 +218,11 @@ class NuSVC(BaseSVC, _sklearn_NuSVC):
     __doc__ = _sklearn_NuSVC.__doc__
     _onedal_factory = onedal_NuSVC
 
-    _parameter_constraints: dict = {**_sklearn_NuSVC._parameter_constraints}
+    _parameter_constraints: dict = {
+        **_sklearn_NuSVC._parameter_constraints,
+        "pairwise_jobs": [Integral, None],
+        "kernel_cache": [KernelCache, None],
+    }
 
     @_deprecate_positional_args
     def __init__(
@@ -217,6 +243,8 @@ class NuSVC(BaseSVC, _sklearn_NuSVC):
         decision_function_shape="ovr",
         break_ties=False,
         random_state=None,
+        pairwise_jobs=None,
+        kernel_cache=None,
     ):
         super().__init__(
             nu=nu,
@@ -235,11 +263,16 @@ class NuSVC(BaseSVC, _sklearn_NuSVC):
             break_ties=break_ties,
             random_state=random_state,
         )
+        self.pairwise_jobs = pairwise_jobs
+        self.kernel_cache = kernel_cache
 
     def fit(self, X, y, sample_weight=None):
         self._validate_params()
         if hasattr(self, "_onedal_estimator"):
             del self._onedal_estimator
+        # the sigmoids of the Platt scaling belong to the previous oneDAL fit
+        if hasattr(self, "_sigmoids"):
+            del self._sigmoids
         dispatch(
             self,
             "fit",
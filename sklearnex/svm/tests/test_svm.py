@@ -22,7 +22,7 @@ import pandas as pd
 import pytest
 import scipy
 import scipy.sparse as sp
-from numpy.testing import assert_allclose, assert_array_almost_equal
+from numpy.testing import assert_allclose, assert_array_almost_equal, assert_array_equal
 from sklearn.base import is_classifier
 from sklearn.datasets import load_diabetes, load_iris, make_classification
 
@@ -213,6 +213,189 @@ def test_works_with_unsorted_indices():
     )
 
 
+@pytest.mark.filterwarnings("ignore:The `probability` parameter:FutureWarning")
+@pytest.mark.parametrize("n_classes", [2, 3])
+@pytest.mark.parametrize("class_name", ["SVC", "NuSVC"])
+def test_predict_proba_platt_scaling(class_name, n_classes):
+    from sklearn.calibration import CalibratedClassifierCV
+    from sklearn.frozen import FrozenEstimator
+
+    import sklearnex.svm
+
+    X, y = make_classification(
+        n_samples=300, n_informative=4, n_classes=n_classes, random_state=0
+    )
+    sample_weight = np.random.default_rng(seed=0).uniform(0.5, 2.0, y.shape[0])
+    estimator = getattr(sklearnex.svm, class_name)
+    model = estimator(probability=True).fit(X, y, sample_weight=sample_weight)
+    assert hasattr(model, "_onedal_estimator")
+
+    # the calibration of the decision function of the same model, fitted once
+    reference = estimator().fit(X, y, sample_weight=sample_weight)
+    calibrated = CalibratedClassifierCV(FrozenEstimator(reference), method="sigmoid").fit(
+        X, y, sample_weight=sample_weight
+    )
+
+    proba = model.predict_proba(X)
+    assert proba.shape == (X.shape[0], n_classes)
+    assert_allclose(proba.sum(axis=1), 1.0)
+    assert_allclose(proba, calibrated.predict_proba(X), atol=1e-4)
+
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+@pytest.mark.parametrize("kernel", ["precomputed", "callable"])
+@pytest.mark.parametrize("class_name", ["SVC", "NuSVC", "SVR", "NuSVR"])
+def test_custom_kernels(class_name, kernel, n_classes):
+    import sklearn.svm
+    from sklearn.metrics.pairwise import rbf_kernel
+
+    import sklearnex.svm
+
+    if class_name in ["SVR", "NuSVR"] and n_classes == 3:
+        pytest.skip("Regressors have a single target.")
+    X, y = make_classification(
+        n_samples=200, n_informative=4, n_classes=n_classes, random_state=0
+    )
+    X_train, X_test, y_train = X[:150], X[150:], y[:150]
+
+    def kernel_function(A, B):
+        return rbf_kernel(A, B, gamma=0.1)
+
+    if kernel == "precomputed":
+        params = {"kernel": "precomputed"}
+        X_train, X_test = (
+            kernel_function(X_train, X_train),
+            kernel_function(X_test, X_train),
+        )
+    else:
+        params = {"kernel": kernel_function}
+
+    params["tol"] = 1e-6
+    model = getattr(sklearnex.svm, class_name)(**params).fit(X_train, y_train)
+    reference = getattr(sklearn.svm, class_name)(**params).fit(X_train, y_train)
+    assert hasattr(model, "_onedal_estimator")
+    assert model.support_vectors_.shape == reference.support_vectors_.shape
+
+    if class_name in ["SVR", "NuSVR"]:
+        assert_allclose(model.predict(X_test), reference.predict(X_test), atol=1e-2)
+    else:
+        assert_array_equal(model.predict(X_test), reference.predict(X_test))
+        assert_allclose(
+            model.decision_function(X_test),
+            reference.decision_function(X_test),
+            atol=1e-2,
+        )
+
+
+@pytest.mark.parametrize("kernel", ["precomputed", "callable"])
+def test_indefinite_custom_kernels(kernel):
+    import sklearn.svm
+    from sklearn.metrics.pairwise import sigmoid_kernel
+
+    import sklearnex.svm
+
+    X, y = make_classification(n_samples=200, n_informative=4, random_state=0)
+    X_train, X_test, y_train = X[:150], X[150:], y[:150]
+
+    def kernel_function(A, B):
+        return sigmoid_kernel(A, B, gamma=0.01, coef0=0.5)
+
+    if kernel == "precomputed":
+        params = {"kernel": "precomputed"}
+        X_train, X_test = (
+            kernel_function(X_train, X_train),
+            kernel_function(X_test, X_train),
+        )
+    else:
+        params = {"kernel": kernel_function}
+
+    # the Gram matrix of the sigmoid kernel has negative eigenvalues, whose
+    # problem isn't solved by its factorization, so libsvm fits it
+    model = sklearnex.svm.SVC(**params).fit(X_train, y_train)
+    reference = sklearn.svm.SVC(**params).fit(X_train, y_train)
+    assert not hasattr(model, "_onedal_estimator")
+    assert_array_equal(model.predict(X_test), reference.predict(X_test))
+    assert_allclose(model.decision_function(X_test), reference.decision_function(X_test))
+
+
+def test_custom_kernel_factored_once():
+    from sklearn.metrics.pairwise import rbf_kernel
+
+    from sklearnex.svm import SVC, KernelCache
+
+    X, y = make_classification(n_samples=200, n_informative=4, random_state=0)
+    calls = []
+
+    def kernel_function(A, B):
+        calls.append((A.shape[0], B.shape[0]))
+        return rbf_kernel(A, B, gamma=0.1)
+
+    # the Gram matrix factored by the support check is reused by the fit
+    model = SVC(kernel=kernel_function).fit(X, y)
+    assert hasattr(model, "_onedal_estimator")
+    assert calls == [(200, 200)]
+    assert not hasattr(model, "_fit_kernel_features")
+
+    # and with a cache, later fits on the same data don't evaluate it at all
+    cache = KernelCache()
+    SVC(kernel=kernel_function, kernel_cache=cache).fit(X, y)
+    calls.clear()
+    SVC(kernel=kernel_function, C=10.0, kernel_cache=cache).fit(X, y)
+    assert calls == []
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+@pytest.mark.parametrize("class_name", ["SVC", "NuSVC"])
+def test_pairwise_jobs(class_name, sparse):
+    import sklearnex.svm
+
+    X, y = make_classification(
+        n_samples=400, n_informative=6, n_classes=5, random_state=0
+    )
+    if sparse:
+        X = csr_class(X)
+    estimator = getattr(sklearnex.svm, class_name)
+    model = estimator(decision_function_shape="ovo").fit(X, y)
+    pairwise = estimator(decision_function_shape="ovo", pairwise_jobs=2).fit(X, y)
+    assert pairwise._onedal_estimator._pair_models is not None
+
+    assert_allclose(pairwise.n_support_, model.n_support_, atol=2)
+    assert pairwise.dual_coef_.shape[0] == model.dual_coef_.shape[0]
+    assert pairwise.intercept_.shape == model.intercept_.shape
+    assert_allclose(pairwise.intercept_, model.intercept_, atol=1e-2)
+    assert_allclose(pairwise.decision_function(X), model.decision_function(X), atol=1e-2)
+    assert np.mean(pairwise.predict(X) == model.predict(X)) > 0.99
+
+
+@pytest.mark.parametrize("kernel", ["rbf", "precomputed"])
+@pytest.mark.parametrize("n_classes", [2, 3])
+def test_kernel_cache(kernel, n_classes):
+    from sklearn.base import clone
+    from sklearn.metrics.pairwise import rbf_kernel
+
+    from sklearnex.svm import SVC, KernelCache
+
+    X, y = make_classification(
+        n_samples=300, n_informative=5, n_classes=n_classes, random_state=0
+    )
+    if kernel == "precomputed":
+        X = rbf_kernel(X, gamma=0.1)
+    cache = KernelCache()
+    cached = SVC(kernel=kernel, kernel_cache=cache)
+    assert clone(cached).kernel_cache is cache
+
+    for C in [0.1, 1.0, 10.0, 0.5]:
+        model = SVC(kernel=kernel, C=C).fit(X, y)
+        warm = clone(cached).set_params(C=C).fit(X, y)
+        assert hasattr(warm, "_onedal_estimator")
+        assert_allclose(warm.decision_function(X), model.decision_function(X), atol=1e-2)
+        assert np.mean(warm.predict(X) == model.predict(X)) > 0.99
+    assert len(cache._entries) > 0
+
+    cache.clear()
+    assert len(cache._entries) == 0
+
+
 @pass_if_not_implemented_for_gpu(reason="class weights are not implemented")
 @pytest.mark.parametrize(
     "queue",
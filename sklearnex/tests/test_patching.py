@@ -502,9 +502,6 @@ def test_standard_estimator_patching(caplog, dataframe, queue, dtype, estimator,
     # are covered by test_standard_estimator_patching_array_api.
     est = PATCHED_MODELS[estimator]()
 
-    if "NearestNeighbors" in estimator and "radius" in method:
-        pytest.skip(f"RadiusNeighbors estimator not implemented in sklearnex")
-
     if estimator == "TSNE" and method == "fit_transform":
         pytest.skip("TSNE.fit_transform is too slow for common testing")
     elif estimator == "IncrementalLinearRegression" and np.issubdtype(dtype, np.integer):
@@ -554,7 +551,7 @@ def test_standard_estimator_patching_array_api(
             pytest.skip(f"{estimator} does not support GPU queues")
 
     if "NearestNeighbors" in estimator and "radius" in method:
-        pytest.skip(f"RadiusNeighbors estimator not implemented in sklearnex")
+        pytest.skip("Radius neighbors outputs are ragged or sparse host arrays")
 
     if estimator == "TSNE" and method == "fit_transform":
         pytest.skip("TSNE.fit_transform is too slow for common testing")
@@ -621,9 +618,6 @@ def test_special_estimator_patching(caplog, dataframe, queue, dtype, estimator,
     # are covered by test_special_estimator_patching_array_api.
     est = SPECIAL_INSTANCES[estimator]
 
-    if "NearestNeighbors" in estimator and "radius" in method:
-        pytest.skip(f"RadiusNeighbors estimator not implemented in sklearnex")
-
     _check_estimator_patching(caplog, dataframe, queue, dtype, est, method)
 
 
@@ -649,7 +643,7 @@ def test_special_estimator_patching_array_api(
             pytest.skip("Hardware does not support fp64 SYCL testing")
 
     if "NearestNeighbors" in estimator and "radius" in method:
-        pytest.skip(f"RadiusNeighbors estimator not implemented in sklearnex")
+        pytest.skip("Radius neighbors outputs are ragged or sparse host arrays")
 
     try:
         _check_estimator_patching(caplog, dataframe, queue, dtype, est, method)
@@ -706,8 +700,10 @@ def test_standard_estimator_init_signatures(estimator):
         "ExtraTreesRegressor",
         "ExtraTreesClassifier",
     ]:
-        for kwarg in ["min_bin_size=1", "max_bins=256"]:
+        for kwarg in ["min_bin_size=1", "max_bins=256", "memory_saving_mode=False"]:
             patched_sig = patched_sig.replace(", " + kwarg, "")
+    elif estimator in ["SVC", "NuSVC"]:
+        patched_sig = patched_sig.replace(", pairwise_jobs=None, kernel_cache=None", "")
 
     assert (
         patched_sig == unpatched_sig
@@ -26,7 +26,7 @@ import onedal
 from daal4py.sklearn._utils import _package_check_version, sklearn_check_version
 from sklearnex.basic_statistics import BasicStatistics
 from sklearnex.decomposition import PCA
-from sklearnex.linear_model import Lasso, LinearRegression, LogisticRegression
+from sklearnex.linear_model import Lasso, LinearRegression, LogisticRegression, RidgeCV
 from sklearnex.manifold import TSNE
 from sklearnex.svm import SVR
 
@@ -111,7 +111,7 @@ def dense_X(request):
 @pytest.mark.allow_sklearn_fallback
 @pytest.mark.skipif(not SPARSE_DF_SUPPORTED, reason=MSG_UNSUPPORTED_SP_DF)
 @pytest.mark.parametrize(
-    "estimator", [LinearRegression] + ([PCA] if sklearn_check_version("1.8") else [])
+    "estimator", [RidgeCV] + ([PCA] if sklearn_check_version("1.8") else [])
 )
 def test_no_sparse_support_falls_back_to_sklearn(estimator, sparse_X, mocker):
     mocker.patch("onedal.datatypes._data_conversion._convert_one_to_table")